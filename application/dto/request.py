@@ -57,4 +57,21 @@ class DrawRequest(BaseModel):
 
 
 class ValidateDrawRequest(BaseModel):
-    draw_id: int
\ No newline at end of file
+    draw_id: int
+
+
+class SimulationRequest(DrawRequest):
+    iterations: int = Field(..., ge=1, le=10_000_000)
+    seed: Optional[int] = Field(None, ge=0)
+
+
+class SimulateResultsRequest(BaseModel):
+    draw_ids: List[int] = Field(..., min_length=1, max_length=100)
+    seed: Optional[int] = Field(None, ge=0)
+    persist: bool = False
+
+
+class LeaguePhaseRequest(BaseModel):
+    draw_id: int
+    runs: int = Field(1000, ge=1)
+    seed: Optional[int] = Field(None, ge=0)
@@ -48,6 +48,107 @@ class DrawResponse(BaseModel):
         orm_mode = True
 
 
+class CompactDrawResponse(BaseModel):
+    """Compact draw format: teams once, fixtures as [home_idx, away_idx, matchday]"""
+    id: Optional[int]
+    competition: str
+    season: str
+    teams: List[TeamResponse]
+    fixtures: List[List[Optional[int]]]
+    total_fixtures: int
+    created_at: datetime
+    is_valid: bool
+    validation_errors: List[str] = []
+
+
+class DrawSummaryResponse(BaseModel):
+    id: int
+    competition: str
+    season: str
+    is_valid: bool
+    created_at: Optional[datetime] = None
+    fixture_count: int
+
+
+class DrawSummaryPageResponse(BaseModel):
+    items: List[DrawSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class PairMeetingsResponse(BaseModel):
+    team_id: int
+    opponent_id: int
+    meetings: int
+    probability: float
+
+
+class SimulationJobResponse(BaseModel):
+    id: str
+    status: str
+    competition: str
+    season: str
+    iterations: int
+    completed: int
+    succeeded: int
+    failed: int
+    valid: int
+    progress: float
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    pair_meetings: Optional[List[PairMeetingsResponse]] = None
+
+
+class FixtureResultResponse(BaseModel):
+    home_team_id: int
+    away_team_id: int
+    matchday: Optional[int] = None
+    status: str
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+
+
+class StandingResponse(BaseModel):
+    position: int
+    team_id: int
+    team_name: str
+    played: int
+    won: int
+    drawn: int
+    lost: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    points: int
+
+
+class DrawResultsResponse(BaseModel):
+    draw_id: int
+    competition: str
+    season: str
+    fixtures: List[FixtureResultResponse]
+    standings: List[StandingResponse]
+
+
+class TeamOutcomeResponse(BaseModel):
+    team_id: int
+    team_name: str
+    mean_points: float
+    mean_goal_difference: float
+    top8_probability: float
+    playoff_probability: float
+    elimination_probability: float
+    position_probabilities: List[float]
+
+
+class LeaguePhaseOutcomeResponse(BaseModel):
+    """Standings distribution, teams ordered by mean points"""
+    draw_id: int
+    runs: int
+    seed: int
+    teams: List[TeamOutcomeResponse]
+
+
 class ValidationResponse(BaseModel):
     is_valid: bool
     errors: List[str]
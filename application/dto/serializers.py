@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from domain.entities import Draw, Team
+
+
+class DrawSerializer:
+    """Serializer that builds DrawResponse-shaped payloads without model validation"""
+
+    def to_dict(self, draw: Draw) -> Dict[str, Any]:
+        """Convert a draw to a plain dict matching the DrawResponse schema"""
+
+        # Index teams and their result rows by id once
+        teams_by_id = {team.id: team for team in draw.teams}
+        rows: Dict[int, Dict[str, Any]] = {}
+        results: List[Dict[str, Any]] = []
+
+        for team in draw.teams:
+            row = {
+                "team": self._team_entry(team),
+                "fixtures": [],
+                "home_games_count": 0,
+                "away_games_count": 0
+            }
+            rows[team.id] = row
+            results.append(row)
+
+        # Single pass over fixtures, filling both sides of each match
+        for fixture in draw.fixtures:
+            home = teams_by_id.get(fixture.home_team_id)
+            away = teams_by_id.get(fixture.away_team_id)
+
+            if home is not None:
+                home_row = rows[home.id]
+                home_row["home_games_count"] += 1
+                if away is not None:
+                    home_row["fixtures"].append(
+                        self._fixture_entry(away, True, fixture.matchday, fixture.scheduled_date)
+                    )
+
+            if away is not None:
+                away_row = rows[away.id]
+                away_row["away_games_count"] += 1
+                if home is not None:
+                    away_row["fixtures"].append(
+                        self._fixture_entry(home, False, fixture.matchday, fixture.scheduled_date)
+                    )
+
+        return {
+            "id": draw.id,
+            "competition": draw.competition,
+            "season": draw.season,
+            "results": results,
+            "total_fixtures": len(draw.fixtures),
+            "created_at": draw.created_at or datetime.utcnow(),
+            "is_valid": draw.is_valid,
+            "validation_errors": list(draw.validation_errors)
+        }
+
+    def to_compact_dict(self, draw: Draw) -> Dict[str, Any]:
+        """Convert a draw to the compact CompactDrawResponse shape"""
+
+        # Teams are listed once, fixtures reference them by list index
+        index_by_id = {team.id: index for index, team in enumerate(draw.teams)}
+
+        fixtures = [
+            [index_by_id[f.home_team_id], index_by_id[f.away_team_id], f.matchday]
+            for f in draw.fixtures
+            if f.home_team_id in index_by_id and f.away_team_id in index_by_id
+        ]
+
+        return {
+            "id": draw.id,
+            "competition": draw.competition,
+            "season": draw.season,
+            "teams": [self._team_entry(team) for team in draw.teams],
+            "fixtures": fixtures,
+            "total_fixtures": len(draw.fixtures),
+            "created_at": draw.created_at or datetime.utcnow(),
+            "is_valid": draw.is_valid,
+            "validation_errors": list(draw.validation_errors)
+        }
+
+    @staticmethod
+    def _team_entry(team: Team) -> Dict[str, Any]:
+        """Build a single TeamResponse-shaped entry"""
+        return {
+            "id": team.id,
+            "name": team.name,
+            "country": team.country,
+            "pot": team.pot,
+            "coefficient": team.coefficient,
+            "logo_url": team.logo_url
+        }
+
+    @staticmethod
+    def _fixture_entry(opponent: Team, is_home: bool, matchday, scheduled_date) -> Dict[str, Any]:
+        """Build a single FixtureResponse-shaped entry"""
+        return {
+            "opponent_id": opponent.id,
+            "opponent_name": opponent.name,
+            "opponent_country": opponent.country,
+            "is_home": is_home,
+            "matchday": matchday,
+            "scheduled_date": scheduled_date
+        }
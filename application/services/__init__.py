@@ -1,5 +1,6 @@
 from .draw_service import DrawServiceImpl
 from .team_service import TeamServiceImpl
 from .validation_service import ValidationServiceImpl
+from .result_simulation import PoissonResultSimulator
 
-__all__ = ['DrawServiceImpl', 'TeamServiceImpl', 'ValidationServiceImpl']
\ No newline at end of file
+__all__ = ['DrawServiceImpl', 'TeamServiceImpl', 'ValidationServiceImpl', 'PoissonResultSimulator']
\ No newline at end of file
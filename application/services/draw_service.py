@@ -1,11 +1,15 @@
 # Draw business logic
 
+import asyncio
 import random
-from typing import List, Dict, Set, Tuple
+import time
+from typing import List, Dict, Optional, Set, Tuple
 from domain.entities import Team, Draw, Fixture
 from domain.value_objects import CompetitionType
 from domain.interfaces.services import DrawService, ValidationService
 from domain.interfaces.repositories import DrawRepository, TeamRepository, FixtureRepository
+from core.metrics import draw_solve_duration, draw_solve_attempts, draw_validation_duration
+from core.profiling import call_profiled
 
 
 class DrawServiceImpl(DrawService):
@@ -13,10 +17,10 @@ class DrawServiceImpl(DrawService):
 
     def __init__(
             self,
-            draw_repository: DrawRepository,
-            team_repository: TeamRepository,
-            fixture_repository: FixtureRepository,
-            validation_service: ValidationService
+            draw_repository: Optional[DrawRepository] = None,
+            team_repository: Optional[TeamRepository] = None,
+            fixture_repository: Optional[FixtureRepository] = None,
+            validation_service: Optional[ValidationService] = None
     ):
         self.draw_repository = draw_repository
         self.team_repository = team_repository
@@ -27,6 +31,44 @@ class DrawServiceImpl(DrawService):
             self, teams: List[Team], competition: CompetitionType, season: str
     ) -> Draw:
         """Perform the draw according to UEFA rules"""
+        draw = await self.generate_draw(teams, competition, season)
+
+        # Save to repository
+        saved_draw = await self.draw_repository.save(draw)
+
+        return saved_draw
+
+    async def generate_draw(
+            self, teams: List[Team], competition: CompetitionType, season: str
+    ) -> Draw:
+        """Draw fixtures and validate them without saving"""
+        start = time.perf_counter()
+        try:
+            # CPU-bound, solved in a thread so the event loop keeps serving other requests
+            draw = await asyncio.to_thread(call_profiled, self._solve, teams, competition, season)
+        except Exception:
+            draw_solve_attempts.labels("failure").inc()
+            raise
+        finally:
+            draw_solve_duration.observe(time.perf_counter() - start)
+        draw_solve_attempts.labels("success").inc()
+
+        # Validate the draw
+        await self.validate_draw(draw)
+
+        return draw
+
+    async def validate_draw(self, draw: Draw) -> Tuple[bool, List[str]]:
+        """Validate a draw according to UEFA rules"""
+        start = time.perf_counter()
+        is_valid = draw.validate()
+        draw_validation_duration.observe(time.perf_counter() - start)
+        return is_valid, draw.validation_errors
+
+    def _solve(
+            self, teams: List[Team], competition: CompetitionType, season: str
+    ) -> Draw:
+        """Draw fixtures for all teams"""
 
         # Initialize draw
         draw = Draw(
@@ -49,7 +91,7 @@ class DrawServiceImpl(DrawService):
             random.shuffle(pot_teams)
 
             for team in pot_teams:
-                await self._draw_opponents_for_team(
+                self._draw_opponents_for_team(
                     team, pots, team_fixtures, team_opponents, teams
                 )
 
@@ -66,18 +108,7 @@ class DrawServiceImpl(DrawService):
 
         draw.fixtures = all_fixtures
 
-        # Validate the draw
-        draw.validate()
-
-        # Save to repository
-        saved_draw = await self.draw_repository.save(draw)
-
-        return saved_draw
-
-    async def validate_draw(self, draw: Draw) -> Tuple[bool, List[str]]:
-        """Validate a draw according to UEFA rules"""
-        is_valid = draw.validate()
-        return is_valid, draw.validation_errors
+        return draw
 
     def _organize_by_pot(self, teams: List[Team]) -> Dict[int, List[Team]]:
         """Organize teams by their pot number"""
@@ -86,7 +117,7 @@ class DrawServiceImpl(DrawService):
             pots[team.pot].append(team)
         return pots
 
-    async def _draw_opponents_for_team(
+    def _draw_opponents_for_team(
             self,
             team: Team,
             pots: Dict[int, List[Team]],
@@ -0,0 +1,209 @@
+# Simulated match results from team coefficients
+import math
+import random
+from bisect import bisect
+from typing import Dict, List, Optional, Sequence, Tuple
+from domain.entities import Draw, Standing, TeamOutcome, LeaguePhaseOutcome
+from domain.entities.fixture import FixtureStatus
+from domain.interfaces.services import ResultSimulationService
+
+# Expected goals per side when equal teams meet on neutral ground
+BASE_GOALS = 1.35
+# Multiplier on the home side's expected goals
+HOME_ADVANTAGE = 1.2
+# Elasticity of the goal rate to the ratio of the two coefficients
+STRENGTH_EXPONENT = 0.35
+# Floor for coefficients so unranked teams still get a finite strength
+MIN_COEFFICIENT = 1.0
+# Scores are capped here, P(goals > 10) is negligible at these rates
+MAX_GOALS = 10
+
+
+def expected_goals(home_coefficient: float, away_coefficient: float) -> Tuple[float, float]:
+    """Poisson rates of the home and away side"""
+    ratio = (
+        max(home_coefficient, MIN_COEFFICIENT) / max(away_coefficient, MIN_COEFFICIENT)
+    ) ** (STRENGTH_EXPONENT / 2)
+    return BASE_GOALS * HOME_ADVANTAGE * ratio, BASE_GOALS / ratio
+
+
+def goal_cdf(rate: float) -> List[float]:
+    """Cumulative Poisson probabilities of 0..MAX_GOALS - 1 goals
+
+    bisect(cdf, u) for a uniform u is then a goal count, MAX_GOALS for the tail.
+    """
+    probability = math.exp(-rate)
+    total = probability
+    cdf = [total]
+    for goals in range(1, MAX_GOALS):
+        probability *= rate / goals
+        total += probability
+        cdf.append(total)
+    return cdf
+
+
+class _CompiledDraw:
+    """Team indexes and goal distributions of a draw's fixtures, built once per draw"""
+
+    def __init__(self, draw: Draw):
+        self.team_ids = [team.id for team in draw.teams]
+        self.coefficients = [team.coefficient for team in draw.teams]
+        index_by_id = {team_id: index for index, team_id in enumerate(self.team_ids)}
+
+        self.fixtures = [
+            fixture for fixture in draw.fixtures
+            if fixture.home_team_id in index_by_id and fixture.away_team_id in index_by_id
+        ]
+        self.home_indexes = [index_by_id[f.home_team_id] for f in self.fixtures]
+        self.away_indexes = [index_by_id[f.away_team_id] for f in self.fixtures]
+
+        # Fixtures of the same pairing share their tables
+        tables: Dict[Tuple[int, int], Tuple[List[float], List[float]]] = {}
+        self.home_cdfs: List[List[float]] = []
+        self.away_cdfs: List[List[float]] = []
+        for home, away in zip(self.home_indexes, self.away_indexes):
+            pair = tables.get((home, away))
+            if pair is None:
+                home_rate, away_rate = expected_goals(self.coefficients[home], self.coefficients[away])
+                pair = tables[(home, away)] = (goal_cdf(home_rate), goal_cdf(away_rate))
+            self.home_cdfs.append(pair[0])
+            self.away_cdfs.append(pair[1])
+
+    def sample(self, rng: random.Random) -> Tuple[List[int], List[int]]:
+        """Home and away goals of every fixture for one run"""
+        uniform = rng.random
+        home_goals = [bisect(cdf, uniform()) for cdf in self.home_cdfs]
+        away_goals = [bisect(cdf, uniform()) for cdf in self.away_cdfs]
+        return home_goals, away_goals
+
+    def ranking(
+            self, home_goals: Sequence[int], away_goals: Sequence[int]
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """Team indexes in league order, with points and goal difference per team index"""
+        size = len(self.team_ids)
+        points = [0] * size
+        goals_for = [0] * size
+        goals_against = [0] * size
+        away_goals_for = [0] * size
+        wins = [0] * size
+
+        for home, away, scored, conceded in zip(self.home_indexes, self.away_indexes, home_goals, away_goals):
+            goals_for[home] += scored
+            goals_against[home] += conceded
+            goals_for[away] += conceded
+            goals_against[away] += scored
+            away_goals_for[away] += conceded
+            if scored > conceded:
+                points[home] += 3
+                wins[home] += 1
+            elif scored < conceded:
+                points[away] += 3
+                wins[away] += 1
+            else:
+                points[home] += 1
+                points[away] += 1
+
+        goal_difference = [scored - conceded for scored, conceded in zip(goals_for, goals_against)]
+        order = sorted(
+            range(size),
+            key=lambda i: (
+                points[i], goal_difference[i], goals_for[i], away_goals_for[i], wins[i],
+                self.coefficients[i]
+            ),
+            reverse=True
+        )
+        return order, points, goal_difference
+
+
+class PoissonResultSimulator(ResultSimulationService):
+    """Independent Poisson goals per side, rates from the coefficient ratio and home advantage
+
+    League order uses points, goal difference, goals scored, away goals scored, wins
+    and finally the club coefficient.
+    """
+
+    def simulate_results(self, draws: List[Draw], seed: Optional[int] = None) -> List[Draw]:
+        """Fill scores of every fixture of the draws and mark them completed"""
+        rng = random.Random(seed)
+        for draw in draws:
+            compiled = _CompiledDraw(draw)
+            home_goals, away_goals = compiled.sample(rng)
+            for fixture, scored, conceded in zip(compiled.fixtures, home_goals, away_goals):
+                fixture.home_score = scored
+                fixture.away_score = conceded
+                fixture.status = FixtureStatus.COMPLETED
+        return draws
+
+    def standings(self, draw: Draw) -> List[Standing]:
+        """League table of the draw's completed fixtures"""
+        rows = {team.id: Standing(team_id=team.id) for team in draw.teams}
+        coefficients = {team.id: team.coefficient for team in draw.teams}
+
+        for fixture in draw.fixtures:
+            home = rows.get(fixture.home_team_id)
+            away = rows.get(fixture.away_team_id)
+            if home is None or away is None or fixture.home_score is None or fixture.away_score is None:
+                continue
+            for row, scored, conceded in (
+                    (home, fixture.home_score, fixture.away_score),
+                    (away, fixture.away_score, fixture.home_score)
+            ):
+                row.played += 1
+                row.goals_for += scored
+                row.goals_against += conceded
+                if scored > conceded:
+                    row.won += 1
+                    row.points += 3
+                elif scored == conceded:
+                    row.drawn += 1
+                    row.points += 1
+                else:
+                    row.lost += 1
+            away.away_goals_for += fixture.away_score
+
+        return sorted(
+            rows.values(),
+            key=lambda row: (
+                row.points, row.goal_difference, row.goals_for, row.away_goals_for, row.won,
+                coefficients[row.team_id]
+            ),
+            reverse=True
+        )
+
+    def simulate_league_phase(
+            self, draw: Draw, runs: int, seed: Optional[int] = None
+    ) -> LeaguePhaseOutcome:
+        """Play the league phase `runs` times and count where each team finishes"""
+        if seed is None:
+            seed = random.getrandbits(32)
+        rng = random.Random(seed)
+        compiled = _CompiledDraw(draw)
+        size = len(compiled.team_ids)
+
+        total_points = [0] * size
+        total_goal_difference = [0] * size
+        position_counts = [[0] * size for _ in range(size)]
+
+        for _ in range(runs):
+            order, points, goal_difference = compiled.ranking(*compiled.sample(rng))
+            for position, index in enumerate(order):
+                position_counts[index][position] += 1
+            for index in range(size):
+                total_points[index] += points[index]
+                total_goal_difference[index] += goal_difference[index]
+
+        return LeaguePhaseOutcome(
+            draw_id=draw.id,
+            runs=runs,
+            seed=seed,
+            teams=[
+                TeamOutcome(
+                    team_id=team_id,
+                    runs=runs,
+                    total_points=total_points[index],
+                    total_goal_difference=total_goal_difference[index],
+                    position_counts=position_counts[index]
+                )
+                for index, team_id in enumerate(compiled.team_ids)
+            ]
+        )
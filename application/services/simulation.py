@@ -0,0 +1,62 @@
+# Monte Carlo draw simulation, run in worker processes
+import asyncio
+import random
+from typing import Any, Dict, List
+from domain.entities import Team
+from domain.value_objects import CompetitionType
+from application.services.draw_service import DrawServiceImpl
+
+
+def run_simulation_chunk(
+        competition: str,
+        season: str,
+        teams: List[Dict[str, Any]],
+        iterations: int,
+        seed: int
+) -> Dict[str, Any]:
+    """Perform `iterations` draws with the standard rules and count their outcomes
+
+    Top-level and picklable so it can run in a process pool. Draws that cannot be
+    completed count as failed, the rest are checked with Draw.validate.
+    """
+    return asyncio.run(_simulate(competition, season, teams, iterations, seed))
+
+
+async def _simulate(
+        competition: str,
+        season: str,
+        teams: List[Dict[str, Any]],
+        iterations: int,
+        seed: int
+) -> Dict[str, Any]:
+    random.seed(seed)
+    service = DrawServiceImpl()
+    competition_type = CompetitionType(competition)
+    team_entities = [Team(**team) for team in teams]
+
+    succeeded = failed = valid = 0
+    pair_counts: Dict[str, int] = {}
+
+    for _ in range(iterations):
+        try:
+            draw = await service.generate_draw(team_entities, competition_type, season)
+        except ValueError:
+            # The greedy draw ran out of valid opponents
+            failed += 1
+            continue
+
+        succeeded += 1
+        if draw.is_valid:
+            valid += 1
+        for fixture in draw.fixtures:
+            low, high = sorted((fixture.home_team_id, fixture.away_team_id))
+            pair = f"{low}-{high}"
+            pair_counts[pair] = pair_counts.get(pair, 0) + 1
+
+    return {
+        "iterations": iterations,
+        "succeeded": succeeded,
+        "failed": failed,
+        "valid": valid,
+        "pair_counts": pair_counts
+    }
@@ -1,6 +1,6 @@
 # Team business logic
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from domain.entities import Team
 from domain.value_objects import CompetitionType
 from domain.interfaces.services import TeamService
@@ -14,10 +14,10 @@ class TeamServiceImpl(TeamService):
         self.team_repository = team_repository
 
     async def get_teams_by_competition(
-            self, competition: CompetitionType
+            self, competition: CompetitionType, season: Optional[str] = None
     ) -> List[Team]:
-        """Get all teams for a specific competition"""
-        return await self.team_repository.get_by_competition(competition)
+        """Get all teams for a specific competition, latest season by default"""
+        return await self.team_repository.get_by_competition(competition, season)
 
     async def organize_teams_by_pot(
             self, teams: List[Team]
@@ -1,5 +1,14 @@
 from .perform_draw import PerformDrawUseCase
 from .validate_draw import ValidateDrawUseCase
 from .get_teams import GetTeamsUseCase
+from .get_draw import GetDrawUseCase
+from .list_draws import ListDrawsUseCase
+from .simulation_jobs import SubmitSimulationUseCase, GetSimulationJobUseCase
+from .match_results import SimulateResultsUseCase, SimulateLeaguePhaseUseCase
+from .idempotent_request import IdempotentRequestUseCase
 
-__all__ = ['PerformDrawUseCase', 'ValidateDrawUseCase', 'GetTeamsUseCase']
\ No newline at end of file
+__all__ = [
+    'PerformDrawUseCase', 'ValidateDrawUseCase', 'GetTeamsUseCase', 'GetDrawUseCase',
+    'ListDrawsUseCase', 'SubmitSimulationUseCase', 'GetSimulationJobUseCase',
+    'SimulateResultsUseCase', 'SimulateLeaguePhaseUseCase', 'IdempotentRequestUseCase'
+]
\ No newline at end of file
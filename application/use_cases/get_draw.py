@@ -0,0 +1,34 @@
+from typing import Any, Dict
+from domain.value_objects import CompetitionType
+from domain.interfaces.repositories import DrawRepository
+from application.dto.serializers import DrawSerializer
+from core.exceptions import ResourceNotFoundException
+
+
+class GetDrawUseCase:
+    """Use case for reading stored draws"""
+
+    def __init__(self, draw_repository: DrawRepository):
+        self.draw_repository = draw_repository
+        self.serializer = DrawSerializer()
+
+    async def execute(self, draw_id: int, compact: bool = False) -> Dict[str, Any]:
+        """Execute the get draw use case and return a response payload"""
+
+        draw = await self.draw_repository.get_by_id(draw_id)
+        if not draw:
+            raise ResourceNotFoundException("Draw", draw_id)
+
+        if compact:
+            return self.serializer.to_compact_dict(draw)
+        return self.serializer.to_dict(draw)
+
+    async def get_latest_id(self, competition: str) -> int:
+        """Resolve the id of the latest draw for a competition"""
+
+        competition_type = CompetitionType(competition)
+        draw_id = await self.draw_repository.get_latest_id(competition_type)
+        if draw_id is None:
+            raise ResourceNotFoundException("Latest draw", competition)
+
+        return draw_id
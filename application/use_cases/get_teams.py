@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from domain.value_objects import CompetitionType
 from domain.interfaces.services import TeamService
 from application.dto.response import TeamResponse
@@ -10,11 +10,11 @@ class GetTeamsUseCase:
     def __init__(self, team_service: TeamService):
         self.team_service = team_service
 
-    async def execute(self, competition: str) -> List[TeamResponse]:
+    async def execute(self, competition: str, season: Optional[str] = None) -> List[TeamResponse]:
         """Execute the get teams use case"""
 
         competition_type = CompetitionType(competition)
-        teams = await self.team_service.get_teams_by_competition(competition_type)
+        teams = await self.team_service.get_teams_by_competition(competition_type, season)
 
         return [
             TeamResponse(
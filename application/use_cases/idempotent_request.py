@@ -0,0 +1,86 @@
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from domain.entities import StoredResponse
+from domain.interfaces.repositories import IdempotencyRepository
+from core.exceptions import ConflictException
+
+# Seconds between deletes of expired keys, per process
+PURGE_INTERVAL = 300
+
+# Per-key locks of requests running in this process: [lock, holders and waiters]
+_key_locks: Dict[str, List] = {}
+_next_purge = 0.0
+
+
+@asynccontextmanager
+async def _key_lock(key: str) -> AsyncIterator[None]:
+    entry = _key_locks.get(key)
+    if entry is None:
+        entry = _key_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _key_locks[key]
+
+
+class IdempotentRequestUseCase:
+    """Use case for running a request once per Idempotency-Key and replaying its response"""
+
+    def __init__(self, repository: IdempotencyRepository, ttl: int):
+        self.repository = repository
+        self.ttl = ttl
+
+    @staticmethod
+    def fingerprint(*parts: str) -> str:
+        """Hash the request parts that must match for a key to be replayed"""
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+    async def lookup(self, key: str) -> Optional[StoredResponse]:
+        """Stored response of a key, None if it has not completed"""
+        return await self.repository.get(key)
+
+    async def run_once(
+            self, key: str, produce: Callable[[], Awaitable[StoredResponse]]
+    ) -> Tuple[StoredResponse, bool]:
+        """Produce the response once per key; later and concurrent duplicates get the stored bytes
+
+        The key is stored in the request's unit of work, together with what `produce`
+        stored, and committed before the response is returned: a failed commit stores
+        nothing. Completed keys are replayed before waiting on anything, duplicates in
+        this process wait for the first request without running `produce`. When another
+        process stored the key first, this request's writes are rolled back and its
+        response is replayed. Returns the response and whether it was replayed.
+        """
+        global _next_purge
+
+        stored = await self.repository.get(key)
+        if stored is not None:
+            return stored, True
+
+        async with _key_lock(key):
+            stored = await self.repository.get(key)
+            if stored is not None:
+                return stored, True
+
+            response = await produce()
+            try:
+                if time.monotonic() >= _next_purge:
+                    _next_purge = time.monotonic() + PURGE_INTERVAL
+                    await self.repository.purge_expired()
+                await self.repository.add(key, response, self.ttl)
+                await self.repository.commit()
+            except ConflictException:
+                await self.repository.rollback()
+                stored = await self.repository.get(key)
+                if stored is None:
+                    raise
+                return stored, True
+
+        return response, False
@@ -0,0 +1,67 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from domain.entities import DrawSummary
+from domain.value_objects import CompetitionType
+from domain.interfaces.repositories import DrawRepository
+from application.dto.response import DrawSummaryResponse, DrawSummaryPageResponse
+
+
+def encode_cursor(summary: DrawSummary) -> str:
+    """Encode the (created_at, id) keyset of a row as an opaque cursor"""
+    created_at = summary.created_at.isoformat() if summary.created_at else ""
+    raw = f"{created_at}|{summary.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor back into its (created_at, id) keyset"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, draw_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return (
+            datetime.fromisoformat(created_at) if created_at else datetime.min,
+            int(draw_id)
+        )
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+class ListDrawsUseCase:
+    """Use case for browsing stored draws"""
+
+    def __init__(self, draw_repository: DrawRepository):
+        self.draw_repository = draw_repository
+
+    async def execute(
+            self,
+            competition: Optional[str] = None,
+            season: Optional[str] = None,
+            after: Optional[str] = None,
+            limit: int = 50
+    ) -> DrawSummaryPageResponse:
+        """Execute the list draws use case"""
+
+        competition_type = CompetitionType(competition) if competition else None
+        keyset = decode_cursor(after) if after else None
+
+        # Fetch one extra row to know whether another page exists
+        summaries = await self.draw_repository.list_summaries(
+            competition_type, season, keyset, limit + 1
+        )
+        page = summaries[:limit]
+
+        return DrawSummaryPageResponse(
+            items=[
+                DrawSummaryResponse(
+                    id=summary.id,
+                    competition=summary.competition,
+                    season=summary.season,
+                    is_valid=summary.is_valid,
+                    created_at=summary.created_at,
+                    fixture_count=summary.fixture_count
+                )
+                for summary in page
+            ],
+            next_cursor=encode_cursor(page[-1]) if len(summaries) > limit else None
+        )
@@ -0,0 +1,141 @@
+import asyncio
+from typing import List
+from domain.entities import Draw, LeaguePhaseOutcome
+from domain.interfaces.repositories import DrawRepository
+from domain.interfaces.services import ResultSimulationService
+from application.dto.request import SimulateResultsRequest, LeaguePhaseRequest
+from application.dto.response import (
+    DrawResultsResponse, FixtureResultResponse, StandingResponse,
+    LeaguePhaseOutcomeResponse, TeamOutcomeResponse
+)
+from core.exceptions import BusinessRuleException, ResourceNotFoundException
+
+# League phase: top 8 go to the round of 16, 9th to 24th to the knockout play-offs
+DIRECT_QUALIFICATION_POSITIONS = 8
+PLAYOFF_POSITIONS = 24
+
+
+class SimulateResultsUseCase:
+    """Use case for simulating, storing and reading match results of stored draws"""
+
+    def __init__(self, draw_repository: DrawRepository, simulator: ResultSimulationService):
+        self.draw_repository = draw_repository
+        self.simulator = simulator
+
+    async def execute(self, request: SimulateResultsRequest) -> List[DrawResultsResponse]:
+        """Score every fixture of the requested draws, storing the results if asked"""
+
+        draws = []
+        for draw_id in dict.fromkeys(request.draw_ids):
+            draw = await self.draw_repository.get_by_id(draw_id)
+            if draw is None:
+                raise ResourceNotFoundException("Draw", draw_id)
+            draws.append(draw)
+
+        draws = await asyncio.to_thread(self.simulator.simulate_results, draws, request.seed)
+
+        if request.persist:
+            await self.draw_repository.save_results(draws)
+
+        return [self._to_response(draw) for draw in draws]
+
+    async def get(self, draw_id: int) -> DrawResultsResponse:
+        """Stored results of a draw, fixtures not played yet have no score"""
+
+        draw = await self.draw_repository.get_by_id(draw_id)
+        if draw is None:
+            raise ResourceNotFoundException("Draw", draw_id)
+
+        return self._to_response(draw)
+
+    def _to_response(self, draw: Draw) -> DrawResultsResponse:
+        names = {team.id: team.name for team in draw.teams}
+        return DrawResultsResponse(
+            draw_id=draw.id,
+            competition=draw.competition,
+            season=draw.season,
+            fixtures=[
+                FixtureResultResponse(
+                    home_team_id=fixture.home_team_id,
+                    away_team_id=fixture.away_team_id,
+                    matchday=fixture.matchday,
+                    status=fixture.status.value if hasattr(fixture.status, 'value') else fixture.status,
+                    home_score=fixture.home_score,
+                    away_score=fixture.away_score
+                )
+                for fixture in draw.fixtures
+            ],
+            standings=[
+                StandingResponse(
+                    position=position,
+                    team_id=row.team_id,
+                    team_name=names[row.team_id],
+                    played=row.played,
+                    won=row.won,
+                    drawn=row.drawn,
+                    lost=row.lost,
+                    goals_for=row.goals_for,
+                    goals_against=row.goals_against,
+                    goal_difference=row.goal_difference,
+                    points=row.points
+                )
+                for position, row in enumerate(self.simulator.standings(draw), start=1)
+            ]
+        )
+
+
+class SimulateLeaguePhaseUseCase:
+    """Use case for the distribution of league phase standings of a stored draw"""
+
+    def __init__(
+            self,
+            draw_repository: DrawRepository,
+            simulator: ResultSimulationService,
+            max_runs: int
+    ):
+        self.draw_repository = draw_repository
+        self.simulator = simulator
+        self.max_runs = max_runs
+
+    async def execute(self, request: LeaguePhaseRequest) -> LeaguePhaseOutcomeResponse:
+        """Execute the league phase simulation use case"""
+
+        if request.runs > self.max_runs:
+            raise BusinessRuleException(f"At most {self.max_runs} runs per request")
+
+        # Teams and fixture pairings are all the simulation needs
+        draw = await self.draw_repository.get_lightweight(request.draw_id)
+        if draw is None:
+            raise ResourceNotFoundException("Draw", request.draw_id)
+
+        # CPU-bound, keep it off the event loop
+        outcome = await asyncio.to_thread(
+            self.simulator.simulate_league_phase, draw, request.runs, request.seed
+        )
+        return self._to_response(draw, outcome)
+
+    @staticmethod
+    def _to_response(draw: Draw, outcome: LeaguePhaseOutcome) -> LeaguePhaseOutcomeResponse:
+        names = {team.id: team.name for team in draw.teams}
+        teams = sorted(outcome.teams, key=lambda team: team.mean_points, reverse=True)
+        size = len(teams)
+        return LeaguePhaseOutcomeResponse(
+            draw_id=outcome.draw_id,
+            runs=outcome.runs,
+            seed=outcome.seed,
+            teams=[
+                TeamOutcomeResponse(
+                    team_id=team.team_id,
+                    team_name=names[team.team_id],
+                    mean_points=team.mean_points,
+                    mean_goal_difference=team.mean_goal_difference,
+                    top8_probability=team.probability_between(1, DIRECT_QUALIFICATION_POSITIONS),
+                    playoff_probability=team.probability_between(
+                        DIRECT_QUALIFICATION_POSITIONS + 1, PLAYOFF_POSITIONS
+                    ),
+                    elimination_probability=team.probability_between(PLAYOFF_POSITIONS + 1, size),
+                    position_probabilities=[count / outcome.runs for count in team.position_counts]
+                )
+                for team in teams
+            ]
+        )
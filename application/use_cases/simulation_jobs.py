@@ -0,0 +1,98 @@
+import random
+import uuid
+from domain.entities import SimulationJob, Team
+from domain.interfaces.services import SimulationJobService
+from application.dto.request import SimulationRequest
+from application.dto.response import PairMeetingsResponse, SimulationJobResponse
+from core.exceptions import ResourceNotFoundException
+
+
+def to_job_response(job: SimulationJob, include_pairs: bool = True) -> SimulationJobResponse:
+    """Convert a job to its response, pair meetings are relative to successful draws"""
+    pair_meetings = None
+    if include_pairs:
+        pair_meetings = []
+        for pair, meetings in sorted(job.pair_counts.items(), key=lambda item: -item[1]):
+            team_id, opponent_id = (int(part) for part in pair.split("-"))
+            pair_meetings.append(PairMeetingsResponse(
+                team_id=team_id,
+                opponent_id=opponent_id,
+                meetings=meetings,
+                probability=meetings / job.succeeded if job.succeeded else 0.0
+            ))
+
+    return SimulationJobResponse(
+        id=job.id,
+        status=job.status.value,
+        competition=job.competition,
+        season=job.season,
+        iterations=job.iterations,
+        completed=job.completed,
+        succeeded=job.succeeded,
+        failed=job.failed,
+        valid=job.valid,
+        progress=job.completed / job.iterations,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        pair_meetings=pair_meetings
+    )
+
+
+class SubmitSimulationUseCase:
+    """Use case for starting a background simulation job"""
+
+    def __init__(self, job_service: SimulationJobService, chunk_size: int):
+        self.job_service = job_service
+        self.chunk_size = chunk_size
+
+    async def execute(self, request: SimulationRequest) -> SimulationJobResponse:
+        """Execute the submit simulation use case"""
+
+        job = SimulationJob(
+            id=uuid.uuid4().hex,
+            competition=request.competition,
+            season=request.season,
+            teams=[
+                Team(
+                    id=team_req.id,
+                    name=team_req.name,
+                    country=team_req.country,
+                    pot=team_req.pot,
+                    coefficient=team_req.coefficient,
+                    logo_url=team_req.logo_url
+                )
+                for team_req in request.teams
+            ],
+            iterations=request.iterations,
+            chunk_size=self.chunk_size,
+            seed=request.seed if request.seed is not None else random.getrandbits(32)
+        )
+
+        job = await self.job_service.submit(job)
+        return to_job_response(job, include_pairs=False)
+
+
+class GetSimulationJobUseCase:
+    """Use case for reading simulation job progress and results"""
+
+    def __init__(self, job_service: SimulationJobService):
+        self.job_service = job_service
+
+    async def execute(self, job_id: str) -> SimulationJobResponse:
+        """Execute the get simulation job use case"""
+
+        job = await self.job_service.get(job_id)
+        if job is None:
+            raise ResourceNotFoundException("Simulation job", job_id)
+
+        return to_job_response(job)
+
+    async def watch(self, job_id: str):
+        """Yield progress responses until the job finishes"""
+
+        if await self.job_service.get(job_id) is None:
+            raise ResourceNotFoundException("Simulation job", job_id)
+
+        async for job in self.job_service.watch(job_id):
+            yield to_job_response(job, include_pairs=job.is_finished)
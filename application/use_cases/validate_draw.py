@@ -1,3 +1,5 @@
+from typing import Optional
+from domain.interfaces.cache import Cache, VALIDATION_NAMESPACE
 from domain.interfaces.repositories import DrawRepository
 from domain.interfaces.services import DrawService
 from application.dto.response import ValidationResponse
@@ -9,16 +11,31 @@ class ValidateDrawUseCase:
     def __init__(
             self,
             draw_repository: DrawRepository,
-            draw_service: DrawService
+            draw_service: DrawService,
+            cache: Optional[Cache] = None
     ):
         self.draw_repository = draw_repository
         self.draw_service = draw_service
+        self.cache = cache
 
     async def execute(self, draw_id: int) -> ValidationResponse:
         """Execute the validation use case"""
 
-        # Get the draw from repository
-        draw = await self.draw_repository.get_by_id(draw_id)
+        if self.cache is None:
+            return await self._validate(draw_id)
+
+        async def load() -> bytes:
+            return (await self._validate(draw_id)).model_dump_json().encode()
+
+        # Stored draws rarely change, results are invalidated by the repository on save
+        data = await self.cache.get_or_load(VALIDATION_NAMESPACE, f"{draw_id}:result", load)
+        return ValidationResponse.model_validate_json(data)
+
+    async def _validate(self, draw_id: int) -> ValidationResponse:
+        """Load and validate the draw"""
+
+        # Get the draw from repository, validation only needs the projected columns
+        draw = await self.draw_repository.get_lightweight(draw_id)
         if not draw:
             raise ValueError(f"Draw with id {draw_id} not found")
 
@@ -40,4 +57,4 @@ class ValidateDrawUseCase:
             errors=errors,
             warnings=[],
             statistics=statistics
-        )
\ No newline at end of file
+        )
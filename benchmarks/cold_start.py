@@ -0,0 +1,120 @@
+"""Cold start benchmark: import time of the app and lifespan startup time
+
+Each sample runs in a fresh interpreter, as a new worker would. Thresholds make
+the script exit non-zero so CI can catch regressions:
+
+    python benchmarks/cold_start.py --runs 5 --max-import-ms 1500 --max-startup-ms 500
+
+--imports N adds the N top-level packages with the most import time of their own
+(python -X importtime), to see what `import main` spends its time on.
+
+Settings come from the environment / .env like the server's.
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter; prints one JSON line
+_PROBE = """
+import asyncio, json, time, warnings
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.create_app()
+created = time.perf_counter()
+
+async def run():
+    begin = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+    return ready - begin
+
+startup = asyncio.run(run())
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "startup_ms": startup * 1000,
+}))
+"""
+
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+
+
+def import_breakdown() -> Dict[str, float]:
+    """Self import time of `import main` per top-level package, in ms"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    totals: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            package = match.group(2).split(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(match.group(1)) / 1000
+    return totals
+
+
+def sample() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-startup-ms", type=float, default=None)
+    parser.add_argument("--imports", type=int, default=0, metavar="N")
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.runs)]
+    medians = {
+        key: statistics.median(s[key] for s in samples)
+        for key in ("import_ms", "create_app_ms", "startup_ms")
+    }
+    for key, value in medians.items():
+        low = min(s[key] for s in samples)
+        print(f"{key:>14}: median {value:8.1f}  min {low:8.1f}")
+
+    if args.imports:
+        breakdowns = [import_breakdown() for _ in range(args.runs)]
+        packages = {package for breakdown in breakdowns for package in breakdown}
+        package_medians = {
+            package: statistics.median(b.get(package, 0.0) for b in breakdowns)
+            for package in packages
+        }
+        print("import time by package (self, median):")
+        ranked = sorted(package_medians.items(), key=lambda item: -item[1])
+        for package, value in ranked[:args.imports]:
+            print(f"{package:>14}: {value:8.1f}")
+
+    failed = False
+    for key, limit in (("import_ms", args.max_import_ms), ("startup_ms", args.max_startup_ms)):
+        if limit is not None and medians[key] > limit:
+            print(f"{key} median {medians[key]:.1f} exceeds {limit:.1f}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
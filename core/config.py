@@ -20,6 +20,50 @@ class Settings(BaseSettings):
 
     # Database - Bu değer .env dosyasından okunacak
     DATABASE_URL: str
+    # Create missing tables on startup; off by default, deployments run `alembic upgrade head`.
+    # Startup fails if tables are still missing after this step
+    DB_CREATE_TABLES: bool = False
+    # Optional read replica for read-only endpoints, falls back to DATABASE_URL
+    DATABASE_READ_URL: Optional[str] = None
+    DB_READ_RETRY_SECONDS: float = 30.0
+    # Use COPY for fixture rows when saving draws on PostgreSQL (asyncpg)
+    DRAW_SAVE_USE_COPY: bool = False
+    # Fixture storage for new draws: "rows" (fixtures table) or "packed" (one blob per draw)
+    DRAW_FIXTURE_STORAGE: str = "rows"
+    # Write-behind (PostgreSQL only): return new draws before they are stored, insert them in batches
+    DRAW_WRITE_BEHIND: bool = False
+    DRAW_WRITE_QUEUE_SIZE: int = 1000
+    DRAW_WRITE_BATCH_SIZE: int = 50
+    DRAW_WRITE_FLUSH_MS: int = 200
+    # Seconds a draw waits for room in a full write queue before the request gets 503
+    DRAW_WRITE_ENQUEUE_TIMEOUT: float = 2.0
+    # Bound of the shared in-memory draw repository, least recently used draws are evicted
+    IN_MEMORY_MAX_DRAWS: int = 10000
+
+    # Simulation jobs: local worker processes, checkpoints written to JOBS_DIR
+    JOBS_DIR: str = "./jobs"
+    JOB_WORKERS: int = 2
+    JOB_CHUNK_SIZE: int = 1000
+    # Seconds without a heartbeat after which another process takes over a job
+    JOB_CLAIM_TTL: float = 60.0
+
+    # Simulated match results: league phase runs allowed per request
+    RESULT_SIMULATION_MAX_RUNS: int = 10000
+
+    # Connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_WARM_SIZE: int = 2
+    # Background database ping served by /health/ready
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # SQLite tuning
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
 
     # Docker Database Configuration - Docker için gerekli
     POSTGRES_USER: Optional[str] = None
@@ -36,6 +80,27 @@ class Settings(BaseSettings):
     # Redis (for caching)
     REDIS_URL: Optional[str] = None
 
+    # Cache - "memory" (in-process LRU) or "redis" (shared, uses REDIS_URL)
+    CACHE_BACKEND: str = "memory"
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_DEFAULT_TTL: int = 300
+    DRAW_CACHE_TTL: int = 3600
+    # How long POST /draw responses are kept for Idempotency-Key replay
+    IDEMPOTENCY_TTL: int = 86400
+
+    # Admission control for POST /draw: concurrent draws, waiting requests, max wait
+    DRAW_MAX_CONCURRENCY: int = 4
+    DRAW_MAX_QUEUE: int = 16
+    DRAW_QUEUE_TIMEOUT: float = 2.0
+    DRAW_RETRY_AFTER_SECONDS: int = 1
+
+    # Request profiling (?profile=cpu|memory): open in DEBUG, otherwise needs X-Admin-Token
+    PROFILING_ADMIN_TOKEN: Optional[str] = None
+    PROFILES_DIR: str = "./profiles"
+
+    # Response compression (bodies smaller than this are sent as-is)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
     # PgAdmin Configuration - Docker için gerekli
     PGADMIN_DEFAULT_EMAIL: Optional[str] = None
     PGADMIN_DEFAULT_PASSWORD: Optional[str] = None
@@ -51,6 +116,12 @@ class Settings(BaseSettings):
     # Logging - Bu değerler .env dosyasından okunacak
     LOG_LEVEL: str
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # One JSON object per line instead of LOG_FORMAT; enqueued sinks write from a background thread
+    LOG_JSON: bool = False
+    LOG_ENQUEUE: bool = True
+    # Share of successful requests logged; server errors and slow requests are always logged
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0
+    REQUEST_LOG_SLOW_SECONDS: float = 1.0
 
     @property
     def cors_origins(self) -> List[str]:
@@ -2,30 +2,83 @@
 
 from typing import AsyncGenerator, Annotated
 from fastapi import Depends
+from domain.interfaces.cache import Cache
+from domain.interfaces.repositories import DrawRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.health_monitor import HealthMonitor
 from infrastructure.repositories.team_repository import TeamRepositoryImpl
 from infrastructure.repositories.draw_repository import DrawRepositoryImpl
+from infrastructure.repositories.write_behind import DrawWriteQueue, WriteBehindDrawRepository
+from infrastructure.repositories.idempotency_repository import IdempotencyRepositoryImpl
 from infrastructure.repositories.in_memory_repository import (
     InMemoryTeamRepository, InMemoryDrawRepository
 )
 from application.services import (
-    DrawServiceImpl, TeamServiceImpl, ValidationServiceImpl
+    DrawServiceImpl, TeamServiceImpl, ValidationServiceImpl, PoissonResultSimulator
 )
 from application.use_cases import (
-    PerformDrawUseCase, ValidateDrawUseCase, GetTeamsUseCase
+    PerformDrawUseCase, ValidateDrawUseCase, GetTeamsUseCase, GetDrawUseCase,
+    ListDrawsUseCase, SubmitSimulationUseCase, GetSimulationJobUseCase,
+    SimulateResultsUseCase, SimulateLeaguePhaseUseCase, IdempotentRequestUseCase
 )
+from infrastructure.cache import get_cache
+from infrastructure.jobs import FileJobStore, SimulationJobRunner
 from core.config import settings
 
 # Database connection instance
 db_connection = DatabaseConnection(settings.DATABASE_URL)
 
+# Read replica connection, reads fall back to the primary when unset or unreachable
+read_db_connection = (
+    DatabaseConnection(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+)
+
+# Write-behind queue for new draws, started and flushed by the application lifespan
+draw_write_queue = (
+    DrawWriteQueue(
+        db_connection,
+        max_size=settings.DRAW_WRITE_QUEUE_SIZE,
+        batch_size=settings.DRAW_WRITE_BATCH_SIZE,
+        flush_interval_ms=settings.DRAW_WRITE_FLUSH_MS,
+        enqueue_timeout=settings.DRAW_WRITE_ENQUEUE_TIMEOUT,
+        retry_after=settings.DRAW_RETRY_AFTER_SECONDS
+    )
+    if settings.DRAW_WRITE_BEHIND else None
+)
+
+# Database health monitor, started by the application lifespan and read by /health/ready
+health_monitor = HealthMonitor(
+    db_connection,
+    interval=settings.HEALTH_CHECK_INTERVAL,
+    timeout=settings.HEALTH_CHECK_TIMEOUT
+)
+
+# Simulation job runner, its worker pool is started by the application lifespan
+simulation_runner = SimulationJobRunner(
+    FileJobStore(settings.JOBS_DIR, claim_ttl=settings.JOB_CLAIM_TTL),
+    workers=settings.JOB_WORKERS
+)
+
 # Dependency for database session
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session"""
     async for session in db_connection.get_session():
         yield session
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only database session, served by the replica when available"""
+    if read_db_connection is not None:
+        session = read_db_connection.open_read_session(db_connection)
+        try:
+            yield session
+        finally:
+            await session.close()
+        return
+
+    async for session in db_connection.get_session():
+        yield session
+
 # Repository dependencies
 async def get_team_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)]
@@ -39,14 +92,48 @@ async def get_draw_repository(
     """Get draw repository instance"""
     return DrawRepositoryImpl(session)
 
-# For testing/development with in-memory repositories
+async def get_read_team_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db_session)]
+) -> TeamRepositoryImpl:
+    """Get team repository instance for read-only use"""
+    return TeamRepositoryImpl(session)
+
+async def get_read_draw_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db_session)]
+) -> DrawRepositoryImpl:
+    """Get draw repository instance for read-only use"""
+    return DrawRepositoryImpl(session)
+
+async def get_idempotency_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IdempotencyRepositoryImpl:
+    """Get idempotency key repository, sharing the request's session with the draw it stores"""
+    return IdempotencyRepositoryImpl(session)
+
+async def get_draw_write_repository(
+    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_draw_repository)]
+) -> DrawRepository:
+    """Get the repository new draws are saved through, queued when write-behind is on"""
+    if draw_write_queue is not None:
+        return WriteBehindDrawRepository(draw_repository, draw_write_queue)
+    return draw_repository
+
+# In-memory repositories, shared per process so they can serve as a hot tier
+in_memory_team_repository = InMemoryTeamRepository()
+in_memory_draw_repository = InMemoryDrawRepository(max_draws=settings.IN_MEMORY_MAX_DRAWS)
+
 def get_in_memory_team_repository() -> InMemoryTeamRepository:
     """Get in-memory team repository"""
-    return InMemoryTeamRepository()
+    return in_memory_team_repository
 
 def get_in_memory_draw_repository() -> InMemoryDrawRepository:
     """Get in-memory draw repository"""
-    return InMemoryDrawRepository()
+    return in_memory_draw_repository
+
+# Cache dependency
+def get_shared_cache() -> Cache:
+    """Get the process-wide cache selected by CACHE_BACKEND"""
+    return get_cache()
 
 # Service dependencies
 async def get_validation_service() -> ValidationServiceImpl:
@@ -54,25 +141,32 @@ async def get_validation_service() -> ValidationServiceImpl:
     return ValidationServiceImpl()
 
 async def get_team_service(
-    team_repository: Annotated[TeamRepositoryImpl, Depends(get_team_repository)]
+    team_repository: Annotated[TeamRepositoryImpl, Depends(get_read_team_repository)]
 ) -> TeamServiceImpl:
     """Get team service instance"""
     return TeamServiceImpl(team_repository)
 
 async def get_draw_service(
-    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_draw_repository)],
-    team_repository: Annotated[TeamRepositoryImpl, Depends(get_team_repository)],
+    draw_repository: Annotated[DrawRepository, Depends(get_draw_write_repository)],
     validation_service: Annotated[ValidationServiceImpl, Depends(get_validation_service)]
 ) -> DrawServiceImpl:
     """Get draw service instance"""
-    # Note: fixture_repository would be injected here too in full implementation
+    # Note: team and fixture repositories would be injected here once the draw uses them
     return DrawServiceImpl(
         draw_repository=draw_repository,
-        team_repository=team_repository,
-        fixture_repository=None,  # Simplified for this example
         validation_service=validation_service
     )
 
+async def get_result_simulator() -> PoissonResultSimulator:
+    """Get match result simulator instance"""
+    return PoissonResultSimulator()
+
+async def get_draw_rules_service(
+    validation_service: Annotated[ValidationServiceImpl, Depends(get_validation_service)]
+) -> DrawServiceImpl:
+    """Get draw service for rule checks only, without repositories"""
+    return DrawServiceImpl(validation_service=validation_service)
+
 # Use case dependencies
 async def get_perform_draw_use_case(
     draw_service: Annotated[DrawServiceImpl, Depends(get_draw_service)]
@@ -80,15 +174,58 @@ async def get_perform_draw_use_case(
     """Get perform draw use case"""
     return PerformDrawUseCase(draw_service)
 
+async def get_idempotent_request_use_case(
+    repository: Annotated[IdempotencyRepositoryImpl, Depends(get_idempotency_repository)]
+) -> IdempotentRequestUseCase:
+    """Get idempotent request use case"""
+    return IdempotentRequestUseCase(repository, ttl=settings.IDEMPOTENCY_TTL)
+
 async def get_validate_draw_use_case(
-    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_draw_repository)],
-    draw_service: Annotated[DrawServiceImpl, Depends(get_draw_service)]
+    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_read_draw_repository)],
+    draw_service: Annotated[DrawServiceImpl, Depends(get_draw_rules_service)],
+    cache: Annotated[Cache, Depends(get_shared_cache)]
 ) -> ValidateDrawUseCase:
     """Get validate draw use case"""
-    return ValidateDrawUseCase(draw_repository, draw_service)
+    return ValidateDrawUseCase(draw_repository, draw_service, cache=cache)
 
 async def get_teams_use_case(
     team_service: Annotated[TeamServiceImpl, Depends(get_team_service)]
 ) -> GetTeamsUseCase:
     """Get teams use case"""
     return GetTeamsUseCase(team_service)
+
+async def get_draw_use_case(
+    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_read_draw_repository)]
+) -> GetDrawUseCase:
+    """Get stored draw use case"""
+    return GetDrawUseCase(draw_repository)
+
+async def get_list_draws_use_case(
+    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_read_draw_repository)]
+) -> ListDrawsUseCase:
+    """Get list draws use case"""
+    return ListDrawsUseCase(draw_repository)
+
+async def get_submit_simulation_use_case() -> SubmitSimulationUseCase:
+    """Get submit simulation use case"""
+    return SubmitSimulationUseCase(simulation_runner, chunk_size=settings.JOB_CHUNK_SIZE)
+
+async def get_simulation_job_use_case() -> GetSimulationJobUseCase:
+    """Get simulation job use case"""
+    return GetSimulationJobUseCase(simulation_runner)
+
+async def get_simulate_results_use_case(
+    draw_repository: Annotated[DrawRepository, Depends(get_draw_write_repository)],
+    simulator: Annotated[PoissonResultSimulator, Depends(get_result_simulator)]
+) -> SimulateResultsUseCase:
+    """Get simulate results use case"""
+    return SimulateResultsUseCase(draw_repository, simulator)
+
+async def get_league_phase_use_case(
+    draw_repository: Annotated[DrawRepositoryImpl, Depends(get_read_draw_repository)],
+    simulator: Annotated[PoissonResultSimulator, Depends(get_result_simulator)]
+) -> SimulateLeaguePhaseUseCase:
+    """Get league phase simulation use case"""
+    return SimulateLeaguePhaseUseCase(
+        draw_repository, simulator, max_runs=settings.RESULT_SIMULATION_MAX_RUNS
+    )
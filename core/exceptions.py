@@ -32,6 +32,12 @@ class ConflictException(DomainException):
     def __init__(self, message: str):
         super().__init__(message, "CONFLICT")
 
+class ServiceUnavailableException(DomainException):
+    """Exception for work refused while the service is saturated"""
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message, "SERVICE_UNAVAILABLE")
+        self.retry_after = retry_after
+
 class ExternalServiceException(Exception):
     """Exception for external service errors"""
     def __init__(self, service: str, message: str):
@@ -1,5 +1,7 @@
 import logging
 import sys
+import traceback
+import orjson
 from loguru import logger
 from core.config import settings
 
@@ -23,6 +25,24 @@ class InterceptHandler(logging.Handler):
         )
 
 
+def _json_format(record) -> str:
+    """Render a record as one JSON line; extra fields (request id, status...) become keys"""
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    payload.update((key, value) for key, value in record["extra"].items() if key != "json")
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    # Braces in the JSON must not reach loguru's template formatting
+    record["extra"]["json"] = orjson.dumps(payload, default=str).decode()
+    return "{extra[json]}\n"
+
+
 def setup_logging() -> None:
     """Configure logging for the application"""
 
@@ -33,13 +53,16 @@ def setup_logging() -> None:
     # Remove default loguru handler
     logger.remove()
 
+    log_format = _json_format if settings.LOG_JSON else settings.LOG_FORMAT
+
     # Add custom loguru handler
     logger.add(
         sys.stderr,
-        format=settings.LOG_FORMAT,
+        format=log_format,
         level=settings.LOG_LEVEL,
         backtrace=settings.DEBUG,
         diagnose=settings.DEBUG,
+        enqueue=settings.LOG_ENQUEUE,
     )
 
     # Add file handler for production
@@ -49,7 +72,8 @@ def setup_logging() -> None:
             rotation="500 MB",
             retention="10 days",
             level="INFO",
-            format=settings.LOG_FORMAT,
+            format=log_format,
+            enqueue=settings.LOG_ENQUEUE,
         )
 
     # Configure loggers for libraries
@@ -0,0 +1,39 @@
+# CPU profiling of work handed to threads
+import cProfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Set only while a request is cpu-profiled; asyncio.to_thread copies it into the worker thread
+_thread_profiles: ContextVar[Optional[List[cProfile.Profile]]] = ContextVar("thread_profiles", default=None)
+
+
+@contextmanager
+def collect_thread_profiles() -> Iterator[List[cProfile.Profile]]:
+    """Profiles of calls made through call_profiled inside the block"""
+    profiles: List[cProfile.Profile] = []
+    token = _thread_profiles.set(profiles)
+    try:
+        yield profiles
+    finally:
+        _thread_profiles.reset(token)
+
+
+def call_profiled(fn: Callable[..., T], *args) -> T:
+    """Call fn, profiling it if the calling request is being profiled
+
+    cProfile only sees the thread it was enabled in, calls run in worker threads
+    would otherwise be missing from the request's profile.
+    """
+    profiles = _thread_profiles.get()
+    if profiles is None:
+        return fn(*args)
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        return fn(*args)
+    finally:
+        profile.disable()
+        profiles.append(profile)
@@ -1,5 +1,12 @@
 from .team import Team
 from .fixture import Fixture
 from .draw import Draw
+from .draw_summary import DrawSummary
+from .simulation_job import SimulationJob, JobStatus
+from .league_phase import Standing, TeamOutcome, LeaguePhaseOutcome
+from .idempotency import StoredResponse
 
-__all__ = ['Team', 'Fixture', 'Draw']
\ No newline at end of file
+__all__ = [
+    'Team', 'Fixture', 'Draw', 'DrawSummary', 'SimulationJob', 'JobStatus',
+    'Standing', 'TeamOutcome', 'LeaguePhaseOutcome', 'StoredResponse'
+]
\ No newline at end of file
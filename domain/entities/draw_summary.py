@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class DrawSummary:
+    """Lightweight projection of a stored draw for listings"""
+    id: int
+    competition: str
+    season: str
+    is_valid: bool
+    created_at: Optional[datetime]
+    fixture_count: int
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response bytes kept for replaying a repeated Idempotency-Key"""
+    fingerprint: str
+    status_code: int
+    media_type: str
+    body: bytes
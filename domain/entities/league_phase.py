@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class Standing:
+    """League table row of one team"""
+    team_id: int
+    played: int = 0
+    won: int = 0
+    drawn: int = 0
+    lost: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    away_goals_for: int = 0
+    points: int = 0
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+
+@dataclass
+class TeamOutcome:
+    """League phase results of one team across simulation runs"""
+    team_id: int
+    runs: int
+    total_points: int = 0
+    total_goal_difference: int = 0
+    # position_counts[i]: runs the team finished in league position i + 1
+    position_counts: List[int] = field(default_factory=list)
+
+    @property
+    def mean_points(self) -> float:
+        return self.total_points / self.runs if self.runs else 0.0
+
+    @property
+    def mean_goal_difference(self) -> float:
+        return self.total_goal_difference / self.runs if self.runs else 0.0
+
+    def probability_between(self, first: int, last: int) -> float:
+        """Share of runs finishing between positions first and last, inclusive"""
+        if not self.runs:
+            return 0.0
+        return sum(self.position_counts[first - 1:last]) / self.runs
+
+
+@dataclass
+class LeaguePhaseOutcome:
+    """Distribution of league phase standings over repeated simulated results"""
+    draw_id: int
+    runs: int
+    seed: int
+    teams: List[TeamOutcome]
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Set
+from .team import Team
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class SimulationJob:
+    """Monte Carlo run of repeated draws, processed in fixed-size chunks"""
+    id: str
+    competition: str
+    season: str
+    teams: List[Team]
+    iterations: int
+    chunk_size: int
+    seed: int
+    status: JobStatus = JobStatus.QUEUED
+    completed_chunks: Set[int] = field(default_factory=set)
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    valid: int = 0
+    # Meetings per unordered team pair, keyed "<lower id>-<higher id>"
+    pair_counts: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-self.iterations // self.chunk_size)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def chunk_iterations(self, chunk: int) -> int:
+        """Number of draws in a chunk, the last one may be short"""
+        return min(self.chunk_size, self.iterations - chunk * self.chunk_size)
+
+    def chunk_seed(self, chunk: int) -> int:
+        """Deterministic per-chunk seed so resumed chunks replay identically"""
+        return (self.seed * 1_000_003 + chunk) & 0xFFFFFFFF
+
+    def pending_chunks(self) -> List[int]:
+        return [chunk for chunk in range(self.chunk_count) if chunk not in self.completed_chunks]
+
+    def merge_chunk(self, chunk: int, result: Dict) -> None:
+        """Add a chunk's totals to the job"""
+        if chunk in self.completed_chunks:
+            return
+        self.completed_chunks.add(chunk)
+        self.completed += result["iterations"]
+        self.succeeded += result["succeeded"]
+        self.failed += result["failed"]
+        self.valid += result["valid"]
+        for pair, count in result["pair_counts"].items():
+            self.pair_counts[pair] = self.pair_counts.get(pair, 0) + count
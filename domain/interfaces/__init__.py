@@ -1,7 +1,8 @@
-from .repositories import TeamRepository, DrawRepository, FixtureRepository
+from .repositories import TeamRepository, DrawRepository, FixtureRepository, IdempotencyRepository
 from .services import DrawService, TeamService, ValidationService
+from .cache import Cache
 
 __all__ = [
-    'TeamRepository', 'DrawRepository', 'FixtureRepository',
-    'DrawService', 'TeamService', 'ValidationService'
+    'TeamRepository', 'DrawRepository', 'FixtureRepository', 'IdempotencyRepository',
+    'DrawService', 'TeamService', 'ValidationService', 'Cache'
 ]
\ No newline at end of file
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+# Namespaces shared by the repositories (for invalidation) and their readers
+TEAMS_NAMESPACE = "teams"
+DRAW_RESPONSES_NAMESPACE = "draw_responses"
+VALIDATION_NAMESPACE = "validation"
+
+
+class Cache(ABC):
+    """Read-through byte cache with namespaced keys"""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def get_or_load(
+            self,
+            namespace: str,
+            key: str,
+            loader: Callable[[], Awaitable[Optional[bytes]]],
+            ttl: Optional[int] = None
+    ) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, namespace: str, key_prefix: str = "") -> None:
+        pass
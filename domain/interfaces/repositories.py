@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities import Team, Draw, Fixture
+from datetime import datetime
+from typing import List, Optional, Tuple
+from ..entities import Team, Draw, DrawSummary, Fixture, StoredResponse
 from ..value_objects import CompetitionType
 
 
@@ -12,7 +13,15 @@ class TeamRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_competition(self, competition: CompetitionType) -> List[Team]:
+    async def get_by_competition(
+            self, competition: CompetitionType, season: Optional[str] = None
+    ) -> List[Team]:
+        pass
+
+    @abstractmethod
+    async def add_to_competition(
+            self, competition: CompetitionType, season: str, team_ids: List[int]
+    ) -> None:
         pass
 
     @abstractmethod
@@ -39,6 +48,10 @@ class DrawRepository(ABC):
     async def get_by_id(self, draw_id: int) -> Optional[Draw]:
         pass
 
+    @abstractmethod
+    async def get_lightweight(self, draw_id: int) -> Optional[Draw]:
+        pass
+
     @abstractmethod
     async def get_by_competition_and_season(
             self, competition: CompetitionType, season: str
@@ -49,10 +62,32 @@ class DrawRepository(ABC):
     async def save(self, draw: Draw) -> Draw:
         pass
 
+    @abstractmethod
+    async def save_many(self, draws: List[Draw]) -> List[Draw]:
+        pass
+
+    @abstractmethod
+    async def save_results(self, draws: List[Draw]) -> List[Draw]:
+        pass
+
     @abstractmethod
     async def get_latest(self, competition: CompetitionType) -> Optional[Draw]:
         pass
 
+    @abstractmethod
+    async def get_latest_id(self, competition: CompetitionType) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def list_summaries(
+            self,
+            competition: Optional[CompetitionType] = None,
+            season: Optional[str] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: int = 50
+    ) -> List[DrawSummary]:
+        pass
+
 
 class FixtureRepository(ABC):
     """Repository interface for Fixture entity"""
@@ -71,4 +106,33 @@ class FixtureRepository(ABC):
 
     @abstractmethod
     async def save_many(self, fixtures: List[Fixture]) -> List[Fixture]:
-        pass
\ No newline at end of file
+        pass
+
+
+class IdempotencyRepository(ABC):
+    """Repository interface for responses stored per Idempotency-Key
+
+    Keys are written in the request's unit of work, together with what the request
+    stored; commit and rollback end that unit of work.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, response: StoredResponse, ttl: int) -> None:
+        """Store a response; raises ConflictException when the key is already stored"""
+        pass
+
+    @abstractmethod
+    async def purge_expired(self) -> None:
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from ..entities import Team, Draw, Fixture
+from typing import AsyncIterator, List, Dict, Optional
+from ..entities import Team, Draw, Fixture, SimulationJob, Standing, LeaguePhaseOutcome
 from ..value_objects import CompetitionType
 
 
@@ -13,6 +13,12 @@ class DrawService(ABC):
     ) -> Draw:
         pass
 
+    @abstractmethod
+    async def generate_draw(
+            self, teams: List[Team], competition: CompetitionType, season: str
+    ) -> Draw:
+        pass
+
     @abstractmethod
     async def validate_draw(self, draw: Draw) -> tuple[bool, List[str]]:
         pass
@@ -22,7 +28,9 @@ class TeamService(ABC):
     """Service interface for team operations"""
 
     @abstractmethod
-    async def get_teams_by_competition(self, competition: CompetitionType) -> List[Team]:
+    async def get_teams_by_competition(
+            self, competition: CompetitionType, season: Optional[str] = None
+    ) -> List[Team]:
         pass
 
     @abstractmethod
@@ -41,4 +49,38 @@ class ValidationService(ABC):
     def validate_fixture_constraints(
             self, team: Team, fixtures: List[Fixture], teams: List[Team]
     ) -> tuple[bool, List[str]]:
-        pass
\ No newline at end of file
+        pass
+
+
+class SimulationJobService(ABC):
+    """Service interface for background simulation jobs"""
+
+    @abstractmethod
+    async def submit(self, job: SimulationJob) -> SimulationJob:
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[SimulationJob]:
+        pass
+
+    @abstractmethod
+    def watch(self, job_id: str, heartbeat: float = 15.0) -> AsyncIterator[SimulationJob]:
+        pass
+
+
+class ResultSimulationService(ABC):
+    """Service interface for simulated match results"""
+
+    @abstractmethod
+    def simulate_results(self, draws: List[Draw], seed: Optional[int] = None) -> List[Draw]:
+        pass
+
+    @abstractmethod
+    def standings(self, draw: Draw) -> List[Standing]:
+        pass
+
+    @abstractmethod
+    def simulate_league_phase(
+            self, draw: Draw, runs: int, seed: Optional[int] = None
+    ) -> LeaguePhaseOutcome:
+        pass
@@ -0,0 +1,11 @@
+from domain.interfaces.cache import (
+    Cache, TEAMS_NAMESPACE, DRAW_RESPONSES_NAMESPACE, VALIDATION_NAMESPACE
+)
+from .base import BaseCache, CacheStats
+from .memory import InMemoryCache
+from .factory import get_cache, set_cache, close_cache
+
+__all__ = [
+    'Cache', 'BaseCache', 'CacheStats', 'InMemoryCache', 'get_cache', 'set_cache', 'close_cache',
+    'TEAMS_NAMESPACE', 'DRAW_RESPONSES_NAMESPACE', 'VALIDATION_NAMESPACE'
+]
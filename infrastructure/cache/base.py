@@ -0,0 +1,146 @@
+import asyncio
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+from loguru import logger
+from domain.interfaces.cache import Cache
+
+
+# Result handed to followers when the leader's load was cancelled
+_LEADER_CANCELLED = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache namespace"""
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BaseCache(Cache):
+    """Read-through byte cache with namespaced keys, single-flight loads and metrics"""
+
+    def __init__(self, default_ttl: Optional[int] = None):
+        self.default_ttl = default_ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._stats: Dict[str, CacheStats] = {}
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def _set(self, key: str, value: bytes, ttl: Optional[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def _delete_prefix(self, prefix: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources"""
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{namespace}:{key}"
+
+    def stats(self, namespace: str) -> CacheStats:
+        return self._stats.setdefault(namespace, CacheStats())
+
+    def all_stats(self) -> Dict[str, CacheStats]:
+        return dict(self._stats)
+
+    async def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Get a value, counting the lookup; backend errors count as misses"""
+        stats = self.stats(namespace)
+        try:
+            value = await self._get(self._key(namespace, key))
+        except Exception as e:
+            stats.errors += 1
+            logger.warning(f"Cache get failed for {namespace}: {e}")
+            value = None
+
+        if value is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+        return value
+
+    async def set(self, namespace: str, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store a value; backend errors are logged and ignored"""
+        try:
+            await self._set(self._key(namespace, key), value, ttl or self.default_ttl)
+        except Exception as e:
+            self.stats(namespace).errors += 1
+            logger.warning(f"Cache set failed for {namespace}: {e}")
+
+    async def get_or_load(
+            self,
+            namespace: str,
+            key: str,
+            loader: Callable[[], Awaitable[Optional[bytes]]],
+            ttl: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return the cached value or load it once, sharing the load between concurrent callers"""
+        value = await self.get(namespace, key)
+        if value is not None:
+            return value
+
+        full_key = self._key(namespace, key)
+        while True:
+            inflight = self._inflight.get(full_key)
+            if inflight is None:
+                return await self._load(namespace, key, full_key, loader, ttl)
+
+            self.stats(namespace).coalesced += 1
+            value = await asyncio.shield(inflight)
+            # A cancelled leader only cancels its own caller, followers load again
+            if value is not _LEADER_CANCELLED:
+                return value
+
+    async def _load(
+            self,
+            namespace: str,
+            key: str,
+            full_key: str,
+            loader: Callable[[], Awaitable[Optional[bytes]]],
+            ttl: Optional[int]
+    ) -> Optional[bytes]:
+        """Run the loader as the leader and hand its outcome to the followers"""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        generation = self._generations.get(namespace, 0)
+
+        try:
+            value = await loader()
+            # Skip the store if the namespace was invalidated while loading
+            if value is not None and self._generations.get(namespace, 0) == generation:
+                await self.set(namespace, key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(full_key, None)
+            if not future.done():
+                # Cancelled (or interrupted) leader
+                future.set_result(_LEADER_CANCELLED)
+
+    async def invalidate(self, namespace: str, key_prefix: str = "") -> None:
+        """Drop every key in a namespace starting with key_prefix"""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        try:
+            await self._delete_prefix(self._key(namespace, key_prefix))
+        except Exception as e:
+            self.stats(namespace).errors += 1
+            logger.warning(f"Cache invalidation failed for {namespace}: {e}")
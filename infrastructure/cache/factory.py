@@ -0,0 +1,43 @@
+from typing import Optional
+from core.config import settings
+from .base import BaseCache
+from .memory import InMemoryCache
+
+_cache: Optional[BaseCache] = None
+
+
+def create_cache() -> BaseCache:
+    """Build the cache backend selected by CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            raise ValueError("CACHE_BACKEND=redis requires REDIS_URL")
+        # Imported here so the in-process backend does not load the redis client
+        from .redis_cache import RedisCache
+        return RedisCache.from_url(settings.REDIS_URL, default_ttl=settings.CACHE_DEFAULT_TTL)
+
+    return InMemoryCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        default_ttl=settings.CACHE_DEFAULT_TTL
+    )
+
+
+def get_cache() -> BaseCache:
+    """Get the process-wide cache instance"""
+    global _cache
+    if _cache is None:
+        _cache = create_cache()
+    return _cache
+
+
+def set_cache(cache: BaseCache) -> None:
+    """Replace the process-wide cache, e.g. with a fake Redis client in tests"""
+    global _cache
+    _cache = cache
+
+
+async def close_cache() -> None:
+    """Close the process-wide cache"""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
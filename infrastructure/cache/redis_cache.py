@@ -0,0 +1,41 @@
+from typing import Optional
+from redis.asyncio import Redis
+from .base import BaseCache
+
+# Keys unlinked per round trip during prefix invalidation
+DELETE_BATCH_SIZE = 500
+
+
+class RedisCache(BaseCache):
+    """Redis-backed cache shared between replicas"""
+
+    def __init__(self, client: Redis, key_prefix: str = "uefa:", default_ttl: Optional[int] = None):
+        super().__init__(default_ttl)
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        return cls(Redis.from_url(url), **kwargs)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.key_prefix}{namespace}:{key}"
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def _set(self, key: str, value: bytes, ttl: Optional[int]) -> None:
+        await self.client.set(key, value, ex=ttl)
+
+    async def _delete_prefix(self, prefix: str) -> None:
+        batch = []
+        async for key in self.client.scan_iter(match=f"{prefix}*", count=DELETE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= DELETE_BATCH_SIZE:
+                await self.client.unlink(*batch)
+                batch = []
+        if batch:
+            await self.client.unlink(*batch)
+
+    async def close(self) -> None:
+        await self.client.aclose()
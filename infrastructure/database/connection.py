@@ -1,56 +1,295 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, ORMExecuteState, declarative_base
+from sqlalchemy.pool import NullPool
 from core.config import settings
+from infrastructure.cache import get_cache
+from infrastructure.database.pool import TimedAsyncQueuePool
 
 Base = declarative_base()
 
 
+class WriteTrackingSession(Session):
+    """Session that remembers whether it issued any write"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.has_writes = False
+
+    @property
+    def needs_commit(self) -> bool:
+        return self.has_writes or bool(self.new or self.dirty or self.deleted)
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.has_writes = True
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _track_flush_writes(session: WriteTrackingSession, flush_context) -> None:
+    session.has_writes = True
+
+
+class CacheInvalidatingSession(AsyncSession):
+    """Async session that runs queued cache invalidations and callbacks after its transaction commits
+
+    Invalidating inside the transaction would let a concurrent read re-cache the old
+    rows between the invalidation and the commit.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidations: List[Tuple[str, str]] = []
+        self._commit_callbacks: List[Tuple[Callable[[], None], Optional[Callable[[], None]]]] = []
+
+    def invalidate_after_commit(self, namespace: str, key_prefix: str = "") -> None:
+        """Queue an invalidation for the next successful commit"""
+        self._invalidations.append((namespace, key_prefix))
+
+    def call_after_commit(
+            self, callback: Callable[[], None], on_discard: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Call `callback` after the next successful commit, `on_discard` if the transaction is
+        rolled back or the session closed first"""
+        self._commit_callbacks.append((callback, on_discard))
+
+    @property
+    def has_commit_callbacks(self) -> bool:
+        return bool(self._commit_callbacks)
+
+    async def commit(self) -> None:
+        await super().commit()
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for callback, _ in callbacks:
+            callback()
+        invalidations, self._invalidations = self._invalidations, []
+        cache = get_cache()
+        for namespace, key_prefix in dict.fromkeys(invalidations):
+            await cache.invalidate(namespace, key_prefix)
+
+    async def rollback(self) -> None:
+        self._invalidations.clear()
+        self._discard_commit_callbacks()
+        await super().rollback()
+
+    async def close(self) -> None:
+        self._discard_commit_callbacks()
+        await super().close()
+
+    def _discard_commit_callbacks(self) -> None:
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for _, on_discard in callbacks:
+            if on_discard is not None:
+                on_discard()
+
+
+class ReadFailoverSession(CacheInvalidatingSession):
+    """Read session on a replica that moves to the primary if the replica is unreachable
+
+    The connection is checked out with the first statement, so requests answered from a
+    cache or with a 304 never touch either database.
+    """
+
+    def __init__(self, *args, replica: "DatabaseConnection", primary: "DatabaseConnection", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replica = replica
+        self._primary = primary
+        self._connected = False
+
+    async def _connect_or_fail_over(self) -> None:
+        if self._connected:
+            return
+        self._connected = True
+        try:
+            await super().connection()
+        except (OSError, DBAPIError) as e:
+            await self.close()
+            self.sync_session.bind = self._primary.engine.sync_engine
+            self._replica.unavailable_until = time.monotonic() + settings.DB_READ_RETRY_SECONDS
+            logger.warning(f"Read database unavailable, using primary: {e}")
+
+    async def connection(self, *args, **kwargs):
+        await self._connect_or_fail_over()
+        return await super().connection(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        await self._connect_or_fail_over()
+        return await super().execute(*args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        await self._connect_or_fail_over()
+        return await super().scalar(*args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        await self._connect_or_fail_over()
+        return await super().scalars(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        await self._connect_or_fail_over()
+        return await super().get(*args, **kwargs)
+
+
 class DatabaseConnection:
     """Database connection manager"""
 
     def __init__(self, database_url: str = None):
         self.database_url = database_url or settings.DATABASE_URL
+        # Monotonic time until which this database is treated as unreachable for reads
+        self.unavailable_until = 0.0
+        self.is_sqlite = self.database_url.startswith('sqlite')
+        self.is_sqlite_memory = self.is_sqlite and (
+            ':memory:' in self.database_url or self.database_url.endswith('://')
+        )
+        # Created on first use, so importing the app does not load drivers or open pools
+        self._engine: Optional[AsyncEngine] = None
+        self._probe_engine: Optional[AsyncEngine] = None
+        self._async_session: Optional[async_sessionmaker] = None
 
-        # SQLite için farklı konfigürasyon
-        if self.database_url.startswith('sqlite'):
-            self.engine = create_async_engine(
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = self._create_engine()
+        return self._engine
+
+    @property
+    def probe_engine(self) -> AsyncEngine:
+        """Unpooled engine for health checks, a saturated pool does not delay them"""
+        if self._probe_engine is None:
+            if self.is_sqlite_memory:
+                # A new in-memory connection would be a different, empty database
+                return self.engine
+            self._probe_engine = create_async_engine(self.database_url, poolclass=NullPool)
+        return self._probe_engine
+
+    @property
+    def async_session(self) -> async_sessionmaker:
+        if self._async_session is None:
+            # Sessions check out a connection on first statement only
+            self._async_session = async_sessionmaker(
+                self.engine,
+                class_=CacheInvalidatingSession,
+                sync_session_class=WriteTrackingSession,
+                expire_on_commit=False
+            )
+        return self._async_session
+
+    def _create_engine(self) -> AsyncEngine:
+        # SQLite için farklı konfigürasyon (in-memory keeps its single shared connection)
+        if self.is_sqlite_memory:
+            engine = create_async_engine(
                 self.database_url,
                 echo=settings.DEBUG,
             )
         else:
-            # PostgreSQL/MySQL için pool ayarları
-            self.engine = create_async_engine(
+            # PostgreSQL/MySQL ve dosya tabanlı SQLite için pool ayarları
+            engine_options: Dict[str, Any] = {
+                "poolclass": TimedAsyncQueuePool,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                "pool_pre_ping": not self.is_sqlite,
+            }
+            if self.database_url.startswith('postgresql+asyncpg'):
+                engine_options["connect_args"] = {
+                    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+                }
+
+            engine = create_async_engine(
                 self.database_url,
                 echo=settings.DEBUG,
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10
+                **engine_options
             )
 
-        self.async_session = async_sessionmaker(
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+        if self.is_sqlite:
+            event.listen(engine.sync_engine, "connect", self._set_sqlite_pragmas)
+        return engine
+
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """WAL lets readers run alongside the single writer"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
 
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session"""
         async with self.async_session() as session:
             try:
                 yield session
-                await session.commit()
+                # Read-only requests skip the COMMIT round trip, close() releases the connection
+                if session.sync_session.needs_commit or session.has_commit_callbacks:
+                    await session.commit()
             except Exception:
                 await session.rollback()
                 raise
             finally:
                 await session.close()
 
+    def open_read_session(self, primary: "DatabaseConnection") -> AsyncSession:
+        """Read-only session on this database, on `primary` while this one was recently unreachable
+
+        No connection is checked out here, the failover happens at the first statement.
+        """
+        if time.monotonic() < self.unavailable_until:
+            return primary.async_session()
+        return ReadFailoverSession(
+            bind=self.engine, replica=self, primary=primary, expire_on_commit=False,
+            sync_session_class=WriteTrackingSession
+        )
+
+    async def warm_up(self, connections: int) -> None:
+        """Open pooled connections ahead of the first requests"""
+
+        async def ping() -> None:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(max(connections, 0))))
+
+    def pool_status(self) -> Dict[str, Any]:
+        """Current pool occupancy and checkout wait statistics"""
+        if self._engine is None:
+            return {"pool": None}
+        pool = self._engine.pool
+        status: Dict[str, Any] = {"pool": type(pool).__name__}
+
+        if isinstance(pool, TimedAsyncQueuePool):
+            stats = pool.checkout_stats
+            status.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "checkouts": stats.checkouts,
+                "timeouts": stats.timeouts,
+                "average_wait_seconds": stats.average_wait,
+                "max_wait_seconds": stats.max_wait,
+            })
+
+        return status
+
     async def create_tables(self):
         """Create all tables"""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    async def missing_tables(self) -> List[str]:
+        """Tables of the models that do not exist in the database"""
+        async with self.engine.connect() as conn:
+            existing = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+        return sorted(set(Base.metadata.tables) - existing)
+
     async def drop_tables(self):
         """Drop all tables"""
         async with self.engine.begin() as conn:
@@ -58,4 +297,7 @@ class DatabaseConnection:
 
     async def close(self):
         """Close database connection"""
-        await self.engine.dispose()
\ No newline at end of file
+        if self._engine is not None:
+            await self._engine.dispose()
+        if self._probe_engine is not None:
+            await self._probe_engine.dispose()
@@ -0,0 +1,100 @@
+# Background database health checks
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from loguru import logger
+from sqlalchemy import text
+from infrastructure.database.connection import DatabaseConnection
+
+
+@dataclass
+class HealthSnapshot:
+    """Result of the latest background check"""
+    database_ok: bool
+    checked_at: datetime
+    checked_monotonic: float
+    ping_seconds: Optional[float] = None
+    error: Optional[str] = None
+    loop_lag_seconds: float = 0.0
+    pool: Dict[str, Any] = field(default_factory=dict)
+
+
+class HealthMonitor:
+    """Pings the database on an interval and keeps the last result in memory
+
+    Probes read the snapshot instead of checking out a pooled connection per call. The
+    ping opens its own connection outside the pool: when traffic holds every pooled
+    connection the database is busy, not down. Event-loop lag is how late the monitor's own sleep woke up.
+    """
+
+    def __init__(self, db_connection: DatabaseConnection, interval: float = 5.0, timeout: float = 2.0):
+        self.db_connection = db_connection
+        self.interval = interval
+        self.timeout = timeout
+        self.snapshot: Optional[HealthSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Last ping succeeded and is recent enough to trust"""
+        snapshot = self.snapshot
+        return (
+            snapshot is not None
+            and snapshot.database_ok
+            and time.monotonic() - snapshot.checked_monotonic <= 3 * self.interval + self.timeout
+        )
+
+    async def start(self) -> None:
+        """Run a first check, so probes have a result straight away, then check in the background"""
+        if self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self, loop_lag: float = 0.0) -> HealthSnapshot:
+        """Ping the database once and store the result"""
+        start = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(self._ping(), self.timeout)
+        except asyncio.TimeoutError:
+            error = f"Database ping timed out after {self.timeout}s"
+        except Exception as e:
+            error = str(e)
+        elapsed = time.perf_counter() - start
+
+        if error is not None and (self.snapshot is None or self.snapshot.database_ok):
+            logger.warning(f"Database health check failed: {error}")
+
+        self.snapshot = HealthSnapshot(
+            database_ok=error is None,
+            checked_at=datetime.now(timezone.utc),
+            checked_monotonic=time.monotonic(),
+            ping_seconds=elapsed if error is None else None,
+            error=error,
+            loop_lag_seconds=loop_lag,
+            pool=self.db_connection.pool_status(),
+        )
+        return self.snapshot
+
+    async def _ping(self) -> None:
+        async with self.db_connection.probe_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            await self.check(max(loop.time() - expected, 0.0))
@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Table
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Table, Index, LargeBinary
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .connection import Base
@@ -11,6 +14,20 @@ draw_teams = Table(
     Column('team_id', Integer, ForeignKey('teams.id'), primary_key=True)
 )
 
+# Competition/season membership; the primary key doubles as the lookup index
+competition_teams = Table(
+    'competition_teams',
+    Base.metadata,
+    Column('competition', String(50), primary_key=True),
+    Column('season', String(10), primary_key=True),
+    Column('team_id', Integer, ForeignKey('teams.id'), primary_key=True),
+    Index('ix_competition_teams_team_id', 'team_id')
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class TeamModel(Base):
     """Team database model"""
@@ -39,8 +56,19 @@ class DrawModel(Base):
     competition = Column(String(50), nullable=False)
     season = Column(String(10), nullable=False)
     is_valid = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set client side too so keyset cursors compare with full precision on every dialect
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), default=_utcnow)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Packed storage: team ids in index order (uint32 LE) and 3-byte fixture records
+    fixture_team_ids = Column(LargeBinary, nullable=True)
+    fixtures_packed = Column(LargeBinary, nullable=True)
+
+    # Keyset pagination and latest lookups on (created_at, id)
+    __table_args__ = (
+        Index('ix_draws_created_at_id', 'created_at', 'id'),
+        Index('ix_draws_competition_created_at_id', 'competition', 'created_at', 'id'),
+        Index('ix_draws_competition_season_created_at_id', 'competition', 'season', 'created_at', 'id'),
+    )
 
     # Relationships
     teams = relationship('TeamModel', secondary=draw_teams, back_populates='draws')
@@ -52,7 +80,7 @@ class FixtureModel(Base):
     __tablename__ = 'fixtures'
 
     id = Column(Integer, primary_key=True, index=True)
-    draw_id = Column(Integer, ForeignKey('draws.id'), nullable=False)
+    draw_id = Column(Integer, ForeignKey('draws.id'), nullable=False, index=True)
     home_team_id = Column(Integer, ForeignKey('teams.id'), nullable=False)
     away_team_id = Column(Integer, ForeignKey('teams.id'), nullable=False)
     matchday = Column(Integer, nullable=True)
@@ -65,4 +93,17 @@ class FixtureModel(Base):
     # Relationships
     draw = relationship('DrawModel', back_populates='fixtures')
     home_team = relationship('TeamModel', foreign_keys=[home_team_id], back_populates='home_fixtures')
-    away_team = relationship('TeamModel', foreign_keys=[away_team_id], back_populates='away_fixtures')
\ No newline at end of file
+    away_team = relationship('TeamModel', foreign_keys=[away_team_id], back_populates='away_fixtures')
+
+
+class IdempotencyKeyModel(Base):
+    """Response stored for a request sent with an Idempotency-Key"""
+    __tablename__ = 'idempotency_keys'
+
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=False)
+    media_type = Column(String(100), nullable=False)
+    body = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,69 @@
+# Per-request SQL execution timing
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statement texts are cut to keep reports readable
+MAX_STATEMENT_LENGTH = 200
+
+
+@dataclass
+class QueryTimings:
+    """Statements executed while recording, with their cursor execution time"""
+    statements: List[Tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def total_time(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def by_statement(self) -> List[Tuple[str, int, float]]:
+        """(statement, executions, total seconds), slowest first"""
+        totals: Dict[str, List[float]] = {}
+        for statement, duration in self.statements:
+            totals.setdefault(statement, []).append(duration)
+        return sorted(
+            ((statement, len(durations), sum(durations)) for statement, durations in totals.items()),
+            key=lambda item: item[2],
+            reverse=True
+        )
+
+
+# Set only while a request is being profiled; the async greenlets inherit it
+_current: ContextVar[Optional[QueryTimings]] = ContextVar("query_timings", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timings = _current.get()
+    starts = conn.info.get("query_start")
+    if timings is not None and starts:
+        duration = time.perf_counter() - starts.pop()
+        timings.statements.append((" ".join(statement.split())[:MAX_STATEMENT_LENGTH], duration))
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryTimings]:
+    """Collect SQL timings of statements run in the current context"""
+    timings = QueryTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
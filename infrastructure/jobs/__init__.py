@@ -0,0 +1,4 @@
+from .store import FileJobStore
+from .runner import SimulationJobRunner
+
+__all__ = ['FileJobStore', 'SimulationJobRunner']
@@ -0,0 +1,209 @@
+import asyncio
+import os
+import secrets
+import socket
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional
+from loguru import logger
+from domain.entities import JobStatus, SimulationJob
+from domain.interfaces.services import SimulationJobService
+from application.services.simulation import run_simulation_chunk
+from .store import FileJobStore
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+class SimulationJobRunner(SimulationJobService):
+    """Runs simulation jobs on a local process pool, checkpointing after every chunk
+
+    Unfinished jobs found in the store are resumed from their completed chunks by whichever
+    server process claims them first, on start and on every heartbeat after it.
+    """
+
+    def __init__(self, store: FileJobStore, workers: int = 2):
+        self.store = store
+        self.workers = workers
+        # Unique per process, also across hosts sharing JOBS_DIR
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(4)}"
+        self._pool: Optional["ProcessPoolExecutor"] = None
+        self._running = False
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._jobs: Dict[str, SimulationJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    async def start(self) -> None:
+        """Resume unclaimed unfinished jobs; the worker pool is created with the first job"""
+        self._running = True
+        await self._resume_unclaimed()
+        self._heartbeat = asyncio.create_task(self._keep_claims(), name="simulation-heartbeat")
+
+    async def stop(self) -> None:
+        """Stop running jobs and release them, their last checkpoint is resumed by the next claimant"""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        for job_id in self._tasks:
+            await asyncio.to_thread(self.store.release, job_id, self.owner)
+        self._tasks.clear()
+        self._running = False
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def submit(self, job: SimulationJob) -> SimulationJob:
+        if not self._running:
+            raise RuntimeError("Simulation job runner is not running")
+
+        job.created_at = job.updated_at = datetime.now(timezone.utc)
+        # Claimed before it is written, so no other process resumes it as unfinished
+        if not await asyncio.to_thread(self.store.claim, job.id, self.owner):
+            raise RuntimeError(f"Simulation job {job.id} is already claimed")
+        await asyncio.to_thread(self.store.save, job)
+        self._launch(job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[SimulationJob]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = await asyncio.to_thread(self.store.load, job_id)
+        return job
+
+    async def watch(self, job_id: str, heartbeat: float = 15.0) -> AsyncIterator[SimulationJob]:
+        """Yield the job on every checkpoint, and at least every `heartbeat` seconds, until it finishes"""
+        while True:
+            changed = self._changed.get(job_id)
+            job = await self.get(job_id)
+            if job is None:
+                return
+            yield job
+            if job.is_finished or changed is None:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), heartbeat)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _resume_unclaimed(self) -> None:
+        for listed in await asyncio.to_thread(self.store.list_unfinished):
+            if listed.id in self._tasks or not await asyncio.to_thread(self.store.claim, listed.id, self.owner):
+                continue
+            # The previous owner may have finished it between listing and claiming
+            job = await asyncio.to_thread(self.store.load, listed.id)
+            if job is None or job.is_finished:
+                await asyncio.to_thread(self.store.release, listed.id, self.owner)
+                continue
+            logger.info(f"Resuming simulation job {job.id} at {job.completed}/{job.iterations}")
+            self._launch(job)
+
+    async def _keep_claims(self) -> None:
+        """Refresh the locks of running jobs and pick up jobs whose owner stopped"""
+        while True:
+            await asyncio.sleep(self.store.claim_ttl / 3)
+            try:
+                for job_id, task in list(self._tasks.items()):
+                    if not await asyncio.to_thread(self.store.refresh_claim, job_id, self.owner):
+                        logger.warning(f"Lost the claim on simulation job {job_id}, stopping it")
+                        task.cancel()
+                        self._forget(job_id)
+                await self._resume_unclaimed()
+            except Exception as e:
+                logger.error(f"Simulation job heartbeat failed: {e}")
+
+    def _executor(self) -> "ProcessPoolExecutor":
+        if self._pool is None:
+            # Imported here: most server processes never run a simulation
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Spawned workers do not inherit the server's event loop, threads or connections
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def _launch(self, job: SimulationJob) -> None:
+        self._jobs[job.id] = job
+        self._changed[job.id] = asyncio.Event()
+        self._tasks[job.id] = asyncio.create_task(self._run(job), name=f"simulation-{job.id}")
+
+    def _notify(self, job: SimulationJob) -> None:
+        changed = self._changed.get(job.id)
+        self._changed[job.id] = asyncio.Event()
+        if changed is not None:
+            changed.set()
+
+    async def _checkpoint(self, job: SimulationJob) -> None:
+        job.updated_at = datetime.now(timezone.utc)
+        await asyncio.to_thread(self.store.save, job)
+        self._notify(job)
+
+    async def _run(self, job: SimulationJob) -> None:
+        loop = asyncio.get_running_loop()
+        teams = [
+            {
+                "id": team.id,
+                "name": team.name,
+                "country": team.country,
+                "pot": team.pot,
+                "coefficient": team.coefficient
+            }
+            for team in job.teams
+        ]
+        pending = iter(job.pending_chunks())
+        in_flight: Dict[asyncio.Future, int] = {}
+
+        def submit_next() -> None:
+            chunk = next(pending, None)
+            if chunk is None:
+                return
+            future = loop.run_in_executor(
+                self._executor(),
+                run_simulation_chunk,
+                job.competition,
+                job.season,
+                teams,
+                job.chunk_iterations(chunk),
+                job.chunk_seed(chunk)
+            )
+            in_flight[future] = chunk
+
+        job.status = JobStatus.RUNNING
+        await self._checkpoint(job)
+
+        try:
+            # Keep every worker busy, further chunks are submitted as earlier ones finish
+            for _ in range(self.workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    job.merge_chunk(in_flight.pop(future), future.result())
+                    submit_next()
+                await self._checkpoint(job)
+
+            job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            for future in in_flight:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Simulation job {job.id} failed: {e}")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+
+        await self._checkpoint(job)
+        await asyncio.to_thread(self.store.release, job.id, self.owner)
+        self._forget(job.id)
+
+    def _forget(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+        self._tasks.pop(job_id, None)
+        self._changed.pop(job_id, None)
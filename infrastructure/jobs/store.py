@@ -0,0 +1,151 @@
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import orjson
+from domain.entities import JobStatus, SimulationJob, Team
+
+
+class FileJobStore:
+    """Checkpoints simulation jobs as one JSON file per job
+
+    A process runs a job only while it holds the job's lock file, created with O_EXCL and
+    kept fresh by touching it. A lock not touched for `claim_ttl` seconds belongs to a
+    stopped process and can be taken over.
+    """
+
+    def __init__(self, directory: str, claim_ttl: float = 60.0):
+        self.directory = Path(directory)
+        self.claim_ttl = claim_ttl
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def _lock_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.lock"
+
+    def claim(self, job_id: str, owner: str) -> bool:
+        """Take the job's lock, or a stale one left behind; False if another process holds it"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._lock_path(job_id)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            age = None
+        if age is not None:
+            if age < self.claim_ttl:
+                return False
+            # Renaming is atomic, only one of the processes taking over a stale lock removes it
+            stale = path.with_name(f"{path.name}.{owner}.stale")
+            try:
+                os.rename(path, stale)
+            except FileNotFoundError:
+                return False
+            os.unlink(stale)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(owner)
+        return True
+
+    def refresh_claim(self, job_id: str, owner: str) -> bool:
+        """Heartbeat of a held lock; False if it was taken over in the meantime"""
+        if not self.owns(job_id, owner):
+            return False
+        os.utime(self._lock_path(job_id))
+        return True
+
+    def release(self, job_id: str, owner: str) -> None:
+        if self.owns(job_id, owner):
+            self._lock_path(job_id).unlink(missing_ok=True)
+
+    def owns(self, job_id: str, owner: str) -> bool:
+        try:
+            return self._lock_path(job_id).read_text() == owner
+        except FileNotFoundError:
+            return False
+
+    def save(self, job: SimulationJob) -> None:
+        """Write the job atomically, a crash leaves the previous checkpoint intact"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(self._to_payload(job)))
+            os.replace(tmp_path, self._path(job.id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, job_id: str) -> Optional[SimulationJob]:
+        path = self._path(job_id)
+        if not path.is_file():
+            return None
+        return self._from_payload(orjson.loads(path.read_bytes()))
+
+    def list_unfinished(self) -> List[SimulationJob]:
+        """Jobs that were queued or running when the process stopped"""
+        if not self.directory.is_dir():
+            return []
+        jobs = [self._from_payload(orjson.loads(path.read_bytes())) for path in self.directory.glob("*.json")]
+        return [job for job in jobs if not job.is_finished]
+
+    @staticmethod
+    def _to_payload(job: SimulationJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "competition": job.competition,
+            "season": job.season,
+            "teams": [
+                {
+                    "id": team.id,
+                    "name": team.name,
+                    "country": team.country,
+                    "pot": team.pot,
+                    "coefficient": team.coefficient,
+                    "logo_url": team.logo_url
+                }
+                for team in job.teams
+            ],
+            "iterations": job.iterations,
+            "chunk_size": job.chunk_size,
+            "seed": job.seed,
+            "status": job.status.value,
+            "completed_chunks": sorted(job.completed_chunks),
+            "completed": job.completed,
+            "succeeded": job.succeeded,
+            "failed": job.failed,
+            "valid": job.valid,
+            "pair_counts": job.pair_counts,
+            "error": job.error,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "updated_at": job.updated_at.isoformat() if job.updated_at else None
+        }
+
+    @staticmethod
+    def _from_payload(payload: Dict[str, Any]) -> SimulationJob:
+        created_at = payload.get("created_at")
+        updated_at = payload.get("updated_at")
+        return SimulationJob(
+            id=payload["id"],
+            competition=payload["competition"],
+            season=payload["season"],
+            teams=[Team(**team) for team in payload["teams"]],
+            iterations=payload["iterations"],
+            chunk_size=payload["chunk_size"],
+            seed=payload["seed"],
+            status=JobStatus(payload["status"]),
+            completed_chunks=set(payload["completed_chunks"]),
+            completed=payload["completed"],
+            succeeded=payload["succeeded"],
+            failed=payload["failed"],
+            valid=payload["valid"],
+            pair_counts=payload["pair_counts"],
+            error=payload.get("error"),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None
+        )
@@ -1,18 +1,30 @@
-from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import select, insert, update, delete, desc, func, or_, and_, case
 from sqlalchemy.orm import selectinload
-from domain.entities import Draw
+from domain.entities import Draw, DrawSummary, Team
 from domain.value_objects import CompetitionType
 from domain.interfaces.repositories import DrawRepository
-from infrastructure.database.models import DrawModel
+from infrastructure.database.connection import CacheInvalidatingSession
+from infrastructure.database.models import DrawModel, FixtureModel, TeamModel, draw_teams
 from infrastructure.repositories.mappers import DrawMapper
+from infrastructure.repositories.packed_fixtures import FIXTURE_RECORD_SIZE, can_pack
+from infrastructure.repositories.team_repository import TeamRepositoryImpl, add_competition_members
+from infrastructure.cache import DRAW_RESPONSES_NAMESPACE, VALIDATION_NAMESPACE
+from core.config import settings
+from core.exceptions import BusinessRuleException
+
+# Column order used for PostgreSQL COPY of fixtures
+FIXTURE_COPY_COLUMNS = (
+    'draw_id', 'home_team_id', 'away_team_id', 'matchday',
+    'scheduled_date', 'status', 'home_score', 'away_score'
+)
 
 
 class DrawRepositoryImpl(DrawRepository):
     """Implementation of Draw repository using SQLAlchemy"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: CacheInvalidatingSession):
         self.session = session
         self.mapper = DrawMapper()
 
@@ -30,6 +42,52 @@ class DrawRepositoryImpl(DrawRepository):
             return self.mapper.to_entity(draw_model)
         return None
 
+    async def get_lightweight(self, draw_id: int) -> Optional[Draw]:
+        """Get draw by ID from column projections, skipping ORM hydration"""
+        result = await self.session.execute(
+            select(
+                DrawModel.id,
+                DrawModel.competition,
+                DrawModel.season,
+                DrawModel.is_valid,
+                DrawModel.created_at,
+                DrawModel.completed_at,
+                DrawModel.fixture_team_ids,
+                DrawModel.fixtures_packed
+            ).where(DrawModel.id == draw_id)
+        )
+        draw_row = result.one_or_none()
+        if draw_row is None:
+            return None
+
+        team_rows = await self.session.execute(
+            select(
+                TeamModel.id,
+                TeamModel.name,
+                TeamModel.country,
+                TeamModel.pot,
+                TeamModel.coefficient,
+                TeamModel.logo_url
+            )
+            .join(draw_teams, draw_teams.c.team_id == TeamModel.id)
+            .where(draw_teams.c.draw_id == draw_id)
+        )
+        if draw_row.fixtures_packed is not None:
+            return self.mapper.from_rows(draw_row, team_rows.all(), [])
+
+        fixture_rows = await self.session.execute(
+            select(
+                FixtureModel.id,
+                FixtureModel.home_team_id,
+                FixtureModel.away_team_id,
+                FixtureModel.matchday
+            )
+            .where(FixtureModel.draw_id == draw_id)
+            .order_by(FixtureModel.id)
+        )
+
+        return self.mapper.from_rows(draw_row, team_rows.all(), fixture_rows.all())
+
     async def get_by_competition_and_season(
             self, competition: CompetitionType, season: str
     ) -> Optional[Draw]:
@@ -50,23 +108,205 @@ class DrawRepositoryImpl(DrawRepository):
         return None
 
     async def save(self, draw: Draw) -> Draw:
-        """Save a draw"""
-        draw_model = self.mapper.to_model(draw)
+        """Save a draw with its team links and fixtures, one bulk statement per table"""
+        packed = settings.DRAW_FIXTURE_STORAGE == "packed" and can_pack(draw)
+        values = self.mapper.to_row(draw, packed=packed)
+        created_at = None
 
         if draw.id:
-            # Update existing
-            existing = await self.session.get(DrawModel, draw.id)
-            if existing:
-                for key, value in draw_model.__dict__.items():
-                    if not key.startswith('_'):
-                        setattr(existing, key, value)
-                draw_model = existing
-        else:
+            # Update existing and replace its children
+            result = await self.session.execute(
+                update(DrawModel)
+                .where(DrawModel.id == draw.id)
+                .values(**values)
+                .returning(DrawModel.created_at)
+            )
+            created_at = result.scalar_one_or_none()
+            if created_at is not None:
+                await self.session.execute(
+                    delete(FixtureModel).where(FixtureModel.draw_id == draw.id)
+                )
+                await self.session.execute(
+                    delete(draw_teams).where(draw_teams.c.draw_id == draw.id)
+                )
+                self._invalidate_cached(draw.id)
+
+        if created_at is None:
             # Create new
-            self.session.add(draw_model)
+            if draw.id:
+                values["id"] = draw.id
+            result = await self.session.execute(
+                insert(DrawModel).values(**values).returning(DrawModel.id, DrawModel.created_at)
+            )
+            draw.id, created_at = result.one()
+
+        draw.created_at = created_at
+
+        await self._insert_children([draw], {draw.id} if packed else set())
+
+        return draw
+
+    async def save_many(self, draws: List[Draw]) -> List[Draw]:
+        """Insert new draws in bulk, one statement per table for the whole batch"""
+        if not draws:
+            return draws
+
+        now = datetime.now(timezone.utc)
+        packed_ids: Set[int] = set()
+        with_ids, without_ids = [], []
+
+        for draw in draws:
+            draw.created_at = draw.created_at or now
+            packed = settings.DRAW_FIXTURE_STORAGE == "packed" and can_pack(draw)
+            row = {**self.mapper.to_row(draw, packed=packed), "created_at": draw.created_at}
+            if draw.id:
+                with_ids.append({**row, "id": draw.id})
+                if packed:
+                    packed_ids.add(draw.id)
+            else:
+                without_ids.append((draw, row, packed))
+
+        if with_ids:
+            await self.session.execute(insert(DrawModel), with_ids)
+
+        if without_ids:
+            result = await self.session.execute(
+                insert(DrawModel).returning(DrawModel.id, sort_by_parameter_order=True),
+                [row for _, row, _ in without_ids]
+            )
+            for (draw, _, packed), draw_id in zip(without_ids, result.scalars().all()):
+                draw.id = draw_id
+                if packed:
+                    packed_ids.add(draw_id)
+
+        await self._insert_children(draws, packed_ids)
+
+        return draws
+
+    async def save_results(self, draws: List[Draw]) -> List[Draw]:
+        """Store fixture scores and status of stored draws with bulk updates by primary key
+
+        Packed fixtures cannot hold scores, those draws are moved to fixture rows.
+        """
+        updates = []
+        unpacked = []
+        for draw in draws:
+            if any(fixture.id is None for fixture in draw.fixtures):
+                unpacked.append(draw)
+                continue
+            updates.extend(
+                {
+                    "id": fixture.id,
+                    "status": fixture.status.value if hasattr(fixture.status, 'value') else fixture.status,
+                    "home_score": fixture.home_score,
+                    "away_score": fixture.away_score
+                }
+                for fixture in draw.fixtures
+            )
+
+        if updates:
+            await self.session.execute(update(FixtureModel), updates)
+
+        if unpacked:
+            draw_ids = [draw.id for draw in unpacked]
+            await self.session.execute(
+                update(DrawModel)
+                .where(DrawModel.id.in_(draw_ids))
+                .values(fixtures_packed=None, fixture_team_ids=None)
+            )
+            await self.session.execute(
+                delete(FixtureModel).where(FixtureModel.draw_id.in_(draw_ids))
+            )
+            await self._insert_fixtures(unpacked)
+
+        for draw in draws:
+            self._invalidate_cached(draw.id)
+
+        return draws
+
+    async def _insert_children(self, draws: List[Draw], packed_ids: Set[int]) -> None:
+        """Insert teams, team links, memberships and row-stored fixtures of saved draws"""
+        await self.save_teams([team for draw in draws for team in draw.teams])
 
-        await self.session.flush()
-        return self.mapper.to_entity(draw_model)
+        links = [
+            {"draw_id": draw.id, "team_id": team.id}
+            for draw in draws
+            for team in draw.teams
+        ]
+        if links:
+            await self.session.execute(insert(draw_teams), links)
+
+        # Drawn teams are the competition's teams for that season
+        members: Dict[Tuple[str, str], Set[int]] = {}
+        for draw in draws:
+            members.setdefault((draw.competition, draw.season), set()).update(
+                team.id for team in draw.teams
+            )
+        for (competition, season), team_ids in members.items():
+            await add_competition_members(self.session, competition, season, sorted(team_ids))
+
+        row_stored = [draw for draw in draws if draw.fixtures and draw.id not in packed_ids]
+        if row_stored:
+            await self._insert_fixtures(row_stored)
+
+    def _invalidate_cached(self, draw_id: int) -> None:
+        """Drop cached responses and validation results of a changed draw once committed"""
+        self.session.invalidate_after_commit(DRAW_RESPONSES_NAMESPACE, f"{draw_id}:")
+        self.session.invalidate_after_commit(VALIDATION_NAMESPACE, f"{draw_id}:")
+
+    async def save_teams(self, teams: List[Team]) -> None:
+        """Upsert the drawn teams, so stored draws read back the teams they were drawn with
+
+        A team name already stored under another id is rejected, teams.name is unique.
+        """
+        teams_by_id = {team.id: team for team in teams}
+        if not teams_by_id:
+            return
+
+        ids_by_name: Dict[str, int] = {}
+        for team in teams_by_id.values():
+            other_id = ids_by_name.setdefault(team.name, team.id)
+            if other_id != team.id:
+                raise BusinessRuleException(f"Teams {other_id} and {team.id} are both named {team.name}")
+
+        result = await self.session.execute(
+            select(TeamModel.id, TeamModel.name).where(TeamModel.name.in_(list(ids_by_name)))
+        )
+        for stored_id, name in result.all():
+            if ids_by_name[name] != stored_id:
+                raise BusinessRuleException(
+                    f"Team {ids_by_name[name]} is named {name}, which is stored for team {stored_id}"
+                )
+
+        await TeamRepositoryImpl(self.session).save_many(list(teams_by_id.values()))
+
+    async def _insert_fixtures(self, draws: List[Draw]) -> None:
+        """Bulk insert fixtures of the draws, via COPY on PostgreSQL when enabled"""
+        fixtures = [fixture for draw in draws for fixture in draw.fixtures]
+        rows = [
+            self.mapper.fixture_mapper.to_row(fixture, draw.id)
+            for draw in draws
+            for fixture in draw.fixtures
+        ]
+
+        dialect = self.session.get_bind().dialect
+        if settings.DRAW_SAVE_USE_COPY and dialect.name == 'postgresql' and dialect.driver == 'asyncpg':
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                FixtureModel.__tablename__,
+                records=[tuple(row[column] for column in FIXTURE_COPY_COLUMNS) for row in rows],
+                columns=FIXTURE_COPY_COLUMNS
+            )
+            return
+
+        # insertmanyvalues batches this into a single statement and returns ids in order
+        result = await self.session.execute(
+            insert(FixtureModel).returning(FixtureModel.id, sort_by_parameter_order=True),
+            rows
+        )
+        for fixture, fixture_id in zip(fixtures, result.scalars().all()):
+            fixture.id = fixture_id
 
     async def get_latest(self, competition: CompetitionType) -> Optional[Draw]:
         """Get the latest draw for a competition"""
@@ -82,4 +322,62 @@ class DrawRepositoryImpl(DrawRepository):
 
         if draw_model:
             return self.mapper.to_entity(draw_model)
-        return None
\ No newline at end of file
+        return None
+
+    async def get_latest_id(self, competition: CompetitionType) -> Optional[int]:
+        """Get the id of the latest draw for a competition without loading it"""
+        result = await self.session.execute(
+            select(DrawModel.id)
+            .where(DrawModel.competition == competition.value)
+            .order_by(desc(DrawModel.created_at), desc(DrawModel.id))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_summaries(
+            self,
+            competition: Optional[CompetitionType] = None,
+            season: Optional[str] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: int = 50
+    ) -> List[DrawSummary]:
+        """List draw summaries newest first using a (created_at, id) keyset cursor"""
+        fixture_count = case(
+            (
+                DrawModel.fixtures_packed.isnot(None),
+                func.length(DrawModel.fixtures_packed) / FIXTURE_RECORD_SIZE
+            ),
+            else_=(
+                select(func.count(FixtureModel.id))
+                .where(FixtureModel.draw_id == DrawModel.id)
+                .scalar_subquery()
+            )
+        )
+
+        query = select(
+            DrawModel.id,
+            DrawModel.competition,
+            DrawModel.season,
+            DrawModel.is_valid,
+            DrawModel.created_at,
+            fixture_count.label('fixture_count')
+        )
+
+        if competition is not None:
+            query = query.where(DrawModel.competition == competition.value)
+        if season is not None:
+            query = query.where(DrawModel.season == season)
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.where(
+                or_(
+                    DrawModel.created_at < after_created_at,
+                    and_(DrawModel.created_at == after_created_at, DrawModel.id < after_id)
+                )
+            )
+
+        result = await self.session.execute(
+            query.order_by(desc(DrawModel.created_at), desc(DrawModel.id)).limit(limit)
+        )
+
+        return [DrawSummary(*row) for row in result.all()]
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select, insert, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.entities import StoredResponse
+from domain.interfaces.repositories import IdempotencyRepository
+from infrastructure.database.models import IdempotencyKeyModel
+from core.exceptions import ConflictException
+
+
+class IdempotencyRepositoryImpl(IdempotencyRepository):
+    """Responses stored per Idempotency-Key, written in the request session's transaction"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        """Stored response of a key, None if unknown or expired"""
+        result = await self.session.execute(
+            select(
+                IdempotencyKeyModel.fingerprint,
+                IdempotencyKeyModel.status_code,
+                IdempotencyKeyModel.media_type,
+                IdempotencyKeyModel.body
+            ).where(
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at > datetime.now(timezone.utc)
+            )
+        )
+        row = result.one_or_none()
+        return StoredResponse(*row) if row is not None else None
+
+    async def add(self, key: str, response: StoredResponse, ttl: int) -> None:
+        """Store a response; raises ConflictException when the key is already stored"""
+        now = datetime.now(timezone.utc)
+        # An expired row of the same key would block the insert
+        await self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at <= now
+            )
+        )
+        try:
+            await self.session.execute(
+                insert(IdempotencyKeyModel).values(
+                    key=key,
+                    fingerprint=response.fingerprint,
+                    status_code=response.status_code,
+                    media_type=response.media_type,
+                    body=response.body,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=ttl)
+                )
+            )
+        except IntegrityError:
+            raise ConflictException(f"Idempotency-Key {key} is already stored")
+
+    async def purge_expired(self) -> None:
+        """Delete every expired key"""
+        await self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
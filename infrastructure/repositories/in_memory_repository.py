@@ -1,31 +1,65 @@
-from typing import List, Optional, Dict
-from domain.entities import Team, Draw
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Set, Tuple
+from domain.entities import Team, Draw, DrawSummary
 from domain.value_objects import CompetitionType
 from domain.interfaces.repositories import TeamRepository, DrawRepository
 
+# (created_at, id) ordering key shared by the draw indexes
+DrawKey = Tuple[datetime, int]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Aware UTC datetime; naive values, as SQLite returns them, are taken to be UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 
 class InMemoryTeamRepository(TeamRepository):
-    """In-memory implementation of Team repository for testing"""
+    """In-memory implementation of Team repository, safe to share between threads"""
 
     def __init__(self):
         self.teams: Dict[int, Team] = {}
+        self.memberships: Dict[Tuple[str, str], Set[int]] = {}
+        self.seasons: Dict[str, Set[str]] = {}
         self.next_id = 1
+        self._lock = threading.RLock()
 
     async def get_by_id(self, team_id: int) -> Optional[Team]:
         return self.teams.get(team_id)
 
-    async def get_by_competition(self, competition: CompetitionType) -> List[Team]:
-        # For simplicity, return all teams
-        return list(self.teams.values())
+    async def get_by_competition(
+            self, competition: CompetitionType, season: Optional[str] = None
+    ) -> List[Team]:
+        with self._lock:
+            if season is None:
+                seasons = self.seasons.get(competition.value)
+                if not seasons:
+                    return []
+                season = max(seasons)
+            team_ids = sorted(self.memberships.get((competition.value, season), ()))
+            return [self.teams[team_id] for team_id in team_ids if team_id in self.teams]
+
+    async def add_to_competition(
+            self, competition: CompetitionType, season: str, team_ids: List[int]
+    ) -> None:
+        with self._lock:
+            self.memberships.setdefault((competition.value, season), set()).update(team_ids)
+            self.seasons.setdefault(competition.value, set()).add(season)
 
     async def get_all(self) -> List[Team]:
-        return list(self.teams.values())
+        with self._lock:
+            return list(self.teams.values())
 
     async def save(self, team: Team) -> Team:
-        if not team.id:
-            team.id = self.next_id
-            self.next_id += 1
-        self.teams[team.id] = team
+        with self._lock:
+            if not team.id:
+                team.id = self.next_id
+            self.next_id = max(self.next_id, team.id + 1)
+            self.teams[team.id] = team
         return team
 
     async def save_many(self, teams: List[Team]) -> List[Team]:
@@ -36,42 +70,143 @@ class InMemoryTeamRepository(TeamRepository):
         return saved_teams
 
     async def delete(self, team_id: int) -> bool:
-        if team_id in self.teams:
-            del self.teams[team_id]
-            return True
-        return False
+        with self._lock:
+            if team_id in self.teams:
+                del self.teams[team_id]
+                for team_ids in self.memberships.values():
+                    team_ids.discard(team_id)
+                return True
+            return False
 
 
 class InMemoryDrawRepository(DrawRepository):
-    """In-memory implementation of Draw repository for testing"""
+    """In-memory Draw repository with secondary indexes and optional LRU bound
 
-    def __init__(self):
-        self.draws: Dict[int, Draw] = {}
+    Draws are indexed by (competition, season) and kept ordered by (created_at, id)
+    per competition and overall, so latest lookups and listings avoid full scans.
+    """
+
+    def __init__(self, max_draws: Optional[int] = None):
+        self.max_draws = max_draws
+        self.draws: OrderedDict[int, Draw] = OrderedDict()
         self.next_id = 1
+        # Index values per draw id: (ordering key, competition, season)
+        self._entries: Dict[int, Tuple[DrawKey, str, str]] = {}
+        # Insertion-ordered id sets per (competition, season)
+        self._by_competition_season: Dict[Tuple[str, str], Dict[int, None]] = {}
+        self._by_competition: Dict[str, List[DrawKey]] = {}
+        self._ordered: List[DrawKey] = []
+        self._lock = threading.RLock()
 
     async def get_by_id(self, draw_id: int) -> Optional[Draw]:
-        return self.draws.get(draw_id)
+        with self._lock:
+            draw = self.draws.get(draw_id)
+            if draw is not None:
+                self.draws.move_to_end(draw_id)
+            return draw
+
+    async def get_lightweight(self, draw_id: int) -> Optional[Draw]:
+        return await self.get_by_id(draw_id)
 
     async def get_by_competition_and_season(
             self, competition: CompetitionType, season: str
     ) -> Optional[Draw]:
-        for draw in self.draws.values():
-            if draw.competition == competition.value and draw.season == season:
-                return draw
-        return None
+        with self._lock:
+            draw_ids = self._by_competition_season.get((competition.value, season))
+            if not draw_ids:
+                return None
+            return self.draws[next(iter(draw_ids))]
 
     async def save(self, draw: Draw) -> Draw:
-        if not draw.id:
-            draw.id = self.next_id
-            self.next_id += 1
-        self.draws[draw.id] = draw
+        with self._lock:
+            if not draw.id:
+                draw.id = self.next_id
+            self.next_id = max(self.next_id, draw.id + 1)
+            if draw.created_at is None:
+                draw.created_at = datetime.now(timezone.utc)
+
+            if draw.id in self.draws:
+                self._unindex(draw.id)
+            self.draws[draw.id] = draw
+            self.draws.move_to_end(draw.id)
+            self._index(draw)
+
+            while self.max_draws is not None and len(self.draws) > self.max_draws:
+                evicted_id, _ = self.draws.popitem(last=False)
+                self._unindex(evicted_id)
         return draw
 
+    async def save_many(self, draws: List[Draw]) -> List[Draw]:
+        return [await self.save(draw) for draw in draws]
+
+    async def save_results(self, draws: List[Draw]) -> List[Draw]:
+        return await self.save_many(draws)
+
     async def get_latest(self, competition: CompetitionType) -> Optional[Draw]:
-        competition_draws = [
-            d for d in self.draws.values()
-            if d.competition == competition.value
-        ]
-        if competition_draws:
-            return max(competition_draws, key=lambda d: d.created_at or 0)
-        return None
\ No newline at end of file
+        with self._lock:
+            keys = self._by_competition.get(competition.value)
+            if not keys:
+                return None
+            return self.draws[keys[-1][1]]
+
+    async def get_latest_id(self, competition: CompetitionType) -> Optional[int]:
+        latest = await self.get_latest(competition)
+        return latest.id if latest else None
+
+    async def list_summaries(
+            self,
+            competition: Optional[CompetitionType] = None,
+            season: Optional[str] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: int = 50
+    ) -> List[DrawSummary]:
+        with self._lock:
+            if competition is not None:
+                keys = self._by_competition.get(competition.value, [])
+            else:
+                keys = self._ordered
+
+            # Newest first, starting below the cursor
+            end = len(keys)
+            if after is not None:
+                end = bisect_left(keys, (_as_utc(after[0]), after[1]))
+            summaries = []
+            for index in range(end - 1, -1, -1):
+                draw = self.draws[keys[index][1]]
+                if season is not None and draw.season != season:
+                    continue
+                summaries.append(DrawSummary(
+                    id=draw.id,
+                    competition=draw.competition,
+                    season=draw.season,
+                    is_valid=draw.is_valid,
+                    created_at=draw.created_at,
+                    fixture_count=len(draw.fixtures)
+                ))
+                if len(summaries) == limit:
+                    break
+            return summaries
+
+    def _index(self, draw: Draw) -> None:
+        # Naive and aware datetimes do not compare, keys are always aware
+        key = (_as_utc(draw.created_at), draw.id)
+        self._entries[draw.id] = (key, draw.competition, draw.season)
+        self._by_competition_season.setdefault((draw.competition, draw.season), {})[draw.id] = None
+        insort(self._by_competition.setdefault(draw.competition, []), key)
+        insort(self._ordered, key)
+
+    def _unindex(self, draw_id: int) -> None:
+        # Uses the values recorded at index time, the entity may have been mutated since
+        key, competition, season = self._entries.pop(draw_id)
+
+        draw_ids = self._by_competition_season[(competition, season)]
+        del draw_ids[draw_id]
+        if not draw_ids:
+            del self._by_competition_season[(competition, season)]
+
+        keys = self._by_competition[competition]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            del self._by_competition[competition]
+
+        del self._ordered[bisect_left(self._ordered, key)]
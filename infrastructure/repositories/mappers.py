@@ -1,5 +1,11 @@
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
 from domain.entities import Team, Draw, Fixture
+from domain.entities.fixture import FixtureStatus
 from infrastructure.database.models import TeamModel, DrawModel, FixtureModel
+from infrastructure.repositories.packed_fixtures import (
+    pack_fixtures, pack_team_ids, unpack_fixtures, unpack_team_ids
+)
 
 
 class TeamMapper:
@@ -29,6 +35,48 @@ class TeamMapper:
             logo_url=entity.logo_url
         )
 
+    def to_row(self, entity: Team) -> Dict[str, Any]:
+        """Convert entity to a column dict for bulk statements"""
+        return {
+            "id": entity.id,
+            "name": entity.name,
+            "country": entity.country,
+            "pot": entity.pot,
+            "coefficient": entity.coefficient,
+            "logo_url": entity.logo_url
+        }
+
+    def from_row(self, row: Sequence[Any]) -> Team:
+        """Convert a (id, name, country, pot, coefficient, logo_url) row to an entity"""
+        team_id, name, country, pot, coefficient, logo_url = row
+        return Team(
+            id=team_id, name=name, country=country, pot=pot, coefficient=coefficient,
+            logo_url=logo_url
+        )
+
+    def to_payload(self, entity: Team) -> Dict[str, Any]:
+        """Convert entity to a JSON-serializable dict for caching"""
+        return {
+            **self.to_row(entity),
+            "created_at": entity.created_at.isoformat() if entity.created_at else None,
+            "updated_at": entity.updated_at.isoformat() if entity.updated_at else None
+        }
+
+    def from_payload(self, payload: Dict[str, Any]) -> Team:
+        """Convert a cached dict back to an entity"""
+        created_at = payload.get("created_at")
+        updated_at = payload.get("updated_at")
+        return Team(
+            id=payload["id"],
+            name=payload["name"],
+            country=payload["country"],
+            pot=payload["pot"],
+            coefficient=payload["coefficient"],
+            logo_url=payload.get("logo_url"),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None
+        )
+
 
 class FixtureMapper:
     """Mapper for Fixture entity and model"""
@@ -41,7 +89,7 @@ class FixtureMapper:
             away_team_id=model.away_team_id,
             matchday=model.matchday,
             scheduled_date=model.scheduled_date,
-            status=model.status,
+            status=FixtureStatus(model.status) if model.status else FixtureStatus.SCHEDULED,
             home_score=model.home_score,
             away_score=model.away_score
         )
@@ -59,6 +107,29 @@ class FixtureMapper:
             away_score=entity.away_score
         )
 
+    def from_row(self, row: Sequence[Any]) -> Fixture:
+        """Convert a (id, home_team_id, away_team_id, matchday) row to an entity"""
+        fixture_id, home_team_id, away_team_id, matchday = row
+        return Fixture(
+            id=fixture_id,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            matchday=matchday
+        )
+
+    def to_row(self, entity: Fixture, draw_id: int) -> Dict[str, Any]:
+        """Convert entity to a column dict for bulk statements"""
+        return {
+            "draw_id": draw_id,
+            "home_team_id": entity.home_team_id,
+            "away_team_id": entity.away_team_id,
+            "matchday": entity.matchday,
+            "scheduled_date": entity.scheduled_date,
+            "status": entity.status.value if hasattr(entity.status, 'value') else entity.status,
+            "home_score": entity.home_score,
+            "away_score": entity.away_score
+        }
+
 
 class DrawMapper:
     """Mapper for Draw entity and model"""
@@ -70,7 +141,10 @@ class DrawMapper:
     def to_entity(self, model: DrawModel) -> Draw:
         """Convert model to entity"""
         teams = [self.team_mapper.to_entity(t) for t in model.teams]
-        fixtures = [self.fixture_mapper.to_entity(f) for f in model.fixtures]
+        if model.fixtures_packed is not None:
+            fixtures = self.unpack_fixtures(model.fixture_team_ids, model.fixtures_packed)
+        else:
+            fixtures = [self.fixture_mapper.to_entity(f) for f in model.fixtures]
 
         return Draw(
             id=model.id,
@@ -83,6 +157,31 @@ class DrawMapper:
             is_valid=model.is_valid
         )
 
+    def from_rows(
+            self,
+            draw_row: Sequence[Any],
+            team_rows: Sequence[Sequence[Any]],
+            fixture_rows: Sequence[Sequence[Any]]
+    ) -> Draw:
+        """Build an entity from column projections of the draw, its teams and fixtures"""
+        (draw_id, competition, season, is_valid, created_at, completed_at,
+         fixture_team_ids, fixtures_packed) = draw_row
+        if fixtures_packed is not None:
+            fixtures = self.unpack_fixtures(fixture_team_ids, fixtures_packed)
+        else:
+            fixtures = [self.fixture_mapper.from_row(row) for row in fixture_rows]
+
+        return Draw(
+            id=draw_id,
+            competition=competition,
+            season=season,
+            teams=[self.team_mapper.from_row(row) for row in team_rows],
+            fixtures=fixtures,
+            created_at=created_at,
+            completed_at=completed_at,
+            is_valid=is_valid
+        )
+
     def to_model(self, entity: Draw) -> DrawModel:
         """Convert entity to model"""
         return DrawModel(
@@ -91,4 +190,25 @@ class DrawMapper:
             season=entity.season,
             is_valid=entity.is_valid,
             completed_at=entity.completed_at
-        )
\ No newline at end of file
+        )
+
+    def to_row(self, entity: Draw, packed: bool = False) -> Dict[str, Any]:
+        """Convert entity to a column dict for bulk statements"""
+        row = {
+            "competition": entity.competition,
+            "season": entity.season,
+            "is_valid": entity.is_valid,
+            "completed_at": entity.completed_at,
+            "fixture_team_ids": None,
+            "fixtures_packed": None
+        }
+        if packed:
+            team_ids = [team.id for team in entity.teams]
+            index_by_id = {team_id: index for index, team_id in enumerate(team_ids)}
+            row["fixture_team_ids"] = pack_team_ids(team_ids)
+            row["fixtures_packed"] = pack_fixtures(entity.fixtures, index_by_id)
+        return row
+
+    def unpack_fixtures(self, fixture_team_ids: bytes, fixtures_packed: bytes) -> List[Fixture]:
+        """Decode packed fixture storage into entities"""
+        return unpack_fixtures(fixtures_packed, unpack_team_ids(fixture_team_ids))
@@ -0,0 +1,72 @@
+# Packed binary encoding of a draw's fixtures
+import struct
+from typing import Dict, List, Sequence, Tuple
+from domain.entities import Draw, Fixture
+from domain.entities.fixture import FixtureStatus
+
+# Per fixture: home team index, away team index, flags (bit 7 home flag, bits 0-3 matchday)
+FIXTURE_RECORD_SIZE = 3
+HOME_FLAG = 0x80
+MATCHDAY_MASK = 0x0F
+MAX_TEAMS = 256
+# Team ids are stored as uint32
+MAX_TEAM_ID = 2 ** 32 - 1
+
+
+def can_pack(draw: Draw) -> bool:
+    """Packed fixtures keep teams, home flag and matchday only"""
+    if len(draw.teams) > MAX_TEAMS:
+        return False
+
+    team_ids = {team.id for team in draw.teams}
+    if not all(isinstance(team_id, int) and 0 <= team_id <= MAX_TEAM_ID for team_id in team_ids):
+        return False
+    return all(
+        fixture.home_team_id in team_ids
+        and fixture.away_team_id in team_ids
+        and (fixture.matchday or 0) <= MATCHDAY_MASK
+        and fixture.scheduled_date is None
+        and fixture.home_score is None
+        and fixture.away_score is None
+        and fixture.status in (FixtureStatus.SCHEDULED, FixtureStatus.SCHEDULED.value)
+        for fixture in draw.fixtures
+    )
+
+
+def pack_team_ids(team_ids: Sequence[int]) -> bytes:
+    """Team ids in index order as little-endian uint32"""
+    return struct.pack(f"<{len(team_ids)}I", *team_ids)
+
+
+def unpack_team_ids(data: bytes) -> List[int]:
+    """Inverse of pack_team_ids"""
+    return list(struct.unpack(f"<{len(data) // 4}I", data))
+
+
+def pack_fixtures(fixtures: Sequence[Fixture], index_by_id: Dict[int, int]) -> bytes:
+    """Encode fixtures as 3-byte records referencing team indexes"""
+    data = bytearray(len(fixtures) * FIXTURE_RECORD_SIZE)
+    data[0::3] = bytes(index_by_id[f.home_team_id] for f in fixtures)
+    data[1::3] = bytes(index_by_id[f.away_team_id] for f in fixtures)
+    data[2::3] = bytes((HOME_FLAG if f.is_home else 0) | (f.matchday or 0) for f in fixtures)
+    return bytes(data)
+
+
+def unpack_fixture_arrays(data: bytes) -> Tuple[bytes, bytes, bytes]:
+    """Split packed fixtures into home index, away index and flag arrays"""
+    return data[0::3], data[1::3], data[2::3]
+
+
+def unpack_fixtures(data: bytes, team_ids: Sequence[int]) -> List[Fixture]:
+    """Decode packed fixtures back into entities"""
+    homes, aways, flags = unpack_fixture_arrays(data)
+    return [
+        Fixture(
+            home_team_id=team_ids[home],
+            away_team_id=team_ids[away],
+            matchday=(flag & MATCHDAY_MASK) or None,
+            is_home=bool(flag & HOME_FLAG)
+        )
+        for home, away, flag in zip(homes, aways, flags)
+    ]
+
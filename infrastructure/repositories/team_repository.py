@@ -1,17 +1,69 @@
-from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from typing import Dict, List, Optional
+import orjson
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
 from domain.entities import Team
 from domain.value_objects import CompetitionType
 from domain.interfaces.repositories import TeamRepository
-from infrastructure.database.models import TeamModel
+from infrastructure.database.connection import CacheInvalidatingSession
+from infrastructure.database.models import TeamModel, competition_teams
 from infrastructure.repositories.mappers import TeamMapper
+from infrastructure.cache import get_cache, TEAMS_NAMESPACE
+
+# Dialects supporting INSERT ... ON CONFLICT (id) DO UPDATE
+UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# Rows per multi-row upsert statement, keeps SQLite under its bound parameter limit
+UPSERT_BATCH_SIZE = 500
+
+UPDATABLE_COLUMNS = ('name', 'country', 'pot', 'coefficient', 'logo_url')
+
+RETURNING_COLUMNS = (
+    TeamModel.id, TeamModel.name, TeamModel.country, TeamModel.pot,
+    TeamModel.coefficient, TeamModel.logo_url, TeamModel.created_at, TeamModel.updated_at
+)
+
+
+async def add_competition_members(
+        session: CacheInvalidatingSession, competition: str, season: str, team_ids: List[int]
+) -> None:
+    """Insert competition membership rows, ignoring ones that already exist"""
+    if not team_ids:
+        return
+
+    rows = [
+        {"competition": competition, "season": season, "team_id": team_id}
+        for team_id in team_ids
+    ]
+
+    dialect_insert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is not None:
+        await session.execute(
+            dialect_insert(competition_teams).values(rows).on_conflict_do_nothing()
+        )
+    else:
+        result = await session.execute(
+            select(competition_teams.c.team_id).where(
+                competition_teams.c.competition == competition,
+                competition_teams.c.season == season,
+                competition_teams.c.team_id.in_(team_ids)
+            )
+        )
+        existing_ids = set(result.scalars().all())
+        missing = [row for row in rows if row["team_id"] not in existing_ids]
+        if missing:
+            await session.execute(insert(competition_teams), missing)
+
+    session.invalidate_after_commit(TEAMS_NAMESPACE)
 
 
 class TeamRepositoryImpl(TeamRepository):
     """Implementation of Team repository using SQLAlchemy"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: CacheInvalidatingSession):
         self.session = session
         self.mapper = TeamMapper()
 
@@ -26,14 +78,49 @@ class TeamRepositoryImpl(TeamRepository):
             return self.mapper.to_entity(team_model)
         return None
 
-    async def get_by_competition(self, competition: CompetitionType) -> List[Team]:
-        """Get teams by competition"""
-        # In a real implementation, you would filter by competition
-        # For now, return all teams
-        result = await self.session.execute(select(TeamModel))
-        team_models = result.scalars().all()
+    async def get_by_competition(
+            self, competition: CompetitionType, season: Optional[str] = None
+    ) -> List[Team]:
+        """Get teams by competition and season, latest season by default"""
+        payload = await get_cache().get_or_load(
+            TEAMS_NAMESPACE,
+            f"{competition.value}:{season or 'latest'}",
+            lambda: self._load_competition_payload(competition, season)
+        )
+        return [self.mapper.from_payload(item) for item in orjson.loads(payload)]
 
-        return [self.mapper.to_entity(model) for model in team_models]
+    async def _load_competition_payload(
+            self, competition: CompetitionType, season: Optional[str]
+    ) -> bytes:
+        """Query a competition's teams and serialize them for the cache"""
+        if season is None:
+            season_filter = (
+                select(func.max(competition_teams.c.season))
+                .where(competition_teams.c.competition == competition.value)
+                .scalar_subquery()
+            )
+        else:
+            season_filter = season
+
+        # Range scan on the (competition, season, team_id) primary key
+        result = await self.session.execute(
+            select(TeamModel)
+            .join(competition_teams, competition_teams.c.team_id == TeamModel.id)
+            .where(
+                competition_teams.c.competition == competition.value,
+                competition_teams.c.season == season_filter
+            )
+            .order_by(TeamModel.id)
+        )
+        teams = [self.mapper.to_entity(model) for model in result.scalars().all()]
+
+        return orjson.dumps([self.mapper.to_payload(team) for team in teams])
+
+    async def add_to_competition(
+            self, competition: CompetitionType, season: str, team_ids: List[int]
+    ) -> None:
+        """Register teams as members of a competition season"""
+        await add_competition_members(self.session, competition.value, season, team_ids)
 
     async def get_all(self) -> List[Team]:
         """Get all teams"""
@@ -44,34 +131,91 @@ class TeamRepositoryImpl(TeamRepository):
 
     async def save(self, team: Team) -> Team:
         """Save a team"""
-        team_model = self.mapper.to_model(team)
-
-        if team.id:
-            # Update existing
-            existing = await self.session.get(TeamModel, team.id)
-            if existing:
-                for key, value in team_model.__dict__.items():
-                    if not key.startswith('_'):
-                        setattr(existing, key, value)
-                team_model = existing
-        else:
-            # Create new
-            self.session.add(team_model)
-
-        await self.session.flush()
-        return self.mapper.to_entity(team_model)
+        saved_teams = await self.save_many([team])
+        return saved_teams[0]
 
     async def save_many(self, teams: List[Team]) -> List[Team]:
-        """Save multiple teams"""
-        saved_teams = []
-        for team in teams:
-            saved_team = await self.save(team)
-            saved_teams.append(saved_team)
-        return saved_teams
+        """Save multiple teams with bulk upserts"""
+        if not teams:
+            return []
+
+        # One row per id, the last occurrence wins; ON CONFLICT cannot touch a row twice
+        keyed = list({team.id: team for team in teams if team.id}.values())
+        new = [team for team in teams if not team.id]
+        saved: Dict[int, Team] = {}
+
+        if keyed:
+            dialect_insert = UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+            if dialect_insert is not None:
+                saved.update(await self._upsert(keyed, dialect_insert))
+            else:
+                saved.update(await self._merge(keyed))
+
+        new_teams = []
+        if new:
+            rows = []
+            for team in new:
+                row = self.mapper.to_row(team)
+                del row["id"]
+                rows.append(row)
+
+            result = await self.session.execute(
+                insert(TeamModel).returning(*RETURNING_COLUMNS, sort_by_parameter_order=True),
+                rows
+            )
+            new_teams = [self.mapper.to_entity(row) for row in result.all()]
+
+        self.session.invalidate_after_commit(TEAMS_NAMESPACE)
+
+        # Preserve the caller's order
+        new_iter = iter(new_teams)
+        return [saved[team.id] if team.id else next(new_iter) for team in teams]
+
+    async def _upsert(self, teams: List[Team], dialect_insert) -> Dict[int, Team]:
+        """INSERT ... ON CONFLICT (id) DO UPDATE in batches, returning the stored rows"""
+        saved: Dict[int, Team] = {}
+
+        for start in range(0, len(teams), UPSERT_BATCH_SIZE):
+            rows = [self.mapper.to_row(team) for team in teams[start:start + UPSERT_BATCH_SIZE]]
+            statement = dialect_insert(TeamModel).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[TeamModel.id],
+                set_={
+                    **{column: statement.excluded[column] for column in UPDATABLE_COLUMNS},
+                    'updated_at': func.now()
+                }
+            ).returning(*RETURNING_COLUMNS)
+
+            result = await self.session.execute(statement)
+            for row in result.all():
+                saved[row.id] = self.mapper.to_entity(row)
+
+        return saved
+
+    async def _merge(self, teams: List[Team]) -> Dict[int, Team]:
+        """Fallback for dialects without ON CONFLICT: bulk update existing, bulk insert the rest"""
+        result = await self.session.execute(
+            select(TeamModel.id).where(TeamModel.id.in_([team.id for team in teams]))
+        )
+        existing_ids = set(result.scalars().all())
+
+        to_update = [self.mapper.to_row(team) for team in teams if team.id in existing_ids]
+        to_insert = [self.mapper.to_row(team) for team in teams if team.id not in existing_ids]
+
+        if to_update:
+            await self.session.execute(update(TeamModel), to_update)
+        if to_insert:
+            await self.session.execute(insert(TeamModel), to_insert)
+
+        return {team.id: team for team in teams}
 
     async def delete(self, team_id: int) -> bool:
         """Delete a team"""
+        await self.session.execute(
+            delete(competition_teams).where(competition_teams.c.team_id == team_id)
+        )
         result = await self.session.execute(
             delete(TeamModel).where(TeamModel.id == team_id)
         )
+        self.session.invalidate_after_commit(TEAMS_NAMESPACE)
         return result.rowcount > 0
\ No newline at end of file
@@ -0,0 +1,250 @@
+# Write-behind persistence for draws
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from loguru import logger
+from sqlalchemy import text
+from domain.entities import Draw, DrawSummary
+from domain.value_objects import CompetitionType
+from domain.interfaces.repositories import DrawRepository
+from core.exceptions import ServiceUnavailableException
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.repositories.draw_repository import DrawRepositoryImpl
+
+
+# Dialects whose sequences hand out ids safely across processes
+SEQUENCE_DIALECTS = ('postgresql',)
+
+
+class DrawIdAllocator:
+    """Hands out draw ids from blocks reserved on the draws id sequence"""
+
+    def __init__(self, db_connection: DatabaseConnection, block_size: int = 100):
+        self.db_connection = db_connection
+        self.block_size = block_size
+        self._ids: List[int] = []
+        self._lock = asyncio.Lock()
+
+    async def next_id(self) -> int:
+        async with self._lock:
+            if not self._ids:
+                self._ids = await self._reserve_sequence_block()
+            return self._ids.pop(0)
+
+    async def _reserve_sequence_block(self) -> List[int]:
+        async with self.db_connection.engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT nextval(pg_get_serial_sequence('draws', 'id')) "
+                    "FROM generate_series(1, :count)"
+                ),
+                {"count": self.block_size}
+            )
+            return sorted(result.scalars().all())
+
+
+@dataclass
+class WriteQueueStats:
+    """Write-behind queue counters"""
+    queued: int = 0
+    flushed: int = 0
+    batches: int = 0
+    failed: int = 0
+
+
+class DrawWriteQueue:
+    """Bounded queue of draws flushed to the database in batches by a background task
+
+    A draw first reserves a place, then is queued once the request that drew it has
+    committed; a rolled back request gives its place back and nothing is flushed.
+    """
+
+    def __init__(
+            self,
+            db_connection: DatabaseConnection,
+            max_size: int = 1000,
+            batch_size: int = 50,
+            flush_interval_ms: int = 200,
+            enqueue_timeout: float = 2.0,
+            retry_after: int = 1
+    ):
+        self.db_connection = db_connection
+        self.allocator = DrawIdAllocator(db_connection)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.enqueue_timeout = enqueue_timeout
+        self.retry_after = retry_after
+        self.stats = WriteQueueStats()
+        # Places held by queued and reserved draws, given back when the flush task takes a draw
+        self._places = asyncio.Semaphore(max_size)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def reserve(self, draw: Draw) -> Draw:
+        """Reserve a place and assign an id; 503 if the queue stays full for enqueue_timeout"""
+        if self._task is None:
+            raise RuntimeError("Draw write queue is not running")
+
+        try:
+            await asyncio.wait_for(self._places.acquire(), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            raise ServiceUnavailableException(
+                "Draw write queue is full, retry later", retry_after=self.retry_after
+            )
+
+        try:
+            if not draw.id:
+                draw.id = await self.allocator.next_id()
+        except BaseException:
+            self._places.release()
+            raise
+        draw.created_at = draw.created_at or datetime.now(timezone.utc)
+        return draw
+
+    def put_reserved(self, draw: Draw) -> None:
+        """Queue a draw that holds a reserved place"""
+        self._queue.put_nowait(draw)
+        self.stats.queued += 1
+
+    def release(self) -> None:
+        """Give back the place of a reserved draw that will not be queued"""
+        self._places.release()
+
+    def start(self) -> None:
+        """Start the background flush task"""
+        dialect = self.db_connection.engine.dialect.name
+        if dialect not in SEQUENCE_DIALECTS:
+            # Ids counted in one process would collide with other workers' and writers' ids
+            raise RuntimeError(
+                f"DRAW_WRITE_BEHIND needs a database with sequences (PostgreSQL), not {dialect}"
+            )
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="draw-write-behind")
+
+    async def stop(self) -> None:
+        """Flush everything queued so far and stop the background task"""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            self._places.release()
+
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    draw = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if draw is None:
+                    stopping = True
+                    break
+                self._places.release()
+                batch.append(draw)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Draw]) -> None:
+        """Insert a batch in one transaction, retrying draw by draw if the batch fails"""
+        try:
+            await self._insert(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                self._record_failure(batch, e)
+                return
+            logger.warning(f"Write-behind flush of {len(batch)} draws failed, retrying one by one: {e}")
+            for draw in batch:
+                try:
+                    await self._insert([draw])
+                except Exception as draw_error:
+                    self._record_failure([draw], draw_error)
+                else:
+                    self.stats.flushed += 1
+                    self.stats.batches += 1
+            return
+
+        self.stats.flushed += len(batch)
+        self.stats.batches += 1
+
+    async def _insert(self, draws: List[Draw]) -> None:
+        async with self.db_connection.async_session() as session:
+            await DrawRepositoryImpl(session).save_many(draws)
+            await session.commit()
+
+    def _record_failure(self, draws: List[Draw], error: Exception) -> None:
+        self.stats.failed += len(draws)
+        logger.error(
+            f"Write-behind insert of draw(s) {[draw.id for draw in draws]} failed, "
+            f"the draw(s) are lost: {error}"
+        )
+
+
+class WriteBehindDrawRepository(DrawRepository):
+    """Draw repository that queues saves of new draws and reads through the wrapped repository"""
+
+    def __init__(self, repository: DrawRepositoryImpl, queue: DrawWriteQueue):
+        self.repository = repository
+        self.queue = queue
+
+    async def save(self, draw: Draw) -> Draw:
+        # Updates of stored draws stay synchronous
+        if draw.id:
+            return await self.repository.save(draw)
+        # Teams are stored with the request, conflicting names fail it instead of the later flush
+        await self.repository.save_teams(draw.teams)
+        draw = await self.queue.reserve(draw)
+        # Queued only once the request commits, a rolled back request stores no draw
+        self.repository.session.call_after_commit(
+            lambda: self.queue.put_reserved(draw), self.queue.release
+        )
+        return draw
+
+    async def save_many(self, draws: List[Draw]) -> List[Draw]:
+        return [await self.save(draw) for draw in draws]
+
+    async def save_results(self, draws: List[Draw]) -> List[Draw]:
+        return await self.repository.save_results(draws)
+
+    async def get_by_id(self, draw_id: int) -> Optional[Draw]:
+        return await self.repository.get_by_id(draw_id)
+
+    async def get_lightweight(self, draw_id: int) -> Optional[Draw]:
+        return await self.repository.get_lightweight(draw_id)
+
+    async def get_by_competition_and_season(
+            self, competition: CompetitionType, season: str
+    ) -> Optional[Draw]:
+        return await self.repository.get_by_competition_and_season(competition, season)
+
+    async def get_latest(self, competition: CompetitionType) -> Optional[Draw]:
+        return await self.repository.get_latest(competition)
+
+    async def get_latest_id(self, competition: CompetitionType) -> Optional[int]:
+        return await self.repository.get_latest_id(competition)
+
+    async def list_summaries(
+            self,
+            competition: Optional[CompetitionType] = None,
+            season: Optional[str] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: int = 50
+    ) -> List[DrawSummary]:
+        return await self.repository.list_summaries(competition, season, after, limit)
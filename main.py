@@ -1,16 +1,21 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from core.config import settings
-from core.dependencies import db_connection
+from core.dependencies import (
+    db_connection, read_db_connection, draw_write_queue, simulation_runner, health_monitor
+)
+from infrastructure.cache import close_cache
 from core.logging import setup_logging
 from presentation.api.v1.router import api_router
+from presentation.api import metrics
 from presentation.middleware.cors import setup_cors
 from presentation.middleware.error_handler import setup_exception_handlers
 from presentation.middleware.logging import setup_logging_middleware
-from infrastructure.repositories.in_memory_repository import (
-    InMemoryTeamRepository
-)
+from presentation.middleware.compression import setup_compression
+from presentation.middleware.metrics import setup_metrics
+from presentation.middleware.profiling import setup_profiling
 from domain.entities import Team
+from infrastructure.repositories.team_repository import TeamRepositoryImpl
 from loguru import logger
 
 # Sample teams data
@@ -29,6 +34,13 @@ SAMPLE_TEAMS = [
 ]
 
 
+async def load_sample_teams() -> None:
+    """Upsert SAMPLE_TEAMS in one statement"""
+    async with db_connection.async_session() as session:
+        await TeamRepositoryImpl(session).save_many([Team(**team_data) for team_data in SAMPLE_TEAMS])
+        await session.commit()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
@@ -38,27 +50,62 @@ async def lifespan(app: FastAPI):
     # Setup logging
     setup_logging()
 
-    # Initialize database
-    try:
+    # Schema creation is opt-in, deployments run the migrations (`make migrate`)
+    if settings.DB_CREATE_TABLES:
         await db_connection.create_tables()
         logger.info("Database tables created successfully")
 
-        # Load sample data if in development mode
-        if settings.DEBUG:
-            repo = InMemoryTeamRepository()
-            for team_data in SAMPLE_TEAMS:
-                team = Team(**team_data)
-                await repo.save(team)
-            logger.info("Sample data loaded")
+    # Serving without tables would only fail request by request
+    missing = await db_connection.missing_tables()
+    if missing:
+        raise RuntimeError(
+            f"Database schema is missing tables {', '.join(missing)}: "
+            "run `make migrate` (alembic upgrade head) or set DB_CREATE_TABLES=true"
+        )
 
+    # Open pooled connections before traffic arrives
+    try:
+        await db_connection.warm_up(min(settings.DB_POOL_WARM_SIZE, settings.DB_POOL_SIZE))
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error(f"Database pool warm-up failed: {e}")
+    if read_db_connection is not None:
+        try:
+            await read_db_connection.warm_up(min(settings.DB_POOL_WARM_SIZE, settings.DB_POOL_SIZE))
+        except Exception as e:
+            # Reads fall back to the primary until the replica answers again
+            logger.warning(f"Read replica warm-up failed: {e}")
+
+    # Load sample data if in development mode, into the database the API reads from
+    if settings.DEBUG:
+        await load_sample_teams()
+        logger.info("Sample data loaded")
+
+    # Batched background inserts of new draws
+    if draw_write_queue is not None:
+        draw_write_queue.start()
+
+    # Worker pool for simulation jobs, resumes checkpointed jobs
+    await simulation_runner.start()
+
+    # Readiness probes read the monitor's last result
+    await health_monitor.start()
 
     yield
 
     # Shutdown
     logger.info("Shutting down UEFA Draw API...")
+    await health_monitor.stop()
+    await simulation_runner.stop()
+    if draw_write_queue is not None:
+        # Persist everything accepted before the database closes
+        await draw_write_queue.stop()
+        logger.info(f"Draw write queue flushed: {draw_write_queue.stats}")
+    await close_cache()
     await db_connection.close()
+    if read_db_connection is not None:
+        await read_db_connection.close()
+    # Drain enqueued log sinks
+    await logger.complete()
 
 
 # Create FastAPI application
@@ -77,10 +124,14 @@ def create_app() -> FastAPI:
     # Setup middleware
     setup_cors(app)
     setup_exception_handlers(app)
+    setup_profiling(app)
     setup_logging_middleware(app)
+    setup_compression(app)
+    setup_metrics(app)
 
     # Include API router
     app.include_router(api_router, prefix=settings.API_V1_STR)
+    app.include_router(metrics.router)
 
     # Root endpoint
     @app.get("/")
@@ -89,7 +140,8 @@ def create_app() -> FastAPI:
             "name": settings.PROJECT_NAME,
             "version": settings.APP_VERSION,
             "docs": "/docs",
-            "health": f"{settings.API_V1_STR}/health"
+            "health": f"{settings.API_V1_STR}/health",
+            "metrics": "/metrics"
         }
 
     return app
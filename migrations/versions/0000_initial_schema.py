@@ -0,0 +1,97 @@
+"""Initial schema: teams, draws, fixtures, draw and competition memberships
+
+Tables that already exist, e.g. from DatabaseConnection.create_tables, are left
+as they are, so such databases can be brought under migrations with `upgrade head`.
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0000'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'teams' not in existing:
+        op.create_table(
+            'teams',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('name', sa.String(100), nullable=False, unique=True),
+            sa.Column('country', sa.String(3), nullable=False),
+            sa.Column('pot', sa.Integer(), nullable=False),
+            sa.Column('coefficient', sa.Float(), nullable=False),
+            sa.Column('logo_url', sa.String(500), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True)
+        )
+        op.create_index('ix_teams_id', 'teams', ['id'])
+
+    if 'draws' not in existing:
+        op.create_table(
+            'draws',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('competition', sa.String(50), nullable=False),
+            sa.Column('season', sa.String(10), nullable=False),
+            sa.Column('is_valid', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True)
+        )
+        op.create_index('ix_draws_id', 'draws', ['id'])
+        op.create_index('ix_draws_created_at_id', 'draws', ['created_at', 'id'])
+        op.create_index(
+            'ix_draws_competition_created_at_id', 'draws', ['competition', 'created_at', 'id']
+        )
+        op.create_index(
+            'ix_draws_competition_season_created_at_id', 'draws',
+            ['competition', 'season', 'created_at', 'id']
+        )
+
+    if 'fixtures' not in existing:
+        op.create_table(
+            'fixtures',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('draw_id', sa.Integer(), sa.ForeignKey('draws.id'), nullable=False),
+            sa.Column('home_team_id', sa.Integer(), sa.ForeignKey('teams.id'), nullable=False),
+            sa.Column('away_team_id', sa.Integer(), sa.ForeignKey('teams.id'), nullable=False),
+            sa.Column('matchday', sa.Integer(), nullable=True),
+            sa.Column('scheduled_date', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('status', sa.String(20), nullable=True),
+            sa.Column('home_score', sa.Integer(), nullable=True),
+            sa.Column('away_score', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now())
+        )
+        op.create_index('ix_fixtures_id', 'fixtures', ['id'])
+        op.create_index('ix_fixtures_draw_id', 'fixtures', ['draw_id'])
+
+    if 'draw_teams' not in existing:
+        op.create_table(
+            'draw_teams',
+            sa.Column('draw_id', sa.Integer(), sa.ForeignKey('draws.id'), primary_key=True),
+            sa.Column('team_id', sa.Integer(), sa.ForeignKey('teams.id'), primary_key=True)
+        )
+
+    if 'competition_teams' not in existing:
+        op.create_table(
+            'competition_teams',
+            sa.Column('competition', sa.String(50), primary_key=True),
+            sa.Column('season', sa.String(10), primary_key=True),
+            sa.Column('team_id', sa.Integer(), sa.ForeignKey('teams.id'), primary_key=True)
+        )
+        op.create_index('ix_competition_teams_team_id', 'competition_teams', ['team_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('competition_teams')
+    op.drop_table('draw_teams')
+    op.drop_table('fixtures')
+    op.drop_table('draws')
+    op.drop_table('teams')
@@ -0,0 +1,33 @@
+"""Add packed fixture storage columns to draws
+
+Databases created by DatabaseConnection.create_tables after packed storage
+existed already have these columns; they are only added when missing.
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, None] = '0000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('draws')}
+    with op.batch_alter_table('draws') as batch_op:
+        if 'fixture_team_ids' not in existing:
+            batch_op.add_column(sa.Column('fixture_team_ids', sa.LargeBinary(), nullable=True))
+        if 'fixtures_packed' not in existing:
+            batch_op.add_column(sa.Column('fixtures_packed', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('draws') as batch_op:
+        batch_op.drop_column('fixtures_packed')
+        batch_op.drop_column('fixture_team_ids')
@@ -0,0 +1,94 @@
+# Admission control for CPU-bound endpoints
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+from fastapi import HTTPException, status
+from core.config import settings
+
+
+@dataclass
+class AdmissionStats:
+    """Admission counters and queue wait times"""
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    rejected_queue_full: int = 0
+    rejected_timeout: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+
+class AdmissionController:
+    """Bounded concurrency with a bounded, time-limited wait queue
+
+    Requests beyond the queue are rejected with 429 straight away, queued requests
+    that are not admitted within the timeout get 503. Both carry Retry-After.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float, retry_after: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.stats = AdmissionStats()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def _reject(self, status_code: int, detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(self.retry_after)}
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block"""
+        stats = self.stats
+
+        if self._semaphore.locked():
+            if stats.queued >= self.max_queue:
+                stats.rejected_queue_full += 1
+                raise self._reject(status.HTTP_429_TOO_MANY_REQUESTS, "Too many concurrent requests")
+
+            stats.queued += 1
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                stats.rejected_timeout += 1
+                raise self._reject(status.HTTP_503_SERVICE_UNAVAILABLE, "Server is busy, retry later")
+            finally:
+                stats.queued -= 1
+            wait = time.perf_counter() - start
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+        else:
+            await self._semaphore.acquire()
+
+        stats.admitted += 1
+        stats.in_flight += 1
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            self._semaphore.release()
+
+
+draw_admission = AdmissionController(
+    max_concurrent=settings.DRAW_MAX_CONCURRENCY,
+    max_queue=settings.DRAW_MAX_QUEUE,
+    queue_timeout=settings.DRAW_QUEUE_TIMEOUT,
+    retry_after=settings.DRAW_RETRY_AFTER_SECONDS
+)
+
+
+async def admit_draw() -> AsyncIterator[None]:
+    """Dependency holding a draw admission slot while the request runs"""
+    async with draw_admission.admit():
+        yield
@@ -0,0 +1,108 @@
+# Prometheus scrape endpoint
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.dependencies import db_connection, read_db_connection, draw_write_queue, health_monitor
+from core.metrics import registry
+from infrastructure.cache import get_cache
+from presentation.admission import draw_admission
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+def _collect_pools():
+    """Pool counters of the primary and, if configured, the read replica"""
+    statuses = [("primary", db_connection.pool_status())]
+    if read_db_connection is not None:
+        statuses.append(("read", read_db_connection.pool_status()))
+    # In-memory SQLite has no sized pool
+    statuses = [(name, status) for name, status in statuses if "checkouts" in status]
+
+    def samples(key):
+        return [({"pool": name}, status[key]) for name, status in statuses]
+
+    yield "db_pool_size", "gauge", "Configured pool size", samples("size")
+    yield "db_pool_checked_out", "gauge", "Connections currently checked out", samples("checked_out")
+    yield "db_pool_overflow", "gauge", "Overflow connections currently open", samples("overflow")
+    yield "db_pool_checkouts_total", "counter", "Connection checkouts", samples("checkouts")
+    yield "db_pool_checkout_timeouts_total", "counter", "Checkouts that timed out", samples("timeouts")
+    yield (
+        "db_pool_checkout_wait_seconds_total", "counter", "Time spent waiting for connections",
+        [
+            ({"pool": name}, status["checkouts"] * status["average_wait_seconds"])
+            for name, status in statuses
+        ]
+    )
+    yield (
+        "db_pool_checkout_wait_seconds_max", "gauge", "Longest checkout wait",
+        samples("max_wait_seconds")
+    )
+
+
+def _collect_cache():
+    """Hit and miss counters per cache namespace"""
+    stats = get_cache().all_stats()
+
+    def samples(key):
+        return [({"namespace": name}, getattr(value, key)) for name, value in stats.items()]
+
+    yield "cache_hits_total", "counter", "Cache hits", samples("hits")
+    yield "cache_misses_total", "counter", "Cache misses", samples("misses")
+    yield "cache_coalesced_total", "counter", "Loads joined to an in-flight load", samples("coalesced")
+    yield "cache_errors_total", "counter", "Cache backend errors", samples("errors")
+    yield "cache_hit_ratio", "gauge", "Hits over lookups since start", samples("hit_ratio")
+
+
+def _collect_admission():
+    """Draw admission queue"""
+    stats = draw_admission.stats
+    yield "draw_admission_in_flight", "gauge", "Draws being computed", [({}, stats.in_flight)]
+    yield "draw_admission_queued", "gauge", "Draw requests waiting for a slot", [({}, stats.queued)]
+    yield "draw_admission_admitted_total", "counter", "Draw requests admitted", [({}, stats.admitted)]
+    yield (
+        "draw_admission_rejected_total", "counter", "Draw requests rejected by reason",
+        [
+            ({"reason": "queue_full"}, stats.rejected_queue_full),
+            ({"reason": "timeout"}, stats.rejected_timeout),
+        ]
+    )
+    yield (
+        "draw_admission_wait_seconds_total", "counter", "Time admitted requests spent queued",
+        [({}, stats.total_wait)]
+    )
+
+
+def _collect_write_queue():
+    """Write-behind queue, when enabled"""
+    if draw_write_queue is None:
+        return
+    stats = draw_write_queue.stats
+    yield "draw_write_queue_depth", "gauge", "Draws waiting to be stored", [({}, draw_write_queue.depth)]
+    yield "draw_write_queue_flushed_total", "counter", "Draws stored", [({}, stats.flushed)]
+    yield "draw_write_queue_batches_total", "counter", "Batches stored", [({}, stats.batches)]
+    yield "draw_write_queue_failed_total", "counter", "Draws lost to failed flushes", [({}, stats.failed)]
+
+
+def _collect_health():
+    """Last background health check"""
+    snapshot = health_monitor.snapshot
+    if snapshot is None:
+        return
+    yield "database_up", "gauge", "Whether the last database ping succeeded", [({}, int(snapshot.database_ok))]
+    yield (
+        "event_loop_lag_seconds", "gauge", "How late the health monitor woke up",
+        [({}, snapshot.loop_lag_seconds)]
+    )
+
+
+for _collector in (
+        _collect_pools, _collect_cache, _collect_admission, _collect_write_queue, _collect_health
+):
+    registry.add_collector(_collector)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Metrics of this worker process in the Prometheus text format"""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -1,43 +1,136 @@
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from application.dto.request import DrawRequest, ValidateDrawRequest
-from application.dto.response import DrawResponse, ValidationResponse
-from application.use_cases import PerformDrawUseCase, ValidateDrawUseCase
-from core.dependencies import get_perform_draw_use_case, get_validate_draw_use_case
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status, BackgroundTasks
+from application.dto.request import (
+    DrawRequest, ValidateDrawRequest, SimulateResultsRequest, LeaguePhaseRequest
+)
+from application.dto.response import (
+    DrawResponse, ValidationResponse, DrawResultsResponse, LeaguePhaseOutcomeResponse
+)
+from application.use_cases import (
+    PerformDrawUseCase, ValidateDrawUseCase, GetDrawUseCase,
+    SimulateResultsUseCase, SimulateLeaguePhaseUseCase, IdempotentRequestUseCase
+)
+from core.dependencies import (
+    get_perform_draw_use_case, get_validate_draw_use_case, get_draw_use_case,
+    get_simulate_results_use_case, get_league_phase_use_case, get_idempotent_request_use_case
+)
 from core.exceptions import ValidationException, BusinessRuleException
+from presentation.cache import CachedBody, get_or_render_draw, make_etag, etag_matches
+from domain.entities import StoredResponse
+from presentation.admission import admit_draw, draw_admission
+from presentation.responses import (
+    ModelJSONResponse, MsgPackResponse, MSGPACK_MEDIA_TYPE, accepts_msgpack
+)
 from loguru import logger
 
 router = APIRouter(prefix="/draw", tags=["draw"])
 
+ResponseFormat = Annotated[
+    Optional[str], Query(alias="format", pattern="^(full|compact)$")
+]
+
+
+def _negotiate_variant(http_request: Request, response_format: Optional[str]) -> str:
+    """Pick the draw representation: json, compact or msgpack"""
+    # MessagePack clients always get the compact format
+    if accepts_msgpack(http_request):
+        return "msgpack"
+    if response_format == "compact":
+        return "compact"
+    return "json"
+
 
 @router.post(
     "/",
     response_model=DrawResponse,
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Perform draw",
-    description="Perform a new draw for the specified competition"
+    description=(
+        "Perform a new draw for the specified competition. "
+        "Use `?format=compact` or `Accept: application/msgpack` for the compact "
+        "CompactDrawResponse format. Send an `Idempotency-Key` header to make retries "
+        "replay the first response instead of performing another draw."
+    ),
+    responses={
+        status.HTTP_201_CREATED: {"content": {MSGPACK_MEDIA_TYPE: {}}},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "description": "Idempotency-Key reused with a different request"
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Draw queue is full, see Retry-After"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Timed out waiting for a draw slot"}
+    }
 )
 async def perform_draw(
         request: DrawRequest,
+        http_request: Request,
         background_tasks: BackgroundTasks,
-        use_case: Annotated[PerformDrawUseCase, Depends(get_perform_draw_use_case)]
-) -> DrawResponse:
+        use_case: Annotated[PerformDrawUseCase, Depends(get_perform_draw_use_case)],
+        idempotency: Annotated[IdempotentRequestUseCase, Depends(get_idempotent_request_use_case)],
+        response_format: ResponseFormat = None,
+        idempotency_key: Annotated[Optional[str], Header(max_length=255)] = None
+) -> Response:
     """Perform a new draw"""
+    variant = _negotiate_variant(http_request, response_format)
+
+    if idempotency_key is None:
+        async with draw_admission.admit():
+            return await _perform_draw(request, background_tasks, use_case, variant)
+
+    fingerprint = idempotency.fingerprint(request.model_dump_json(), variant)
+
+    # Admitted only once the key is known to be new, duplicates never hold a draw slot
+    async def produce() -> StoredResponse:
+        async with draw_admission.admit():
+            response = await _perform_draw(request, background_tasks, use_case, variant)
+        return StoredResponse(
+            fingerprint=fingerprint,
+            status_code=response.status_code,
+            media_type=response.media_type,
+            body=response.body
+        )
+
+    stored, replayed = await idempotency.run_once(idempotency_key, produce)
+
+    if stored.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used with a different request"
+        )
+
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type=stored.media_type,
+        headers={"Idempotency-Replayed": "true" if replayed else "false"}
+    )
+
+
+async def _perform_draw(
+        request: DrawRequest,
+        background_tasks: BackgroundTasks,
+        use_case: PerformDrawUseCase,
+        variant: str
+) -> Response:
+    """Perform the draw and render it in the negotiated variant"""
     try:
         logger.info(f"Performing draw for {request.competition} season {request.season}")
 
         # Perform the draw
-        result = await use_case.execute(request)
+        result = await use_case.execute(request, compact=variant != "json")
 
         # Add background task for additional processing if needed
         background_tasks.add_task(
             log_draw_completion,
             competition=request.competition,
             season=request.season,
-            draw_id=result.id
+            draw_id=result["id"]
         )
 
-        return result
+        # Payload is already in response shape, skip response model re-validation
+        if variant == "msgpack":
+            return MsgPackResponse(content=result, status_code=status.HTTP_201_CREATED)
+        return ModelJSONResponse(content=result, status_code=status.HTTP_201_CREATED)
 
     except ValidationException as e:
         logger.error(f"Validation error: {e.message}")
@@ -80,6 +173,146 @@ async def validate_draw(
         )
 
 
+@router.post(
+    "/results",
+    response_model=List[DrawResultsResponse],
+    summary="Simulate results",
+    description=(
+        "Score every fixture of the given stored draws with the Poisson results model "
+        "and return the fixtures with the resulting league tables. "
+        "Set `persist` to store the scores and mark the fixtures completed."
+    )
+)
+async def simulate_results(
+        request: SimulateResultsRequest,
+        use_case: Annotated[SimulateResultsUseCase, Depends(get_simulate_results_use_case)]
+) -> List[DrawResultsResponse]:
+    """Simulate match results of stored draws"""
+    return await use_case.execute(request)
+
+
+@router.post(
+    "/outcomes",
+    response_model=LeaguePhaseOutcomeResponse,
+    summary="Simulate league phase outcomes",
+    description=(
+        "Play the league phase of a stored draw `runs` times with simulated results and "
+        "return each team's finishing position distribution, mean points and the chance "
+        "of a top 8, play-off or elimination finish."
+    ),
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "More runs than allowed"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Draw queue is full, see Retry-After"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Timed out waiting for a draw slot"}
+    },
+    dependencies=[Depends(admit_draw)]
+)
+async def simulate_league_phase(
+        request: LeaguePhaseRequest,
+        use_case: Annotated[SimulateLeaguePhaseUseCase, Depends(get_league_phase_use_case)]
+) -> LeaguePhaseOutcomeResponse:
+    """Simulate league phase outcomes of a stored draw"""
+    return await use_case.execute(request)
+
+
+@router.get(
+    "/latest/{competition}",
+    response_model=DrawResponse,
+    response_class=ModelJSONResponse,
+    summary="Get latest draw",
+    description="Retrieve the most recent stored draw for a competition",
+    responses={
+        status.HTTP_200_OK: {"content": {MSGPACK_MEDIA_TYPE: {}}},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}
+    }
+)
+async def get_latest_draw(
+        competition: str,
+        http_request: Request,
+        use_case: Annotated[GetDrawUseCase, Depends(get_draw_use_case)],
+        response_format: ResponseFormat = None,
+        if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """Get the latest stored draw for a competition"""
+    try:
+        draw_id = await use_case.get_latest_id(competition)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    variant = _negotiate_variant(http_request, response_format)
+    return await _stored_draw_response(use_case, draw_id, variant, if_none_match)
+
+
+@router.get(
+    "/{draw_id}",
+    response_model=DrawResponse,
+    response_class=ModelJSONResponse,
+    summary="Get draw",
+    description="Retrieve a stored draw by id",
+    responses={
+        status.HTTP_200_OK: {"content": {MSGPACK_MEDIA_TYPE: {}}},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}
+    }
+)
+async def get_draw(
+        draw_id: int,
+        http_request: Request,
+        use_case: Annotated[GetDrawUseCase, Depends(get_draw_use_case)],
+        response_format: ResponseFormat = None,
+        if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """Get a stored draw"""
+    variant = _negotiate_variant(http_request, response_format)
+    return await _stored_draw_response(use_case, draw_id, variant, if_none_match)
+
+
+@router.get(
+    "/{draw_id}/results",
+    response_model=DrawResultsResponse,
+    summary="Get results",
+    description="Stored match results and league table of a draw"
+)
+async def get_draw_results(
+        draw_id: int,
+        use_case: Annotated[SimulateResultsUseCase, Depends(get_simulate_results_use_case)]
+) -> DrawResultsResponse:
+    """Get stored results of a draw"""
+    return await use_case.get(draw_id)
+
+
+async def _stored_draw_response(
+        use_case: GetDrawUseCase,
+        draw_id: int,
+        variant: str,
+        if_none_match: Optional[str]
+) -> Response:
+    """Serve a stored draw from the serialized body cache, loading it on a miss"""
+
+    async def render() -> CachedBody:
+        payload = await use_case.execute(draw_id, compact=variant != "json")
+        if variant == "msgpack":
+            rendered = MsgPackResponse(content=payload)
+        else:
+            rendered = ModelJSONResponse(content=payload)
+        return CachedBody(
+            body=rendered.body,
+            media_type=rendered.media_type,
+            etag=make_etag(rendered.body)
+        )
+
+    cached = await get_or_render_draw(draw_id, variant, render)
+
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+
 async def log_draw_completion(competition: str, season: str, draw_id: int):
     """Background task to log draw completion"""
     logger.info(f"Draw completed - Competition: {competition}, Season: {season}, ID: {draw_id}")
\ No newline at end of file
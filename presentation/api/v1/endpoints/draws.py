@@ -0,0 +1,34 @@
+# Draw history endpoints
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from application.dto.response import DrawSummaryPageResponse
+from application.use_cases import ListDrawsUseCase
+from core.dependencies import get_list_draws_use_case
+
+router = APIRouter(prefix="/draws", tags=["draws"])
+
+
+@router.get("", response_model=DrawSummaryPageResponse, include_in_schema=False)
+@router.get(
+    "/",
+    response_model=DrawSummaryPageResponse,
+    summary="List draws",
+    description="Browse stored draws newest first, paginated with the returned next_cursor"
+)
+async def list_draws(
+    use_case: Annotated[ListDrawsUseCase, Depends(get_list_draws_use_case)],
+    competition: Annotated[
+        Optional[str], Query(pattern="^(champions_league|europa_league|conference_league)$")
+    ] = None,
+    season: Annotated[Optional[str], Query(pattern="^\\d{4}/\\d{2}$")] = None,
+    after: Annotated[Optional[str], Query(max_length=200)] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50
+) -> DrawSummaryPageResponse:
+    """List stored draws"""
+    try:
+        return await use_case.execute(competition, season, after, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -1,9 +1,8 @@
 # Health check endpoints
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
-from typing import Annotated
-from core.dependencies import get_db_session
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from core.dependencies import db_connection, read_db_connection, health_monitor
+from presentation.admission import draw_admission
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -18,21 +17,51 @@ async def health_check():
 
 
 @router.get("/ready")
-async def readiness_check(
-        db: Annotated[AsyncSession, Depends(get_db_session)]
-):
-    """Readiness check including database connectivity"""
-    try:
-        # Check database connectivity
-        await db.execute(text("SELECT 1"))
-
-        return {
-            "status": "ready",
-            "database": "connected"
-        }
-    except Exception as e:
-        return {
-            "status": "not ready",
-            "database": "disconnected",
-            "error": str(e)
-        }
+async def readiness_check():
+    """Readiness from the background monitor's last database check, no connection checkout"""
+    snapshot = health_monitor.snapshot
+    if snapshot is None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "not ready", "database": "unknown", "error": "No check completed yet"}
+        )
+
+    body = {
+        "status": "ready" if health_monitor.is_ready else "not ready",
+        "database": "connected" if snapshot.database_ok else "disconnected",
+        "checked_at": snapshot.checked_at.isoformat(),
+        "ping_seconds": snapshot.ping_seconds,
+        "loop_lag_seconds": snapshot.loop_lag_seconds,
+        "pool": snapshot.pool,
+    }
+    if snapshot.error is not None:
+        body["error"] = snapshot.error
+    if not health_monitor.is_ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
+
+
+@router.get("/pool")
+async def pool_status():
+    """Connection pool occupancy and checkout wait times"""
+    status = db_connection.pool_status()
+    if read_db_connection is not None:
+        status["read_replica"] = read_db_connection.pool_status()
+    return status
+
+
+@router.get("/admission")
+async def admission_status():
+    """Draw admission queue depth and wait times"""
+    stats = draw_admission.stats
+    return {
+        "max_concurrent": draw_admission.max_concurrent,
+        "max_queue": draw_admission.max_queue,
+        "in_flight": stats.in_flight,
+        "queued": stats.queued,
+        "admitted": stats.admitted,
+        "rejected_queue_full": stats.rejected_queue_full,
+        "rejected_timeout": stats.rejected_timeout,
+        "average_wait_seconds": stats.average_wait,
+        "max_wait_seconds": stats.max_wait,
+    }
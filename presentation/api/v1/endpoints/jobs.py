@@ -0,0 +1,94 @@
+# Background simulation job endpoints
+from typing import Annotated, AsyncIterator
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from application.dto.request import SimulationRequest
+from application.dto.response import SimulationJobResponse
+from application.use_cases import SubmitSimulationUseCase, GetSimulationJobUseCase
+from core.config import settings
+from core.dependencies import get_submit_simulation_use_case, get_simulation_job_use_case
+from core.exceptions import ResourceNotFoundException
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.post(
+    "/simulations",
+    response_model=SimulationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start simulation",
+    description=(
+        "Start a Monte Carlo run of repeated draws in the background. "
+        "Poll the returned job or follow its progress events."
+    )
+)
+async def submit_simulation(
+        request: SimulationRequest,
+        response: Response,
+        use_case: Annotated[SubmitSimulationUseCase, Depends(get_submit_simulation_use_case)]
+) -> SimulationJobResponse:
+    """Start a simulation job"""
+    job = await use_case.execute(request)
+    response.headers["Location"] = f"{settings.API_V1_STR}/jobs/{job.id}"
+    return job
+
+
+@router.get(
+    "/{job_id}",
+    response_model=SimulationJobResponse,
+    summary="Get job",
+    description="Progress and partial results of a simulation job"
+)
+async def get_job(
+        job_id: str,
+        use_case: Annotated[GetSimulationJobUseCase, Depends(get_simulation_job_use_case)]
+) -> SimulationJobResponse:
+    """Get a simulation job"""
+    try:
+        return await use_case.execute(job_id)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message
+        )
+
+
+@router.get(
+    "/{job_id}/events",
+    summary="Stream job progress",
+    description=(
+        "Server-sent events: a `progress` event after every checkpoint and a final "
+        "`done` event with the results"
+    ),
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}}
+)
+async def stream_job_events(
+        job_id: str,
+        use_case: Annotated[GetSimulationJobUseCase, Depends(get_simulation_job_use_case)]
+) -> StreamingResponse:
+    """Stream simulation job progress"""
+    updates = use_case.watch(job_id)
+    try:
+        first = await updates.__anext__()
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message
+        )
+
+    async def events() -> AsyncIterator[bytes]:
+        job = first
+        while True:
+            event = "done" if job.status in ("completed", "failed") else "progress"
+            yield f"event: {event}\ndata: {job.model_dump_json()}\n\n".encode()
+            try:
+                job = await updates.__anext__()
+            except StopAsyncIteration:
+                return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
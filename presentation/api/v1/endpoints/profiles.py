@@ -0,0 +1,45 @@
+# Stored request profiles
+import asyncio
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi.responses import FileResponse, PlainTextResponse
+from presentation.middleware.profiling import profiling_allowed, profile_path
+
+router = APIRouter(prefix="/profiles", tags=["profiles"])
+
+ProfileId = Annotated[str, Path(pattern="^\\d+-[0-9a-f]{12}$")]
+
+
+def require_profiling_access(request: Request) -> None:
+    """Same guard as the profiling middleware"""
+    if not profiling_allowed(request.headers):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Profiling is not allowed")
+
+
+@router.get(
+    "/{profile_id}",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_profiling_access)],
+    summary="Get a request profile",
+    description="Text report of a request profiled with ?profile=cpu|memory"
+)
+async def get_profile(profile_id: ProfileId):
+    """Return the text report"""
+    path = profile_path(profile_id, ".txt")
+    if not path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return PlainTextResponse(await asyncio.to_thread(path.read_text))
+
+
+@router.get(
+    "/{profile_id}/pstats",
+    dependencies=[Depends(require_profiling_access)],
+    summary="Download cProfile stats",
+    description="Raw pstats dump of a cpu profile, for snakeviz or gprof2dot"
+)
+async def get_profile_stats(profile_id: ProfileId):
+    """Return the pstats file"""
+    path = profile_path(profile_id, ".prof")
+    if not path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
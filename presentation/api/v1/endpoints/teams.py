@@ -1,6 +1,6 @@
 # Teams endpoints
-from typing import List, Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from application.dto.response import TeamResponse
 from application.use_cases import GetTeamsUseCase
 from core.dependencies import get_teams_use_case
@@ -12,15 +12,16 @@ router = APIRouter(prefix="/teams", tags=["teams"])
     "/{competition}",
     response_model=List[TeamResponse],
     summary="Get teams by competition",
-    description="Retrieve all teams participating in a specific competition"
+    description="Retrieve all teams participating in a specific competition (latest season by default)"
 )
 async def get_teams(
     competition: str,
-    use_case: Annotated[GetTeamsUseCase, Depends(get_teams_use_case)]
+    use_case: Annotated[GetTeamsUseCase, Depends(get_teams_use_case)],
+    season: Annotated[Optional[str], Query(pattern="^\\d{4}/\\d{2}$")] = None
 ) -> List[TeamResponse]:
     """Get teams for a specific competition"""
     try:
-        teams = await use_case.execute(competition)
+        teams = await use_case.execute(competition, season)
         return teams
     except ValueError as e:
         raise HTTPException(
@@ -1,9 +1,12 @@
 from fastapi import APIRouter
-from presentation.api.v1.endpoints import teams, draw, health
+from presentation.api.v1.endpoints import teams, draw, draws, health, jobs, profiles
 
 api_router = APIRouter()
 
 # Include all endpoint routers
 api_router.include_router(health.router)
 api_router.include_router(teams.router)
-api_router.include_router(draw.router)
\ No newline at end of file
+api_router.include_router(draw.router)
+api_router.include_router(draws.router)
+api_router.include_router(jobs.router)
+api_router.include_router(profiles.router)
\ No newline at end of file
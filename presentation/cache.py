@@ -0,0 +1,58 @@
+# Cached serialized response bodies
+import hashlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+from core.config import settings
+from infrastructure.cache import get_cache, DRAW_RESPONSES_NAMESPACE
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """Serialized response body with its strong ETag"""
+    body: bytes
+    media_type: str
+    etag: str
+
+    def encode(self) -> bytes:
+        """Pack as '<etag>\\n<media type>\\n<body>' for byte caches"""
+        return b"\n".join((self.etag.encode(), self.media_type.encode(), self.body))
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CachedBody":
+        etag, media_type, body = data.split(b"\n", 2)
+        return cls(body=body, media_type=media_type.decode(), etag=etag.decode())
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from the body bytes"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def get_or_render_draw(
+        draw_id: int,
+        variant: str,
+        render: Callable[[], Awaitable[CachedBody]]
+) -> CachedBody:
+    """Serve a stored draw body from the cache, rendering it once on a miss"""
+
+    async def load() -> bytes:
+        return (await render()).encode()
+
+    data = await get_cache().get_or_load(
+        DRAW_RESPONSES_NAMESPACE,
+        f"{draw_id}:{variant}",
+        load,
+        ttl=settings.DRAW_CACHE_TTL
+    )
+    return CachedBody.decode(data)
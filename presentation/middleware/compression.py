@@ -0,0 +1,154 @@
+# Response compression middleware
+import zlib
+from typing import Optional
+import brotli
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import settings
+from presentation.responses import quality_values
+
+# Streams that must reach the client chunk by chunk are never compressed
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+# Supported encodings, preferred first when the client weighs them equally
+ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the supported encoding with the highest q-value, None if all are refused"""
+    weights = quality_values(accept_encoding)
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """Mark a strong ETag weak, it names the identity bytes rather than the encoded ones"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _Encoder:
+    """Incremental brotli or gzip encoder"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=4)
+            self._process = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._process = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._process(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """Compress response bodies with brotli or gzip based on Accept-Encoding"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        pending = []
+        pending_size = 0
+        encoder = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, pending_size, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or media_type.startswith(UNCOMPRESSED_MEDIA_TYPES)
+                )
+                if message["status"] == 304:
+                    # Validators of a revalidation match the encoded 200 the client holds
+                    _weaken_etag(MutableHeaders(raw=message["headers"]))
+                if passthrough:
+                    await send(message)
+                else:
+                    # Hold the headers until we know whether to compress
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is not None:
+                # Already streaming compressed output
+                chunk = encoder.compress(body)
+                if not more_body:
+                    chunk += encoder.finish()
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            pending.append(body)
+            pending_size += len(body)
+
+            if more_body and pending_size < self.minimum_size:
+                # Not enough data yet to decide
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            buffered = b"".join(pending)
+            pending.clear()
+
+            if not more_body and pending_size < self.minimum_size:
+                # Small complete body, send as-is
+                await send(start_message)
+                await send({"type": "http.response.body", "body": buffered})
+                return
+
+            encoder = _Encoder(encoding)
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            _weaken_etag(headers)
+
+            chunk = encoder.compress(buffered)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                chunk += encoder.finish()
+                headers["Content-Length"] = str(len(chunk))
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def setup_compression(app: FastAPI) -> None:
+    """Configure response compression middleware"""
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+    )
@@ -6,7 +6,8 @@ from core.exceptions import (
     ResourceNotFoundException,
     ValidationException,
     BusinessRuleException,
-    ConflictException
+    ConflictException,
+    ServiceUnavailableException
 )
 from loguru import logger
 
@@ -57,6 +58,17 @@ def setup_exception_handlers(app: FastAPI) -> None:
             }
         )
 
+    @app.exception_handler(ServiceUnavailableException)
+    async def service_unavailable_handler(request: Request, exc: ServiceUnavailableException):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "error": exc.code,
+                "message": exc.message
+            },
+            headers={"Retry-After": str(exc.retry_after)}
+        )
+
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         return JSONResponse(
@@ -0,0 +1,207 @@
+# On-demand request profiling
+import asyncio
+import cProfile
+import hmac
+import io
+import pstats
+import secrets
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs
+from fastapi import FastAPI
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import settings
+from core.profiling import collect_thread_profiles
+from infrastructure.database.query_timing import QueryTimings, record_queries
+
+PROFILE_MODES = ("cpu", "memory")
+PROFILE_HEADER = "x-profile"
+ADMIN_TOKEN_HEADER = "x-admin-token"
+# Rows shown per report section
+REPORT_LIMIT = 40
+
+
+def profiling_allowed(headers: Headers) -> bool:
+    """Profiling is open in DEBUG, otherwise it needs the configured admin token"""
+    if settings.DEBUG:
+        return True
+    token = headers.get(ADMIN_TOKEN_HEADER)
+    return bool(
+        settings.PROFILING_ADMIN_TOKEN and token
+        and hmac.compare_digest(token, settings.PROFILING_ADMIN_TOKEN)
+    )
+
+
+def profile_path(profile_id: str, suffix: str) -> Path:
+    return Path(settings.PROFILES_DIR) / f"{profile_id}{suffix}"
+
+
+class RequestProfiler:
+    """Profiles one request with cProfile (cpu) or tracemalloc (memory)
+
+    Both profilers are process-wide: other requests interleaved on the event loop while
+    the profiled one awaits show up in the profile too.
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.profile: Optional[cProfile.Profile] = None
+        # Work the request handed to threads through call_profiled
+        self.thread_profiles: List[cProfile.Profile] = []
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.peak_memory = 0
+        self.queries = QueryTimings()
+        self.elapsed = 0.0
+        self._started_tracemalloc = False
+        self._start = 0.0
+
+    def start(self) -> None:
+        if self.mode == "memory":
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start(25)
+            tracemalloc.reset_peak()
+        else:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self._start = time.perf_counter()
+
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        if self.profile is not None:
+            self.profile.disable()
+        if self.mode == "memory":
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def report(self, title: str) -> str:
+        """Plain-text report: summary, SQL statements, then the profiler output"""
+        out = io.StringIO()
+        out.write(f"{title}\n")
+        out.write(f"mode: {self.mode}, wall time: {self.elapsed:.4f}s\n\n")
+
+        out.write(
+            f"SQL: {len(self.queries.statements)} statements, "
+            f"{self.queries.total_time:.4f}s in cursor execution\n"
+        )
+        for statement, count, total in self.queries.by_statement()[:REPORT_LIMIT]:
+            out.write(f"  {total:.4f}s  x{count}  {statement}\n")
+        out.write("\n")
+
+        if self.profile is not None:
+            stats = self._stats(out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_LIMIT)
+            out.write("Draw service internals\n")
+            stats.print_stats("draw_service", REPORT_LIMIT)
+            stats.print_callees("DrawServiceImpl|draw_service.py", REPORT_LIMIT)
+        if self.snapshot is not None:
+            out.write(f"Peak traced memory: {self.peak_memory / 1024:.1f} KiB\n")
+            for statistic in self.snapshot.statistics("lineno")[:REPORT_LIMIT]:
+                out.write(f"  {statistic}\n")
+
+        return out.getvalue()
+
+    def save(self, profile_id: str, title: str) -> None:
+        """Write the text report and, for cpu, the pstats dump (snakeviz, gprof2dot)"""
+        directory = Path(settings.PROFILES_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        profile_path(profile_id, ".txt").write_text(self.report(title))
+        if self.profile is not None:
+            self._stats().dump_stats(profile_path(profile_id, ".prof"))
+
+    def _stats(self, stream: Optional[io.StringIO] = None) -> pstats.Stats:
+        stats = pstats.Stats(self.profile, stream=stream)
+        if self.thread_profiles:
+            stats.add(*self.thread_profiles)
+        return stats
+
+
+class ProfilingMiddleware:
+    """Profiles requests flagged with ?profile=cpu|memory or an X-Profile header
+
+    The response is returned unchanged with an X-Profile-Id header; the report is
+    stored under PROFILES_DIR and served by GET /profiles/{profile_id}.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        mode = headers.get(PROFILE_HEADER)
+        if mode is None and b"profile=" in scope["query_string"]:
+            mode = parse_qs(scope["query_string"].decode("latin-1")).get("profile", [None])[0]
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        if mode not in PROFILE_MODES:
+            response = JSONResponse({"detail": f"Profile mode must be one of {PROFILE_MODES}"}, 400)
+        elif not profiling_allowed(headers):
+            response = JSONResponse({"detail": "Profiling is not allowed"}, 403)
+        elif self._busy:
+            # cProfile and tracemalloc cannot profile two requests apart
+            response = JSONResponse({"detail": "Another request is being profiled"}, 409)
+        else:
+            response = None
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        # Random suffix: workers sharing PROFILES_DIR must not overwrite each other's reports
+        profile_id = f"{int(time.time())}-{secrets.token_hex(6)}"
+        title = f"{scope['method']} {scope['path']} (profile {profile_id})"
+        profiler = RequestProfiler(mode)
+        finished = False
+
+        async def finish() -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            profiler.stop()
+            try:
+                await asyncio.to_thread(profiler.save, profile_id, title)
+            except OSError as e:
+                logger.error(f"Could not store profile {profile_id}: {e}")
+                return
+            logger.info(f"Stored {mode} profile {profile_id} for {scope['method']} {scope['path']}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = profile_id
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Stored before the response completes, so the id is readable once the client has it
+                await finish()
+            await send(message)
+
+        self._busy = True
+        try:
+            with record_queries() as queries, collect_thread_profiles() as thread_profiles:
+                profiler.queries = queries
+                profiler.thread_profiles = thread_profiles
+                profiler.start()
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    await finish()
+        finally:
+            self._busy = False
+
+def setup_profiling(app: FastAPI) -> None:
+    """Configure on-demand request profiling"""
+    app.add_middleware(ProfilingMiddleware)
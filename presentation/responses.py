@@ -0,0 +1,62 @@
+# Custom response classes and content negotiation helpers
+from datetime import datetime
+from typing import Any, Dict
+import msgpack
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode types msgpack does not support natively"""
+    if isinstance(value, datetime):
+        # Same text as the JSON bodies: UTC as "Z"
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+class ModelJSONResponse(ORJSONResponse):
+    """orjson response writing UTC datetimes with a "Z" suffix, as pydantic response models do"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
+
+
+class MsgPackResponse(Response):
+    """Response rendered with MessagePack"""
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default)
+
+
+def quality_values(header: str) -> Dict[str, float]:
+    """Parse an Accept or Accept-Encoding header into lower-cased tokens and their q-values"""
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        token, *params = part.strip().split(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token] = weight
+    return weights
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Check if the client named MessagePack, and weighs it at least as high as JSON"""
+    weights = quality_values(request.headers.get("accept", ""))
+    weight = weights.get(MSGPACK_MEDIA_TYPE, 0.0)
+    return weight > 0 and weight >= weights.get("application/json", 0.0)
@@ -0,0 +1,16 @@
+import os
+
+# Settings without defaults, so the app modules import without a .env file
+for name, value in {
+    "APP_NAME": "UEFA Draw API",
+    "APP_VERSION": "test",
+    "API_V1_STR": "/api/v1",
+    "PROJECT_NAME": "UEFA Competition Draw System",
+    "DATABASE_URL": "sqlite+aiosqlite://",
+    "BACKEND_CORS_ORIGINS": "[]",
+    "SECRET_KEY": "test",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "UEFA_API_BASE_URL": "https://api.uefa.com",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(name, value)
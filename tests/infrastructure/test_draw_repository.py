@@ -0,0 +1,83 @@
+import pytest
+import pytest_asyncio
+from core.exceptions import BusinessRuleException
+from domain.entities import Draw, Team
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.repositories.draw_repository import DrawRepositoryImpl
+from infrastructure.repositories.team_repository import TeamRepositoryImpl
+
+COUNTRIES = ("ENG", "ESP", "GER", "ITA", "FRA", "POR", "NED", "BEL", "SCO")
+
+
+def make_teams(**overrides):
+    teams = [
+        Team(id=index + 1, name=f"Team {index + 1}", country=COUNTRIES[index % 9],
+             pot=index // 9 + 1, coefficient=100.0 - index)
+        for index in range(36)
+    ]
+    for team_id, fields in overrides.items():
+        team = teams[int(team_id) - 1]
+        teams[int(team_id) - 1] = Team(**{**team.__dict__, **fields})
+    return teams
+
+
+def make_draw(teams):
+    return Draw(competition="champions_league", season="2024/25", teams=teams, fixtures=[])
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'draws.db'}")
+    await connection.create_tables()
+    yield connection
+    await connection.close()
+
+
+async def save_draw(db, teams):
+    async with db.async_session() as session:
+        draw = await DrawRepositoryImpl(session).save(make_draw(teams))
+        await session.commit()
+    return draw
+
+
+@pytest.mark.asyncio
+async def test_stored_draw_reads_back_the_teams_it_was_drawn_with(db):
+    await save_draw(db, make_teams())
+    changed = make_teams(**{"1": {"name": "Renamed", "pot": 1, "coefficient": 200.0}})
+    draw = await save_draw(db, changed)
+
+    async with db.async_session() as session:
+        stored = await DrawRepositoryImpl(session).get_by_id(draw.id)
+        team = await TeamRepositoryImpl(session).get_by_id(1)
+
+    stored_team = next(t for t in stored.teams if t.id == 1)
+    assert (stored_team.name, stored_team.coefficient) == ("Renamed", 200.0)
+    assert (team.name, team.coefficient) == ("Renamed", 200.0)
+
+
+@pytest.mark.asyncio
+async def test_new_team_id_with_a_stored_name_is_rejected(db):
+    await save_draw(db, make_teams())
+    teams = make_teams()
+    teams[0] = Team(id=99, name="Team 2", country="ENG", pot=1, coefficient=50.0)
+    teams[1] = Team(id=98, name="Other", country="ESP", pot=1, coefficient=40.0)
+
+    async with db.async_session() as session:
+        with pytest.raises(BusinessRuleException, match="Team 2"):
+            await DrawRepositoryImpl(session).save(make_draw(teams))
+        await session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_lightweight_draw_has_the_same_teams_as_the_full_one(db):
+    draw = await save_draw(db, make_teams(**{"3": {"logo_url": "https://example.com/3.png"}}))
+
+    async with db.async_session() as session:
+        full = await DrawRepositoryImpl(session).get_by_id(draw.id)
+        lightweight = await DrawRepositoryImpl(session).get_lightweight(draw.id)
+
+    def fields(teams):
+        return sorted((t.id, t.name, t.country, t.pot, t.coefficient, t.logo_url) for t in teams)
+
+    assert fields(lightweight.teams) == fields(full.teams)
+    assert "https://example.com/3.png" in {t.logo_url for t in lightweight.teams}
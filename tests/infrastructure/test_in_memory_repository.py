@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from domain.entities import Draw, Team
+from domain.value_objects import CompetitionType
+from infrastructure.repositories.in_memory_repository import InMemoryDrawRepository
+
+COUNTRIES = ("ENG", "ESP", "GER", "ITA", "FRA", "POR", "NED", "BEL", "SCO")
+TEAMS = [
+    Team(id=index + 1, name=f"Team {index + 1}", country=COUNTRIES[index % 9],
+         pot=index // 9 + 1, coefficient=100.0 - index)
+    for index in range(36)
+]
+NOW = datetime(2024, 8, 29, 12, 0, tzinfo=timezone.utc)
+UCL = CompetitionType("champions_league")
+
+
+def make_draw(draw_id, created_at, competition="champions_league", season="2024/25"):
+    return Draw(id=draw_id, competition=competition, season=season, teams=TEAMS,
+                fixtures=[], created_at=created_at)
+
+
+async def listed_ids(repository, **kwargs):
+    return [summary.id for summary in await repository.list_summaries(**kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_naive_and_aware_created_at_share_one_ordering():
+    repository = InMemoryDrawRepository()
+    # Naive values, as SQLite returns them, are UTC
+    await repository.save(make_draw(1, NOW.replace(tzinfo=None)))
+    await repository.save(make_draw(2, NOW + timedelta(minutes=1)))
+    await repository.save(make_draw(3, (NOW + timedelta(minutes=2)).replace(tzinfo=None)))
+    istanbul = timezone(timedelta(hours=3))
+    await repository.save(make_draw(4, (NOW - timedelta(minutes=1)).astimezone(istanbul)))
+
+    assert await listed_ids(repository) == [3, 2, 1, 4]
+    assert (await repository.get_latest(UCL)).id == 3
+    assert await listed_ids(repository, after=(NOW.replace(tzinfo=None), 1)) == [4]
+    assert await listed_ids(repository, after=(NOW + timedelta(minutes=1), 2)) == [1, 4]
+
+
+@pytest.mark.asyncio
+async def test_draws_sharing_created_at_are_ordered_by_id():
+    repository = InMemoryDrawRepository()
+    for draw_id in (2, 3, 1):
+        await repository.save(make_draw(draw_id, NOW))
+
+    assert await listed_ids(repository) == [3, 2, 1]
+    assert await listed_ids(repository, after=(NOW, 3)) == [2, 1]
+    assert await listed_ids(repository, limit=2) == [3, 2]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_draw_is_evicted_from_every_index():
+    repository = InMemoryDrawRepository(max_draws=2)
+    await repository.save(make_draw(1, NOW, season="2023/24"))
+    await repository.save(make_draw(2, NOW + timedelta(minutes=1), season="2024/25"))
+    # Reading draw 1 makes draw 2 the least recently used
+    await repository.get_by_id(1)
+    await repository.save(make_draw(3, NOW + timedelta(minutes=2), competition="europa_league"))
+
+    assert await repository.get_by_id(2) is None
+    assert await repository.get_by_competition_and_season(UCL, "2024/25") is None
+    assert (await repository.get_by_competition_and_season(UCL, "2023/24")).id == 1
+    assert await listed_ids(repository) == [3, 1]
+    assert (await repository.get_latest(UCL)).id == 1
+
+
+@pytest.mark.asyncio
+async def test_saving_a_stored_draw_again_reindexes_it():
+    repository = InMemoryDrawRepository()
+    await repository.save(make_draw(1, NOW))
+    await repository.save(make_draw(2, NOW + timedelta(minutes=1)))
+
+    await repository.save(make_draw(1, NOW + timedelta(minutes=2)))
+
+    assert await listed_ids(repository) == [1, 2]
@@ -0,0 +1,72 @@
+import pytest
+from domain.entities import Draw, Fixture, Team
+from domain.entities.fixture import FixtureStatus
+from infrastructure.repositories.mappers import DrawMapper
+from infrastructure.repositories.packed_fixtures import (
+    FIXTURE_RECORD_SIZE, MAX_TEAM_ID, can_pack, pack_fixtures, pack_team_ids,
+    unpack_fixtures, unpack_team_ids
+)
+
+
+def make_draw(team_ids, fixtures=None):
+    # The given ids first, padded to the 36 teams a draw needs
+    all_ids = list(team_ids) + [1000 + index for index in range(36 - len(team_ids))]
+    teams = [
+        Team(id=team_id, name=f"Team {index}", country="ENG", pot=index // 9 + 1, coefficient=10.0)
+        for index, team_id in enumerate(all_ids)
+    ]
+    if fixtures is None:
+        fixtures = [
+            Fixture(home_team_id=team_ids[0], away_team_id=team_ids[1], matchday=1, is_home=True),
+            Fixture(home_team_id=team_ids[1], away_team_id=team_ids[2], matchday=8, is_home=False),
+            Fixture(home_team_id=team_ids[2], away_team_id=team_ids[0], matchday=None, is_home=True),
+        ]
+    return Draw(competition="champions_league", season="2024/25", teams=teams, fixtures=fixtures)
+
+
+def as_tuples(fixtures):
+    return [(f.home_team_id, f.away_team_id, f.matchday, f.is_home) for f in fixtures]
+
+
+def test_team_ids_round_trip_across_the_uint32_range():
+    team_ids = [0, 1, 70000, MAX_TEAM_ID]
+
+    data = pack_team_ids(team_ids)
+
+    assert len(data) == 4 * len(team_ids)
+    assert unpack_team_ids(data) == team_ids
+
+
+def test_fixtures_round_trip_through_team_indexes():
+    draw = make_draw([7, 3, MAX_TEAM_ID])
+    index_by_id = {team.id: index for index, team in enumerate(draw.teams)}
+
+    data = pack_fixtures(draw.fixtures, index_by_id)
+
+    assert len(data) == FIXTURE_RECORD_SIZE * len(draw.fixtures)
+    assert as_tuples(unpack_fixtures(data, [team.id for team in draw.teams])) == as_tuples(draw.fixtures)
+
+
+def test_draw_row_round_trips_through_the_mapper():
+    draw = make_draw([11, 22, 33])
+    mapper = DrawMapper()
+
+    row = mapper.to_row(draw, packed=True)
+
+    fixtures = mapper.unpack_fixtures(row["fixture_team_ids"], row["fixtures_packed"])
+    assert as_tuples(fixtures) == as_tuples(draw.fixtures)
+
+
+@pytest.mark.parametrize("team_id", [-1, MAX_TEAM_ID + 1, 2 ** 40])
+def test_team_ids_outside_uint32_are_not_packed(team_id):
+    draw = make_draw([1, 2, team_id])
+
+    assert not can_pack(draw)
+
+
+def test_fixtures_with_results_are_not_packed():
+    fixtures = [Fixture(home_team_id=1, away_team_id=2, matchday=1,
+                        status=FixtureStatus.COMPLETED, home_score=1, away_score=0)]
+
+    assert can_pack(make_draw([1, 2, 3]))
+    assert not can_pack(make_draw([1, 2, 3], fixtures))
@@ -0,0 +1,62 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from infrastructure.database.connection import DatabaseConnection
+
+
+@pytest_asyncio.fixture
+async def primary(tmp_path):
+    connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    async with connection.engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        await conn.execute(text("INSERT INTO marker VALUES ('primary')"))
+    yield connection
+    await connection.close()
+
+
+@pytest_asyncio.fixture
+async def replica(tmp_path):
+    connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with connection.engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        await conn.execute(text("INSERT INTO marker VALUES ('replica')"))
+    yield connection
+    await connection.close()
+
+
+@pytest_asyncio.fixture
+async def unreachable_replica(tmp_path):
+    # SQLite cannot create a database file in a missing directory
+    connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    yield connection
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_read_session_checks_out_nothing_until_the_first_statement(replica, primary):
+    session = replica.open_read_session(primary)
+    assert replica.engine.pool.checkedout() == 0
+
+    assert (await session.execute(text("SELECT name FROM marker"))).scalar_one() == "replica"
+    assert replica.engine.pool.checkedout() == 1
+
+    await session.close()
+    assert replica.engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_fails_over_at_the_first_statement(unreachable_replica, primary):
+    session = unreachable_replica.open_read_session(primary)
+    try:
+        assert (await session.execute(text("SELECT name FROM marker"))).scalar_one() == "primary"
+    finally:
+        await session.close()
+
+    assert unreachable_replica.unavailable_until > 0
+
+    # Later sessions go straight to the primary until the retry delay has passed
+    session = unreachable_replica.open_read_session(primary)
+    try:
+        assert session.get_bind() is primary.engine.sync_engine
+    finally:
+        await session.close()
@@ -0,0 +1,117 @@
+import asyncio
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from infrastructure.cache.redis_cache import RedisCache
+
+
+@pytest.fixture
+def cache():
+    return RedisCache(FakeRedis(), default_ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_get_set_uses_prefixed_keys_and_ttl(cache):
+    await cache.set("teams", "ucl:latest", b"payload")
+
+    assert await cache.get("teams", "ucl:latest") == b"payload"
+    assert await cache.client.get("uefa:teams:ucl:latest") == b"payload"
+    assert 0 < await cache.client.ttl("uefa:teams:ucl:latest") <= 60
+    assert cache.stats("teams").hits == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_matching_keys_only(cache):
+    await cache.set("draw_responses", "1:json", b"a")
+    await cache.set("draw_responses", "1:compact", b"b")
+    await cache.set("draw_responses", "12:json", b"c")
+    await cache.set("validation", "1:result", b"d")
+
+    await cache.invalidate("draw_responses", "1:")
+
+    assert await cache.get("draw_responses", "1:json") is None
+    assert await cache.get("draw_responses", "1:compact") is None
+    assert await cache.get("draw_responses", "12:json") == b"c"
+    assert await cache.get("validation", "1:result") == b"d"
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_coalesces_concurrent_loads(cache):
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return b"value"
+
+    tasks = [asyncio.create_task(cache.get_or_load("teams", "k", loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [b"value"] * 5
+    assert calls == 1
+    assert cache.stats("teams").coalesced == 4
+    assert await cache.get("teams", "k") == b"value"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers(cache):
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(3600)
+        await release.wait()
+        return b"value"
+
+    leader = asyncio.create_task(cache.get_or_load("teams", "k", loader))
+    await asyncio.sleep(0.01)
+    followers = [asyncio.create_task(cache.get_or_load("teams", "k", loader)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*followers) == [b"value"] * 3
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    # One follower took over as leader, the others joined its load
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_loader_errors_reach_followers(cache):
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        raise RuntimeError("database down")
+
+    tasks = [asyncio.create_task(cache.get_or_load("teams", "k", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.get("teams", "k") is None
+
+
+@pytest.mark.asyncio
+async def test_backend_errors_count_as_misses():
+    server = FakeServer()
+    server.connected = False
+    cache = RedisCache(FakeRedis(server=server))
+
+    assert await cache.get("teams", "k") is None
+    await cache.set("teams", "k", b"value")
+    await cache.invalidate("teams")
+
+    stats = cache.stats("teams")
+    assert stats.misses == 1
+    assert stats.errors == 3
@@ -0,0 +1,91 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from presentation.admission import AdmissionController
+
+
+def make_app(controller, release):
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        async with controller.admit():
+            await release.wait()
+        return {"ok": True}
+
+    return app
+
+
+async def wait_until(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_429_and_retry_after():
+    controller = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout=1.0, retry_after=3)
+    release = asyncio.Event()
+    transport = httpx.ASGITransport(app=make_app(controller, release))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/work"))
+        await wait_until(lambda: controller.stats.in_flight == 1)
+
+        rejected = await client.get("/work")
+        release.set()
+        assert (await first).status_code == 200
+
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "3"
+    assert controller.stats.rejected_queue_full == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_is_rejected_with_503_and_retry_after():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=0.05, retry_after=5)
+    release = asyncio.Event()
+    transport = httpx.ASGITransport(app=make_app(controller, release))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/work"))
+        await wait_until(lambda: controller.stats.in_flight == 1)
+
+        rejected = await client.get("/work")
+        release.set()
+        assert (await first).status_code == 200
+
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == "5"
+    assert controller.stats.rejected_timeout == 1
+    assert controller.stats.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_give_their_slots_back():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5.0, retry_after=1)
+    release = asyncio.Event()
+    transport = httpx.ASGITransport(app=make_app(controller, release))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Client disconnects: one request while admitted, one while queued
+        running = asyncio.create_task(client.get("/work"))
+        await wait_until(lambda: controller.stats.in_flight == 1)
+        waiting = asyncio.create_task(client.get("/work"))
+        await wait_until(lambda: controller.stats.queued == 1)
+
+        running.cancel()
+        waiting.cancel()
+        await asyncio.gather(running, waiting, return_exceptions=True)
+
+        assert controller.stats.in_flight == 0
+        assert controller.stats.queued == 0
+
+        release.set()
+        response = await asyncio.wait_for(client.get("/work"), 1.0)
+
+    assert response.status_code == 200
+    assert controller.stats.in_flight == 0
@@ -0,0 +1,142 @@
+from datetime import datetime, timezone
+import httpx
+import msgpack
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from application.dto.response import CompactDrawResponse, DrawResponse
+from application.dto.serializers import DrawSerializer
+from domain.entities import Draw, Fixture, Team
+from presentation.cache import make_etag
+from presentation.middleware.compression import CompressionMiddleware
+from presentation.responses import ModelJSONResponse, MsgPackResponse, accepts_msgpack
+
+COUNTRIES = ("ENG", "ESP", "GER", "ITA", "FRA", "POR", "NED", "BEL", "SCO")
+
+
+def make_draw():
+    teams = [
+        Team(id=index + 10, name=f"Team {index + 1}", country=COUNTRIES[index % 9],
+             pot=index // 9 + 1, coefficient=100.5 - index,
+             logo_url=f"https://example.com/{index}.png" if index % 2 else None)
+        for index in range(36)
+    ]
+    fixtures = [
+        Fixture(home_team_id=teams[index].id, away_team_id=teams[(index + offset) % 36].id,
+                matchday=offset, is_home=True)
+        for offset in range(1, 9)
+        for index in range(0, 36, 2)
+    ]
+    created_at = datetime(2024, 8, 29, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    return Draw(id=7, competition="champions_league", season="2024/25", teams=teams,
+                fixtures=fixtures, created_at=created_at)
+
+
+def model_json(model_class, payload):
+    """The body the response model used to produce for a payload"""
+    return orjson.loads(model_class.model_validate(payload).model_dump_json())
+
+
+def body_json(payload):
+    return orjson.loads(ModelJSONResponse(content=payload).body)
+
+
+def expand_compact(compact):
+    """Rebuild DrawResponse results from the compact format"""
+    teams = compact["teams"]
+    results = [
+        {"team": team, "fixtures": [], "home_games_count": 0, "away_games_count": 0}
+        for team in teams
+    ]
+    for home, away, matchday in compact["fixtures"]:
+        for own, opponent, is_home in ((home, away, True), (away, home, False)):
+            results[own]["home_games_count" if is_home else "away_games_count"] += 1
+            results[own]["fixtures"].append({
+                "opponent_id": teams[opponent]["id"],
+                "opponent_name": teams[opponent]["name"],
+                "opponent_country": teams[opponent]["country"],
+                "is_home": is_home,
+                "matchday": matchday,
+                "scheduled_date": None
+            })
+    expanded = {key: value for key, value in compact.items() if key not in ("teams", "fixtures")}
+    return {**expanded, "results": results}
+
+
+def test_full_body_matches_the_draw_response_model():
+    payload = DrawSerializer().to_dict(make_draw())
+
+    assert body_json(payload) == model_json(DrawResponse, payload)
+
+
+def test_compact_body_carries_the_same_draw_as_the_full_one():
+    draw = make_draw()
+    full = model_json(DrawResponse, DrawSerializer().to_dict(draw))
+    compact = DrawSerializer().to_compact_dict(draw)
+
+    assert body_json(compact) == model_json(CompactDrawResponse, compact)
+    assert expand_compact(body_json(compact)) == full
+
+
+def test_msgpack_body_decodes_to_the_compact_json_body():
+    compact = DrawSerializer().to_compact_dict(make_draw())
+
+    assert msgpack.unpackb(MsgPackResponse(content=compact).body) == body_json(compact)
+
+
+def request_with_accept(accept):
+    return Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/msgpack", True),
+    ("application/msgpack, application/json;q=0.5", True),
+    ("application/msgpack;q=0", False),
+    ("application/json, application/msgpack;q=0.5", False),
+    ("application/json", False),
+    ("*/*", False),
+])
+def test_msgpack_is_chosen_by_q_value(accept, expected):
+    assert accepts_msgpack(request_with_accept(accept)) is expected
+
+
+@pytest.fixture
+def client():
+    body = ModelJSONResponse(content=DrawSerializer().to_dict(make_draw())).body
+    etag = make_etag(body)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/draw")
+    async def draw(request: Request):
+        if request.headers.get("if-none-match"):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test"), body, etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+async def test_compressed_body_decodes_to_the_identity_body_with_a_weak_etag(client, encoding):
+    http, body, etag = client
+    async with http:
+        identity = await http.get("/draw", headers={"Accept-Encoding": "identity"})
+        encoded = await http.get("/draw", headers={"Accept-Encoding": encoding})
+        revalidated = await http.get(
+            "/draw", headers={"Accept-Encoding": encoding, "If-None-Match": encoded.headers["ETag"]}
+        )
+
+    assert identity.headers["ETag"] == etag
+    assert identity.content == body
+
+    # httpx decodes gzip and br bodies
+    assert encoded.headers["Content-Encoding"] == encoding
+    assert int(encoded.headers["Content-Length"]) < len(body)
+    assert encoded.content == body
+    assert encoded.headers["ETag"] == f"W/{etag}"
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == f"W/{etag}"
@@ -0,0 +1,90 @@
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from application.use_cases import ListDrawsUseCase
+from core.dependencies import get_list_draws_use_case
+from domain.entities import Draw, Team
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.repositories.draw_repository import DrawRepositoryImpl
+from presentation.api.v1.endpoints import draws
+
+COUNTRIES = ("ENG", "ESP", "GER", "ITA", "FRA", "POR", "NED", "BEL", "SCO")
+
+
+def make_draw(season="2024/25"):
+    teams = [
+        Team(id=index + 1, name=f"Team {index + 1}", country=COUNTRIES[index % 9],
+             pot=index // 9 + 1, coefficient=100.0 - index)
+        for index in range(36)
+    ]
+    return Draw(competition="champions_league", season=season, teams=teams, fixtures=[])
+
+
+@pytest_asyncio.fixture
+async def client(tmp_path):
+    db = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'draws.db'}")
+    await db.create_tables()
+
+    # One bulk insert: every draw gets the same created_at
+    async with db.async_session() as session:
+        await DrawRepositoryImpl(session).save_many([make_draw() for _ in range(5)])
+        await session.commit()
+
+    async def list_draws_use_case():
+        async with db.async_session() as session:
+            yield ListDrawsUseCase(DrawRepositoryImpl(session))
+
+    app = FastAPI()
+    app.include_router(draws.router, prefix="/api/v1")
+    app.dependency_overrides[get_list_draws_use_case] = list_draws_use_case
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    await db.close()
+
+
+async def fetch_all(client, limit):
+    ids, cursors, after = [], [], None
+    while True:
+        params = {"limit": limit, **({"after": after} if after else {})}
+        response = await client.get("/api/v1/draws", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        ids += [item["id"] for item in page["items"]]
+        cursors.append(page["next_cursor"])
+        after = page["next_cursor"]
+        if after is None:
+            return ids, cursors
+
+
+@pytest.mark.asyncio
+async def test_pages_keep_their_order_when_draws_share_created_at(client):
+    ids, cursors = await fetch_all(client, limit=2)
+
+    assert ids == [5, 4, 3, 2, 1]
+    assert cursors == [cursors[0], cursors[1], None]
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor(client):
+    response = await client.get("/api/v1/draws", params={"limit": 5})
+
+    assert len(response.json()["items"]) == 5
+    assert response.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "%%%", "bm8tc2VwYXJhdG9y", "eHw1"])
+async def test_malformed_cursor_is_a_bad_request(client, cursor):
+    response = await client.get("/api/v1/draws", params={"after": cursor})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_path_without_trailing_slash_is_not_redirected(client):
+    response = await client.get("/api/v1/draws")
+
+    assert response.status_code == 200
+    assert response.json()["items"]